@@ -0,0 +1,120 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'main',
+    'records_streamer',
+]
+
+import argparse
+import json
+import sys
+
+if __package__:
+    from . import core as cb
+    from . import serve as sv
+else:
+    import core as cb
+    import serve as sv
+
+VERBOSE_DTESTS = False
+
+##******************************************
+##    ┬─┐┌─┐┌─┐┌─┐┬─┐┌┬┐┌─┐    ┌─┐┌┬┐┬─┐┌─┐┌─┐┌┬┐┌─┐┬─┐
+##    ├┬┘├┤ │  │ │├┬┘ ││└─┐    └─┐ │ ├┬┘├┤ ├─┤│││├┤ ├┬┘
+##    ┴└─└─┘└─┘└─┘┴└──┴┘└─┘────└─┘ ┴ ┴└─└─┘┴ ┴┴ ┴└─┘┴└─
+def records_streamer(lines, outputs=None, service=None):
+    """ Generator of the result records (as dicts) that correspond to the
+    newline-delimited JSON `lines` of parameters. A line consists either of
+    the parameters of `CBACalculator`, or of an object with keys `params`,
+    `outputs` (overriding `outputs`) and `id` (echoed in the record).
+    Failing lines yield an error record, and do not stop the stream.
+
+    Testing/Example
+    ---------------
+    >>> params = dict(sv.TESTING_PARAMS, project_horizon=3)
+    >>> lines = [
+    ...     json.dumps(params),
+    ...     '',
+    ...     json.dumps({'id': 'b', 'params': params, 'outputs': ['horizon']}),
+    ...     '{"params": ',
+    ... ]
+    >>> for r in records_streamer(lines, ['unif_payback_period']):
+    ...     print(sorted(r.items()))
+    [('outputs', {'unif_payback_period': []}), ('run_name', '[ETH(O)][IMPROVEDGRASSLAND~WHEAT(IFP)][T4Y2020D1][Tvgd1Tvgu20Tso20][Tgwp100STATIC][CO2p(O)DR(0.0)]VS[OIL][EUR]')]
+    [('id', 'b'), ('outputs', {'horizon': [2020, 2021, 2022, 2023]}), ('run_name', '[ETH(O)][IMPROVEDGRASSLAND~WHEAT(IFP)][T4Y2020D1][Tvgd1Tvgu20Tso20][Tgwp100STATIC][CO2p(O)DR(0.0)]VS[OIL][EUR]')]
+    [('error', 'Expecting value: line 1 column 12 (char 11)'), ('line', 4)]
+    """
+    service = service or sv.CBAService(batch_window=0)
+    for i, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        record = {}
+        try:
+            request = json.loads(line)
+            if 'params' in request:
+                if 'id' in request:
+                    record['id'] = request['id']
+                params = request['params']
+                _outputs = request.get('outputs', outputs)
+            else:
+                params, _outputs = request, outputs
+            record.update(service.evaluate(params, _outputs))
+        except Exception as e:
+            record.update({'error': str(e), 'line': i})
+        yield record
+
+##******************************************
+##    ┌┬┐┌─┐┬┌┐┌
+##    │││├─┤││││
+##    ┴ ┴┴ ┴┴┘└┘
+def main(argv=None):
+    """ Entry point of the `pyluccba` console script. Parameters are read as
+    NDJSON on stdin and results written as NDJSON on stdout, within a single
+    process whose sub-computers remain warm from one line to the next. Any
+    message printed during computations is redirected to stderr."""
+    parser = argparse.ArgumentParser(
+        prog='pyluccba',
+        description=(
+            'Reads CBACalculator parameters as newline-delimited JSON on '
+            'stdin and writes result records as newline-delimited JSON on '
+            'stdout.'
+        )
+    )
+    parser.add_argument('-o', '--outputs', default=','.join(sv.DEFAULT_OUTPUTS),
+        help='comma-separated scalars and trajectories to return '
+             '(default: %(default)s)')
+    parser.add_argument('--list-outputs', action='store_true',
+        help='print the names of the evaluable outputs and exit')
+    parser.add_argument('--max-warm', default=256, type=int,
+        help='maximum number of sub-computers kept warm')
+    parser.add_argument('--verbose', action='store_true',
+        help='print solver messages (on stderr)')
+    args = parser.parse_args(argv)
+
+    if args.list_outputs:
+        print('\n'.join(sv.evaluable_outputs))
+        return 0
+
+    cb.VERBOSE_SOLVER = args.verbose
+    outputs = [o.strip() for o in args.outputs.split(',') if o.strip()]
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    failures = 0
+    try:
+        for record in records_streamer(
+            sys.stdin, outputs, sv.CBAService(max_warm=args.max_warm, batch_window=0)
+        ):
+            failures += 'error' in record
+            stdout.write(json.dumps(record) + '\n')
+            stdout.flush()
+    finally:
+        sys.stdout = stdout
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
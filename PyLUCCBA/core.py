@@ -27,14 +27,18 @@ __authors__ = [
 __all__ = [
     '__authors__',
     '__pyLUCCBA__',
+    'AsyncCBABatch',
     'BlackOutputAndSubstitutesSpecificities',
     'CBACalculator',
     'CBAParametersEndogenizer',
+    'CBAStudyPlanner',
     'CarbonAndCo2FlowsAnnualizer',
     'Co2Prices',
     'folder_copier',
+    'FrozenCBACalculator',
     'GlobalWarmingPotential',
     'InputFlows',
+    'iter_runs',
     'LandSurfaceFlows',
     'OutputFlows',
     'VGCAndSOCDeltas',
@@ -43,8 +47,19 @@ __all__ = [
 
 import os
 import sys
+import re
+import ast
 import copy
+import inspect
+import textwrap
+import threading
+import multiprocessing as mp
 import pprint as pp
+try:
+    import asyncio
+    import concurrent.futures as cf
+except ImportError: ## python 2
+    asyncio = cf = None
 import warnings;warnings.filterwarnings('ignore')
 import numpy as np;np.seterr(divide='ignore', invalid='ignore')
 
@@ -382,10 +397,31 @@ class GlobalWarmingPotential(ts.Cache):
         Environmental Science & Technology, 2010, 44 (8), pp 3169–3174.
     """
     
+    #: Parameters of the impulse response function of CO2 (see [1]).
+    co2_decay = {
+        'a'      :{0:0.217, 1:0.259, 2:0.338, 3:0.186},
+        'tau'    :{1:172.9, 2:18.51, 3:1.186},
+        'GWP100' :1.,
+        'AGWP100':8.69e-14,
+    }
+    #: Lifetimes (years) and 100-year GWPs of the other GHGs, whose decay
+    #: is single-exponential (see [1], Table 2.14). Gases added here can be
+    #: used via the `other_ghgs` keyword argument.
+    ghgs_decays = {
+        'N2O'     : {'tau':114. , 'GWP100':298.  },
+        'CH4'     : {'tau':12.  , 'GWP100':25.   },
+        'SF6'     : {'tau':3200., 'GWP100':22800.},
+        'HFC-23'  : {'tau':270. , 'GWP100':14800.},
+        'HFC-32'  : {'tau':4.9  , 'GWP100':675.  },
+        'HFC-125' : {'tau':29.  , 'GWP100':3500. },
+        'HFC-134a': {'tau':14.  , 'GWP100':1430. },
+    }
+
     def __init__(self,
             first_year=2020, project_horizon=20, GWP_horizon=None, static=True,
             **kwargs
         ):
+        other_ghgs = kwargs.pop('other_ghgs', ['N2O', 'CH4'])
         super(GlobalWarmingPotential, self).__init__(
             verbose=kwargs.pop('verbose', VERBOSE), **kwargs
         )
@@ -394,13 +430,118 @@ class GlobalWarmingPotential(ts.Cache):
         self.last_year       = first_year + self.project_horizon
         self.GWP_horizon     = float(GWP_horizon) if GWP_horizon\
                                else float(self.project_horizon)
-        self.other_ghgs      = ['N2O', 'CH4']
+        self.other_ghgs      = list(other_ghgs)
         self.static          = static
         # --------------------#
         self.ghgs_emissions_per_tonne_of_eth = VegetationsAndSoilSpecificities(
             **kwargs
         ).ghgs_emissions_per_tonne_of_eth
 
+    @classmethod
+    def _GWP_trajs_computer(cls, first_year, project_horizon, GWP_horizon, static, other_ghgs):
+        """ AGWP and GWP trajectories of CO2 and `other_ghgs`, as (read-only)
+        arrays of dimensions gas x year, computed over all years and gases at
+        once. Since they only depend on the arguments (and on the decays of
+        the gases), they are memoized in the (bounded) class-level LRU cache
+        (see `tools.Cache._shared_getter`).
+
+        Testing/Example
+        ---------------
+        >>> t = GlobalWarmingPotential._GWP_trajs_computer(
+        ...     2017, 20, 20., False, ('N2O', 'CH4', 'SF6')
+        ... )
+        >>> t['ghgs'], t['years'][:3], t['GWP'].shape
+        (('CO2', 'N2O', 'CH4', 'SF6'), (2017, 2018, 2019), (4, 20))
+        >>> t['GWP'][:, 0]
+        array([1.00000000e+00, 2.92336373e+02, 7.22209832e+01, 1.64402372e+04])
+        >>> t is GlobalWarmingPotential._GWP_trajs_computer(
+        ...     2017, 20, 20., False, ('N2O', 'CH4', 'SF6')
+        ... )
+        True
+        """
+        decays = tuple(
+            (ghg, cls.ghgs_decays[ghg]['tau'], cls.ghgs_decays[ghg]['GWP100'])
+            for ghg in other_ghgs
+        )
+        key   = ('GWP trajs', first_year, project_horizon, GWP_horizon, static, decays)
+        trajs = cls._shared_getter(key)
+        if trajs is not None:
+            return trajs
+
+        _ck = cls.co2_decay
+        _gh = GWP_horizon
+        _t_ = np.arange(0, project_horizon)[:(1 if static else None)]
+
+        # < INTEGRALS & ais >
+        integral100 = _ck['a'][0]*(1e2-1) + sum([
+            _ck['a'][i]*_ck['tau'][i]*(
+                1 - np.exp(-1e2/_ck['tau'][i])
+            ) for i in range(1, 3+1)
+        ])
+        specificities = {'CO2': {
+            'AGWP100'    : _ck['AGWP100'],
+            'integral100': integral100,
+            'ai100'      : _ck['AGWP100']/integral100,
+        }}
+        for ghg, tau, GWP100 in decays:
+            AGWP100     = _ck['AGWP100']*GWP100
+            integral100 = tau*(1 - np.exp(-1e2/tau))
+            specificities[ghg] = {
+                'AGWP100'    : AGWP100,
+                'integral100': integral100,
+                'ai100'      : AGWP100/integral100,
+            }
+
+        # < AGWPi(t) (W/m2/kg) >
+        co2_sum = 0
+        for i in range(1, 3+1):
+            co2_sum = co2_sum + _ck['a'][i]*_ck['tau'][i]*(
+                1 - np.exp((_t_ - _gh)/_ck['tau'][i])
+            )
+        taus = np.array([tau for _, tau, _ in decays])[:, None]
+        ais  = np.array([specificities[ghg]['ai100'] for ghg, _, _ in decays])[:, None]
+        AGWP = np.vstack((
+            specificities['CO2']['ai100']*(_ck['a'][0]*(_gh - _t_ - 1) + co2_sum),
+            ais*taus*(1 - np.exp(((_t_ - _gh)/taus)))
+        ))
+        # < GWPi(t) (kgCO2eq/kgi) >
+        GWP  = AGWP/AGWP[0, 0]
+        for array in (AGWP, GWP):
+            array.setflags(write=False)
+
+        return cls._shared_setter(key, {
+            'ghgs'         : ('CO2', ) + tuple(other_ghgs),
+            'years'        : tuple(first_year + t for t in _t_.tolist()),
+            'AGWP'         : AGWP,
+            'GWP'          : GWP,
+            'specificities': specificities,
+        })
+
+    @ts.Cache._property
+    def GWP_trajs(self):
+        """ AGWP and GWP trajectories of the GHGs, as arrays of dimensions
+        gas x year (see `_GWP_trajs_computer`).
+
+        Example
+        -------
+        >>> o = GlobalWarmingPotential(
+        ...     GWP_horizon=20,
+        ...     first_year=2017,
+        ...     verbose=False
+        ... )
+        >>> o.GWP_trajs['ghgs'], o.GWP_trajs['GWP']
+        (('CO2', 'N2O', 'CH4'), array([[  1.        ],
+               [292.33637282],
+               [ 72.2209832 ]]))
+        """
+        return self._GWP_trajs_computer(
+            self.first_year,
+            self.project_horizon,
+            self.GWP_horizon,
+            self.static,
+            tuple(self.other_ghgs)
+        )
+
     @ts.Cache._property
     def ghgs_specificities(self):
         """ Greenhouse gases (computed) specificities.
@@ -432,87 +573,71 @@ class GlobalWarmingPotential(ts.Cache):
         1.0
         >>> o2.ghgs_specificities['CO2']['trajectories']['GWP'][2018]
         0.9576408083306349
-        """
-            
-        _ck = {
-            'CO2': {
-                'a'           :{0:0.217, 1:0.259, 2:0.338, 3:0.186},
-                'tau'         :{1:172.9, 2:18.51, 3:1.186},
-                'GWP100'      :1.,
-                'AGWP100'     :8.69e-14,
-                'trajectories':{'AGWP':{},'GWP':{}},
-            },
-            'N2O': {
-                'tau'         :{'i':114.},
-                'GWP100'      :298.,
-                'trajectories':{'AGWP':{},'GWP':{}},
-            },
-            'CH4': {
-                'tau'         :{'i':12.},
-                'GWP100'      :25.,
-                'trajectories':{'AGWP':{},'GWP':{}},
-            },
-        }
-
-        _ph = self.project_horizon
-        _st = self.static
-        _gh = self.GWP_horizon
-
-        # < AGWPs >
-        for ghg in self.other_ghgs:
-            _ck[ghg]['AGWP100'] = _ck['CO2']['AGWP100']*_ck[ghg]['GWP100']
 
-        _ck['CO2']['integral100'] = _ck['CO2']['a'][0]*(1e2-1) + sum([
-            _ck['CO2']['a'][i]*_ck['CO2']['tau'][i]*(
-                1 - np.exp(-1e2/_ck['CO2']['tau'][i])
-            ) for i in range(1, 3+1)
-        ])
-        # < INTEGRALS >
+        Other gases can be considered, e.g.
+        >>> o3 = GlobalWarmingPotential(
+        ...     GWP_horizon=20,
+        ...     first_year=2017,
+        ...     other_ghgs=['N2O', 'CH4', 'SF6', 'HFC-134a'],
+        ...     verbose=False
+        ... )
+        >>> o3.ghgs_specificities['HFC-134a']['trajectories']['GWP'][2017]
+        3874.5739733118853
+        """
+        trajs = self.GWP_trajs
+        _ck   = {'CO2': dict(
+            self.co2_decay, **trajs['specificities']['CO2']
+        )}
         for ghg in self.other_ghgs:
-            _ck[ghg]['integral100'] = _ck[ghg]['tau']['i']*(
-                1 - np.exp(-1e2/_ck[ghg]['tau']['i'])
+            _ck[ghg] = dict(
+                {'tau':{'i':self.ghgs_decays[ghg]['tau']},
+                 'GWP100':self.ghgs_decays[ghg]['GWP100']},
+                **trajs['specificities'][ghg]
             )
-        # < ais >
-        for ghg in _ck.keys():
-            _ck[ghg]['ai100'] = _ck[ghg]['AGWP100']/_ck[ghg]['integral100']
+        for i, ghg in enumerate(trajs['ghgs']):
+            _ck[ghg]['trajectories'] = {
+                'AGWP': dict(zip(trajs['years'], trajs['AGWP'][i].tolist())),
+                'GWP' : dict(zip(trajs['years'], trajs['GWP'][i].tolist())),
+            }
 
-        # < AGWPi(t) (W/m2/kg) >
-        for _t_ in range(0, _ph)[:(1 if _st else None)]:
-            year = self.first_year + _t_
-            _ck['CO2']['trajectories']['AGWP'][year] = _ck['CO2']['ai100']*(
-                _ck['CO2']['a'][0]*(_gh - _t_ - 1) + sum([
-                    _ck['CO2']['a'][i]*_ck['CO2']['tau'][i]*(
-                        1 - np.exp((_t_ - _gh)/_ck['CO2']['tau'][i])
-                    ) for i in range(1, 3+1)
-                ])
-            )
-            for ghg in self.other_ghgs:
-                _ck[ghg]['trajectories']['AGWP'][year]\
-                  = _ck[ghg]['ai100']*_ck[ghg]['tau']['i']*(
-                    1 - np.exp(((_t_ - _gh)/_ck[ghg]['tau']['i']))
-                )
-            for ghg in _ck.keys():
-                _ck[ghg]['trajectories']['GWP'][year]\
-                  = _ck[ghg]['trajectories']['AGWP'][year]\
-                  /_ck['CO2']['trajectories']['AGWP'][self.first_year]
-                
         if self.verbose and not self._cache.get('endogenizing', False):
             print(50*"~", 'ghgs_specificities')
-            for ghg in _ck.keys():
-                _r_ = _ck[ghg]['trajectories']
+            for i, ghg in enumerate(trajs['ghgs']):
                 print(
                     'AGWP%s_%s_traj'%(
-                        int(_gh), ghg
-                    ), ts.dict_time_serie_as_row_array(_r_['AGWP'])
+                        int(self.GWP_horizon), ghg
+                    ), trajs['AGWP'][i][None, :]
                 )
                 print(
                     'GWP%s_%s_traj'%(
-                        int(_gh), ghg
-                    ), ts.dict_time_serie_as_row_array(_r_['GWP'])
+                        int(self.GWP_horizon), ghg
+                    ), trajs['GWP'][i][None, :]
                 )
                 
         return _ck
 
+    def _ghgs_checker(self, ghgs_quantities):
+        """ Refuses the gases of `ghgs_quantities` (dict of yields or of
+        emissions per gas) that are not accounted for (i.e. neither CO2 nor
+        one of `other_ghgs`), unless their quantities are all null.
+
+        Testing/Example
+        ---------------
+        >>> o = GlobalWarmingPotential(first_year=2020, verbose=False)
+        >>> o._ghgs_checker({'CO2': [1., 2.], 'SF6': [0., 0.], 'HFC-23': .0})
+        >>> o._ghgs_checker({'CO2': 1., 'SF6': [0., 1.]})
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown GHG(s): SF6
+        """
+        ghgs     = self.GWP_trajs['ghgs']
+        unknowns = sorted(
+            ghg for ghg, q in ghgs_quantities.items()
+            if ghg not in ghgs and np.any(q)
+        )
+        if unknowns:
+            raise ValueError('Unknown GHG(s): %s'%', '.join(unknowns))
+
     def co2eq_yields_GWP_traj_computer(self, ghgs_yields):
         """
         Method which computes the total quantity of CO2eq associated with each
@@ -521,6 +646,9 @@ class GlobalWarmingPotential(ts.Cache):
           NB : if `self.static` is `True`, conversions coefficients from tonne of
           GHG to co2eq tonnes are not time-variables, but simply based on the
           first year conversion factors.
+          NB : gases that are missing from `ghgs_yields` are considered to be
+          not emitted, and gases with non-zero yields that are not accounted
+          for are refused (see `_ghgs_checker`).
 
         Example
         -------
@@ -553,19 +681,218 @@ class GlobalWarmingPotential(ts.Cache):
         41.94663086333451
         >>> o.co2eq_yields_GWP_traj_computer({'CO2':.0, 'N2O':1., 'CH4':1.})[2019]
         350.62386401247113
+        >>> o.co2eq_yields_GWP_traj_computer({'CO2':1., 'SF6':1., 'HFC-23':.0})
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown GHG(s): SF6
+        """
+        self._ghgs_checker(ghgs_yields)
+        trajs = self.GWP_trajs
+        # < GWPi(t) (kgCO2eq/kgi) & CO2eq(t) >
+        _c_   = 0
+        for i, ghg in enumerate(trajs['ghgs']):
+            _c_ = _c_ + trajs['GWP'][i]*ghgs_yields.get(ghg, 0.)
+        return dict(zip(
+            range(self.first_year, self.last_year),
+            np.broadcast_to(_c_, (self.project_horizon, )).tolist()
+        ))
+
+    #: Parameters of the temperature response to a radiative forcing (IPCC
+    #: AR5, WG1, Chapter 8, Supplementary Material, Table 8.SM.9), i.e. the
+    #: sensitivities `c` (K/(W/m2)) and the response times `d` (years).
+    climate_response = {'c':(0.631, 0.429), 'd':(8.4, 409.5)}
+
+    @classmethod
+    def _metric_trajs_computer(cls, metric, first_year, project_horizon, static, other_ghgs):
+        """ Trajectories of the weights (tonnes of CO2eq per tonne) of CO2 and
+        `other_ghgs` under `metric`, i.e. 'GWP<H>' or 'GTP<H>' (e.g. 'GWP20',
+        'GTP100'), as an array of dimensions gas x year. As for the GWPs,
+        emissions of year t are assessed over H-t years if not `static`.
+        GTPs are memoized in the class-level LRU cache, GWPs being that of
+        `_GWP_trajs_computer`.
+
+        Testing/Example
+        ---------------
+        >>> c = GlobalWarmingPotential._metric_trajs_computer
+        >>> c('GWP100', 2020, 20, True, ('N2O', 'CH4'))[:, 0]
+        array([  1., 298.,  25.])
+        >>> np.round(c('GTP100', 2020, 20, True, ('N2O', 'CH4'))[:, 0], 2)
+        array([  1.  , 262.98,   3.78])
+        >>> np.round(c('GTP20', 2020, 20, True, ('N2O', 'CH4'))[:, 0], 2)
+        array([  1.  , 300.8 ,  56.48])
+        >>> c('GTP', 2020, 20, True, ('N2O', 'CH4'))
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown metric: GTP
+        """
+        parsed = re.match(r'^(GWP|GTP)(\d+(?:\.\d*)?)$', metric)
+        if not parsed:
+            raise ValueError('Unknown metric: %s'%metric)
+        kind, _H_ = parsed.group(1), float(parsed.group(2))
+        if kind == 'GWP':
+            return cls._GWP_trajs_computer(
+                first_year, project_horizon, _H_, static, other_ghgs
+            )['GWP']
+
+        decays = tuple(
+            (ghg, cls.ghgs_decays[ghg]['tau']) for ghg in other_ghgs
+        )
+        key = (kind, _H_, first_year, project_horizon, static, decays)
+        GTP = cls._shared_getter(key)
+        if GTP is not None:
+            return GTP
+
+        _ck = cls.co2_decay
+        _cr = cls.climate_response
+        _sp = cls._GWP_trajs_computer(0, 1, 1e2, True, tuple(other_ghgs))['specificities']
+        _h_ = _H_ - np.arange(0, project_horizon)[:(1 if static else None)]
+        # < AGTPi(H-t) (K/kg) >
+        co2  = 0
+        taus = np.array([tau for _, tau in decays])[:, None]
+        ais  = np.array([_sp[ghg]['ai100'] for ghg, _ in decays])[:, None]
+        oth  = 0
+        for c, d in zip(_cr['c'], _cr['d']):
+            co2 = co2 + c*_ck['a'][0]*(1 - np.exp(-_h_/d))
+            for i in range(1, 3+1):
+                co2 = co2 + c*_ck['a'][i]*_ck['tau'][i]/(_ck['tau'][i] - d)*(
+                    np.exp(-_h_/_ck['tau'][i]) - np.exp(-_h_/d)
+                )
+            oth = oth + c/(taus - d)*(np.exp(-_h_/taus) - np.exp(-_h_/d))
+        AGTP = np.vstack((_sp['CO2']['ai100']*co2, ais*taus*oth))
+        # < GTPi(t) (kgCO2eq/kgi) >
+        GTP  = AGTP/AGTP[0, 0]
+        GTP.setflags(write=False)
+        return cls._shared_setter(key, GTP)
+
+    def metric_weights(self, metric):
+        """ Weights (tonnes of CO2eq per tonne) of the GHGs under `metric` (see
+        `_metric_trajs_computer`), as an array of dimensions gas x year, over
+        the project horizon.
+
+        Example
+        -------
+        >>> o = GlobalWarmingPotential(
+        ...     project_horizon=3, GWP_horizon=100, verbose=False
+        ... )
+        >>> o.metric_weights('GWP20')
+        array([[  1.        ,   1.        ,   1.        ],
+               [292.33637282, 292.33637282, 292.33637282],
+               [ 72.2209832 ,  72.2209832 ,  72.2209832 ]])
+        """
+        return np.broadcast_to(
+            self._metric_trajs_computer(
+                metric,
+                self.first_year,
+                self.project_horizon,
+                self.static,
+                tuple(self.other_ghgs)
+            ),
+            (len(self.other_ghgs) + 1, self.project_horizon)
+        )
+
+    @classmethod
+    def _RF_kernels_computer(cls, length, other_ghgs):
+        """ Radiative forcings (W/m2 x year) caused, year after year over
+        `length` years, by the emission of one tonne of CO2 and of each of
+        `other_ghgs` at the beginning of the first year, as an array of
+        dimensions gas x year (see [2]). Memoized in the class-level LRU cache.
+
+        Testing/Example
+        ---------------
+        >>> k = GlobalWarmingPotential._RF_kernels_computer(100, ('N2O', 'CH4'))
+        >>> k.shape
+        (3, 100)
+
+        Cumulated over 100 years, they give back the GWP100s (up to the -1
+        year of the CO2 integral of [1], see `_GWP_trajs_computer`)
+        >>> np.round(k.sum(axis=1)/k[0].sum(), 1)
+        array([  1. , 296.6,  24.9])
+        """
+        decays = tuple(
+            (ghg, cls.ghgs_decays[ghg]['tau']) for ghg in other_ghgs
+        )
+        key     = ('RF kernels', length, decays)
+        kernels = cls._shared_getter(key)
+        if kernels is not None:
+            return kernels
+
+        _ck = cls.co2_decay
+        _sp = cls._GWP_trajs_computer(0, 1, 1e2, True, tuple(other_ghgs))['specificities']
+        _H_ = np.arange(0, length + 1)
+        # < AGWPi(H) (W/m2/kg) for H in [0, length] >
+        co2_sum = 0
+        for i in range(1, 3+1):
+            co2_sum = co2_sum + _ck['a'][i]*_ck['tau'][i]*(
+                1 - np.exp(-_H_/_ck['tau'][i])
+            )
+        taus = np.array([tau for _, tau in decays])[:, None]
+        ais  = np.array([_sp[ghg]['ai100'] for ghg, _ in decays])[:, None]
+        AGWP = np.vstack((
+            _sp['CO2']['ai100']*(_ck['a'][0]*_H_ + co2_sum),
+            ais*taus*(1 - np.exp(-_H_/taus))
+        ))
+        kernels = 1e3*np.diff(AGWP, axis=1)
+        kernels.setflags(write=False)
+        return cls._shared_setter(key, kernels)
+
+    def dynamic_LCA(self, ghgs_emissions, time_horizon=None, first_year=None):
+        """ Dynamic LCA of the yearly emissions `ghgs_emissions` (dict of
+        (row-)arrays of tonnes per gas, whose first elements are emitted in
+        `first_year`), as per [2]. The radiative forcing of each gas is the
+        convolution of its emissions with its kernel (see
+        `_RF_kernels_computer`), computed via FFT in O(T log T) over all gases
+        at once. `time_horizon` (years) defaults to `GWP_horizon`.
+        Returns a dict of
+            'ghgs'          the gases (missing ones are not emitted, and
+                            unknown ones are refused unless not emitted,
+                            see `_ghgs_checker`)
+            'years'         the years of the assessment
+            'instantaneous' radiative forcings (W/m2 x year), gas x year
+            'cumulative'    cumulated radiative forcings (W/m2 x year²), gas x year
+            'co2eq'         tonnes of CO2 which, emitted in `first_year`, would cause
+                            the same cumulated radiative forcing at `time_horizon`
+
+        Testing/Example
+        ---------------
+        >>> o = GlobalWarmingPotential(
+        ...     GWP_horizon=100, first_year=2020, verbose=False
+        ... )
+        >>> r = o.dynamic_LCA({'CO2': [1., 0., 2.], 'CH4': [0., .1, 0.]})
+        >>> r['ghgs'], r['years'][:2], r['instantaneous'].shape
+        (('CO2', 'N2O', 'CH4'), (2020, 2021), (3, 100))
+        >>> r['co2eq']
+        array([2.96949129, 0.        , 2.48860245])
+
+        The FFT convolution is that of the direct O(T²) one
+        >>> k = GlobalWarmingPotential._RF_kernels_computer(100, ('N2O', 'CH4'))
+        >>> direct = np.convolve([0., .1, 0.], k[2])[:100]
+        >>> bool(np.abs(r['instantaneous'][2] - direct).max() < 1e-9*direct.max())
+        True
         """
-        _c_ = {}
-        _y0 = self.first_year
-        _gs = self.ghgs_specificities
-        _st = self.static
-        for _t_ in range(0, self.project_horizon):
-            # < GWPi(t) (kgCO2eq/kgi) & CO2eq(t) >
-            year      = _y0 + _t_
-            _c_[year] = 0
-            _y_       = _y0 if _st else year
-            for ghg in self.ghgs_specificities.keys():
-                _c_[year] += _gs[ghg]['trajectories']['GWP'][_y_]*ghgs_yields[ghg]
-        return _c_
+        self._ghgs_checker(ghgs_emissions)
+        ghgs = self.GWP_trajs['ghgs']
+        _N_ = int(time_horizon or self.GWP_horizon)
+        _y0 = self.first_year if first_year is None else first_year
+        emissions = [np.ravel(ghgs_emissions.get(ghg, 0.)) for ghg in ghgs]
+        _E_ = np.zeros((len(ghgs), max(e.size for e in emissions)))
+        for i, e in enumerate(emissions):
+            _E_[i, :e.size] = e
+        kernels = self._RF_kernels_computer(_N_, ghgs[1:])
+        # < FFT convolution >
+        nfft = 1 << (_E_.shape[1] + _N_ - 2).bit_length()
+        inst = np.fft.irfft(
+            np.fft.rfft(_E_, nfft, axis=1)*np.fft.rfft(kernels, nfft, axis=1),
+            nfft,
+            axis=1
+        )[:, :_N_]
+        cum  = np.cumsum(inst, axis=1)
+        return {
+            'ghgs'         : ghgs,
+            'years'        : tuple(range(_y0, _y0 + _N_)),
+            'instantaneous': inst,
+            'cumulative'   : cum,
+            'co2eq'        : cum[:, -1]/kernels[0].sum(),
+        }
 
 ##******************************************
 ##    ╦  ╦╔═╗╔═╗╔═╗┌┐┌┌┬┐╔═╗╔═╗╔═╗╔╦╗┌─┐┬ ┌┬┐┌─┐┌─┐
@@ -718,6 +1045,85 @@ class VGCAndSOCDeltas(ts.Cache):
         return self.final_so_carbon_stock_value\
                - self.initial_so_carbon_stock_value
 
+    """**[TRANSITION*MATRICES]***********************************************************************"""
+    @ts.Cache._property
+    def landuses(self):
+        """ Landuses whose carbon stocks are known, i.e. the rows (initial
+        landuses) and columns (final landuses) of the differential matrices.
+
+        Example
+        -------
+        >>> o = VGCAndSOCDeltas(
+        ...     country         = 'france',
+        ...     initial_landuse = 'none',
+        ...     final_landuse   = 'none',
+        ... )
+
+        Note the values set for `initial_landuse` and `final_landuse`. This
+        is set so simply to show that those are actually not involved within
+        the present example.
+
+        >>> o.landuses[:4]
+        ['ANNUAL CROPLAND', 'DEBUG', 'DEGRADED GRASSLAND', 'FORESTLAND30']
+        """
+        return sorted(
+            self.vegetations_and_so_specificities\
+            .vegetation_carbon_stock_specificities['values'].keys()
+        )
+
+    def _stocks_differentials(self, specificities):
+        stocks = np.array([
+            float(specificities['values'][landuse]) for landuse in self.landuses
+        ])
+        return stocks[None, :] - stocks[:, None]
+
+    @ts.Cache._property
+    def absolute_VGC_differentials(self):
+        """ Absolute vegetation carbon stock differentials of all the
+        transitions between `landuses`, as an (initial x final) array.
+
+        Example
+        -------
+        >>> o = VGCAndSOCDeltas(
+        ...     country         = 'france',
+        ...     initial_landuse = 'FORESTLAND30',
+        ...     final_landuse   = 'wheat',
+        ... )
+        >>> m = o.absolute_VGC_differentials
+        >>> m.shape
+        (11, 11)
+        >>> i, f = o.landuses.index('FORESTLAND30'), o.landuses.index('WHEAT')
+        >>> m[i, f] == o.absolute_VGC_differential
+        True
+        """
+        return self._stocks_differentials(
+            self.vegetations_and_so_specificities\
+            .vegetation_carbon_stock_specificities
+        )
+
+    @ts.Cache._property
+    def absolute_SOC_differentials(self):
+        """ Absolute soil carbon stock differentials of all the transitions
+        between `landuses`, as an (initial x final) array.
+
+        Example
+        -------
+        >>> o = VGCAndSOCDeltas(
+        ...     country         = 'france',
+        ...     initial_landuse = 'improved grassland',
+        ...     final_landuse   = 'miscanthus',
+        ... )
+        >>> i, f = o.landuses.index('IMPROVED GRASSLAND'), o.landuses.index('MISCANTHUS')
+        >>> o.absolute_SOC_differentials[[i, f], [f, i]]
+        array([-9.42075556,  9.42075556])
+        >>> o.absolute_SOC_differentials[i, f] == o.absolute_SOC_differential
+        True
+        """
+        return self._stocks_differentials(
+            self.vegetations_and_so_specificities\
+            .soil_carbon_stock_specificities
+        )
+
 ##******************************************
 ##    ╔═╗┌─┐┬─┐┌┐ ┌─┐┌┐┌╔═╗┌┐┌┌┬┐╔═╗┌─┐┌─┐╔═╗┬  ┌─┐┬ ┬┌─┐╔═╗┌┐┌┌┐┌┬ ┬┌─┐┬  ┬┌─┐┌─┐┬─┐
 ##    ║  ├─┤├┬┘├┴┐│ ││││╠═╣│││ ││║  │ │┌─┘╠╣ │  │ ││││└─┐╠═╣│││││││ │├─┤│  │┌─┘├┤ ├┬┘
@@ -818,14 +1224,9 @@ class CarbonAndCo2FlowsAnnualizer(ts.Cache):
         array([[-3.29789641, -3.29789641,  0.        ,  0.        ,  0.        ]])
         """
         _D_ = self.Delay_so_unif if self.so_emitting else 0
-        return ts.redim_row_array(
-            np.hstack((
-                np.zeros((1, _D_)),
-                self.delta_soc*np.ones((1, int(self.T_so_unif))) / self.T_so_unif
-            )),
-            self.T_so_unif,
-            self.project_horizon
-        )[:, :(-_D_ if _D_ else None)]
+        return ts.YearSerie(
+            _D_, self.delta_soc*np.ones((1, int(self.T_so_unif)))/self.T_so_unif
+        ).reindexed(0, self.project_horizon - 1).row
 
     def soc_POEPLAU_et_al_eq7_p2418(self, _a_):
         """ C.Poeplau et al equation which computes the stock evolution of carbon
@@ -963,15 +1364,10 @@ class CarbonAndCo2FlowsAnnualizer(ts.Cache):
         array([[-6.59577175e+00, -2.10605417e-05, -6.72475409e-11]])
         """
         _D_ = self.Delay_so_diff if self.so_emitting else 0
-        return ts.redim_row_array(
-            np.hstack((
-                np.zeros((1, _D_)),
-                self.soc_unit_stock_traj[:, 1:]\
-                - self.soc_unit_stock_traj[:, :-1]
-            )),
-            self.T_so_diff,
-            self.project_horizon
-        )[:, :(-_D_ if _D_ else None)]
+        return ts.YearSerie(
+            _D_,
+            self.soc_unit_stock_traj[:, 1:] - self.soc_unit_stock_traj[:, :-1]
+        ).reindexed(0, self.project_horizon - 1).row
 
     """**[VGC-SPECIFIC]****************************************************************************"""
     @ts.Cache._property
@@ -1001,14 +1397,9 @@ class CarbonAndCo2FlowsAnnualizer(ts.Cache):
         array([[-28., -28., -28.]])
         """
         _D_ = self.Delay_vg_unif if self.vg_emitting else 0
-        return ts.redim_row_array(
-            np.hstack((
-                np.zeros((1, _D_)),
-                self.delta_vgc*np.ones((1, int(self.T_vg_unif)))/self.T_vg_unif
-            )),
-            self.T_vg_unif,
-            self.project_horizon
-        )[:, :(-_D_ if _D_ else None)]
+        return ts.YearSerie(
+            _D_, self.delta_vgc*np.ones((1, int(self.T_vg_unif)))/self.T_vg_unif
+        ).reindexed(0, self.project_horizon - 1).row
 
     def vgc_POEPLAU_et_al_eq7_p2418(self,_a_):
         """ C.Poeplau et al equation which computes the stock evolution of carbon
@@ -1143,15 +1534,10 @@ class CarbonAndCo2FlowsAnnualizer(ts.Cache):
         array([[-8.39999999e+01, -5.41505898e-08]])
         """
         _D_ = self.Delay_vg_diff if self.vg_emitting else 0
-        return ts.redim_row_array(
-            np.hstack((
-                np.zeros((1, _D_)),
-                self.vgc_unit_stock_traj[:, 1:]\
-                - self.vgc_unit_stock_traj[:, :-1]
-            )),
-            self.T_vg_diff,
-            self.project_horizon
-        )[:, :(-_D_ if _D_ else None)]
+        return ts.YearSerie(
+            _D_,
+            self.vgc_unit_stock_traj[:, 1:] - self.vgc_unit_stock_traj[:, :-1]
+        ).reindexed(0, self.project_horizon - 1).row
 
     """**[VGC+SOC]*********************************************************************************"""
     @ts.Cache._property
@@ -1424,6 +1810,10 @@ class OutputFlows(ts.Cache):
         self.last_year = first_year + self.project_horizon
         self.output_flows_scenario = scenario
         self.repeated_pattern_polation = repeated_pattern_polation
+        self._sharer(
+            first_year, project_horizon, output, scenario,
+            repeated_pattern_polation, **kwargs
+        )
 
     @ts.Cache._property
     def output_flows_traj_and_infos(self):
@@ -1456,7 +1846,7 @@ class OutputFlows(ts.Cache):
             pop=False
         )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def eligible_scenarios(self):
         """ Scenario that can be chosen for simulations.
 
@@ -1480,7 +1870,7 @@ class OutputFlows(ts.Cache):
             .keys_and_values[self.first_year].keys()
         )  if s != 'year']
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_output_flows_traj_sparse_traj(self):
         """ Chosen scenario of annual output flows, whose trajectory is still
         sparse.
@@ -1501,7 +1891,7 @@ class OutputFlows(ts.Cache):
             in self.output_flows_traj_and_infos.keys_and_values.items()
         }
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_output_flows_traj_full_traj_as_dict(self):
         """ Chosen scenario of annual output flows, whose trajectory is now
         completed.
@@ -1517,16 +1907,35 @@ class OutputFlows(ts.Cache):
         >>> o.scenarized_output_flows_traj_full_traj_as_dict[2025]
         1.0
         """
-        return {
-            year : price for year, price
-            in ts.poler(
+        return self.scenarized_output_flows_traj_full_traj_as_serie.as_dict()
+
+    @ts.Cache._shared_property
+    def scenarized_output_flows_traj_full_traj_as_serie(self):
+        """ Chosen scenario of annual output flows, whose trajectory is now
+        completed, as a year-indexed serie.
+
+        Example
+        -------
+        >>> o = OutputFlows(
+        ...     country         = 'FraNCE',
+        ...     first_year      = 2020,
+        ...     project_horizon = 3,
+        ...     scenario        = 'O',
+        ... )
+        >>> o.scenarized_output_flows_traj_full_traj_as_serie
+        YearSerie(2020, array([[1., 1., 1.]]))
+        """
+        return ts.YearSerie.from_dict(
+            ts.poler(
                 self.scenarized_output_flows_traj_sparse_traj,
                 self.repeated_pattern_polation,
                 yT = self.last_year + 10
-            ).items() if self.first_year<=year<=self.last_year
-        }
+            ),
+            self.first_year,
+            self.last_year
+        )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_output_flows_traj_full_traj(self):
         """ Chosen scenario of annual output flows, whose trajectory is now
         in array format (needed for matrix-like calculations).
@@ -1543,11 +1952,36 @@ class OutputFlows(ts.Cache):
         array([[1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1., 1.,
                 1., 1., 1., 1.]])
         """
-        return ts.dict_time_serie_as_row_array(
-            self.scenarized_output_flows_traj_full_traj_as_dict
-        )
+        return self.scenarized_output_flows_traj_full_traj_as_serie.row
+
+    @ts.Cache._shared_property
+    def output_flows_full_matrix(self):
+        """ Annual output flows of all the eligible scenarios, whose
+        trajectories are completed in one vectorized pass (see
+        `tools.matrix_poler`), as a (scenario x year) array whose rows are
+        ordered as `eligible_scenarios`.
+
+        Example
+        -------
+        >>> o = OutputFlows(
+        ...     country         = 'FraNCE',
+        ...     first_year      = 2020,
+        ...     project_horizon = 3,
+        ... )
+        >>> o.eligible_scenarios
+        ['DEBUG', 'O']
+        >>> o.output_flows_full_matrix
+        array([[1., 1., 1.],
+               [1., 1., 1.]])
+        """
+        return ts.matrix_poler(
+            self.output_flows_traj_and_infos.keys_and_values,
+            self.eligible_scenarios,
+            self.repeated_pattern_polation,
+            y0 = 1950, yT = self.last_year + 10
+        )[:, self.first_year - 1951:self.last_year - 1950]
     
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_output_infos(self):
         """ Informations (unit, year, etc...) about output scenarii.
 
@@ -1590,8 +2024,12 @@ class InputFlows(ts.Cache):
         self.first_year = first_year
         self.project_horizon = project_horizon-1
         self.last_year = first_year+self.project_horizon
+        self._sharer(
+            final_landuse, first_year, project_horizon, scenario,
+            repeated_pattern_polation, **kwargs
+        )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def eligible_scenarios(self):
         """ Scenario that can be chosen for simulations.
 
@@ -1701,7 +2139,7 @@ class InputFlows(ts.Cache):
             pop=False
         )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_input_flows_traj_sparse_traj(self):
         """ Chosen scenario of annual unitary input flows, whose trajectory
         is still sparse.
@@ -1727,7 +2165,7 @@ class InputFlows(ts.Cache):
             in self.input_flows_traj_and_infos.keys_and_values.items()
         }
     
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_input_flows_traj_full_traj_as_dict(self):
         """ Chosen scenario of annual unitary input flows, whose trajectory is
          now completed.
@@ -1750,15 +2188,37 @@ class InputFlows(ts.Cache):
         [(2020, 0.31847714), (2021, 0.31847714), (2022, 0.31847714), (2023, 0.31847714), (2024, 0.31847714)]
 
         """
-        return {
-            year : price for year, price in ts.poler(
+        return self.scenarized_unit_input_flows_traj_full_traj_as_serie\
+               .as_dict()
+
+    @ts.Cache._shared_property
+    def scenarized_unit_input_flows_traj_full_traj_as_serie(self):
+        """ Chosen scenario of annual unitary input flows, whose trajectory is
+        now completed, as a year-indexed serie.
+
+        Example
+        -------
+        >>> o = InputFlows(
+        ...     country         = 'FraNCE',
+        ...     final_landuse   = 'miscanthus',
+        ...     scenario        = 'DOE',
+        ...     first_year      = 2020,
+        ...     project_horizon = 2,
+        ... )
+        >>> o.scenarized_unit_input_flows_traj_full_traj_as_serie
+        YearSerie(2020, array([[0.31847714, 0.31847714]]))
+        """
+        return ts.YearSerie.from_dict(
+            ts.poler(
                 self.scenarized_unit_input_flows_traj_sparse_traj,
                 self.repeated_pattern_polation,
                 yT = self.last_year + 10
-            ).items() if self.first_year<=year<=self.last_year
-        }
+            ),
+            self.first_year,
+            self.last_year
+        )
     
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_input_flows_traj_full_traj(self):
         """ Chosen scenario of annual unitary input flows, whose trajectory is
         now in array format (needed for matrix-like calculations).
@@ -1775,11 +2235,37 @@ class InputFlows(ts.Cache):
         >>> o.scenarized_unit_input_flows_traj_full_traj
         array([[0.31847714, 0.31847714, 0.31847714, 0.31847714, 0.31847714]])
         """
-        return ts.dict_time_serie_as_row_array(
-            self.scenarized_unit_input_flows_traj_full_traj_as_dict
-        )
+        return self.scenarized_unit_input_flows_traj_full_traj_as_serie.row
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
+    def unit_input_flows_full_matrix(self):
+        """ Annual unitary input flows of all the eligible scenarios, whose
+        trajectories are completed in one vectorized pass (see
+        `tools.matrix_poler`), as a (scenario x year) array whose rows are
+        ordered as `eligible_scenarios`.
+
+        Example
+        -------
+        >>> o = InputFlows(
+        ...     country         = 'FraNCE',
+        ...     final_landuse   = 'wheat',
+        ...     first_year      = 2020,
+        ...     project_horizon = 3,
+        ... )
+        >>> o.eligible_scenarios
+        ['DEBUG', 'IFP']
+        >>> o.unit_input_flows_full_matrix
+        array([[1.    , 1.    , 1.    ],
+               [0.2844, 0.2844, 0.2844]])
+        """
+        return ts.matrix_poler(
+            self.input_flows_traj_and_infos.keys_and_values,
+            self.eligible_scenarios,
+            self.repeated_pattern_polation,
+            y0 = 1950, yT = self.last_year + 10
+        )[:, self.first_year - 1951:self.last_year - 1950]
+
+    @ts.Cache._shared_property
     def scenarized_unit_input_infos(self):
         """ Informations (unit, year, etc...) about unitary input scenarii.
 
@@ -1842,6 +2328,10 @@ class LandSurfaceFlows(ts.Cache):
         self.first_year = first_year
         self.project_horizon = project_horizon-1
         self.last_year = first_year+self.project_horizon
+        self._sharer(
+            final_landuse, first_year, project_horizon, output,
+            repeated_pattern_polation, **kwargs
+        )
 
     @ts.Cache._property
     def land_surface_flows_traj_and_infos(self):
@@ -1875,7 +2365,7 @@ class LandSurfaceFlows(ts.Cache):
             pop=False
         )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def eligible_scenarios(self):
         """ Scenario that can be chosen for simulations.
 
@@ -1905,7 +2395,7 @@ class LandSurfaceFlows(ts.Cache):
             .keys_and_values[self.first_year].keys()
         )  if s != 'year']
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_land_surface_flows_traj_sparse_traj(self):
         """ Chosen scenario of annual unitary land surfaces, whose trajectory
         is still sparse.
@@ -1953,7 +2443,7 @@ class LandSurfaceFlows(ts.Cache):
             in self.land_surface_flows_traj_and_infos.keys_and_values.items()
         }
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_land_surface_flows_traj_full_traj_as_dict(self):
         """ Chosen scenario of annual unitary land surfaces, whose trajectory
         is now completed.
@@ -1976,16 +2466,36 @@ class LandSurfaceFlows(ts.Cache):
         [(2020, 5.254872818), (2021, 5.254872818), (2022, 5.254872818), (2023, 5.254872818), (2024, 5.254872818)]
 
         """
-        return {
-            year : price for year, price
-            in ts.poler(
+        return self.scenarized_unit_land_surface_flows_traj_full_traj_as_serie\
+               .as_dict()
+
+    @ts.Cache._shared_property
+    def scenarized_unit_land_surface_flows_traj_full_traj_as_serie(self):
+        """ Chosen scenario of annual unitary land surfaces, whose trajectory
+        is now completed, as a year-indexed serie.
+
+        Example
+        -------
+        >>> o = LandSurfaceFlows(
+        ...     country         = 'FraNCE',
+        ...     final_landuse   = 'miscanthus',
+        ...     first_year      = 2020,
+        ...     project_horizon = 2,
+        ... )
+        >>> o.scenarized_unit_land_surface_flows_traj_full_traj_as_serie
+        YearSerie(2020, array([[5.25487282, 5.25487282]]))
+        """
+        return ts.YearSerie.from_dict(
+            ts.poler(
                 self.scenarized_unit_land_surface_flows_traj_sparse_traj,
                 self.repeated_pattern_polation,
                 yT = self.last_year + 10
-            ).items() if self.first_year<=year<=self.last_year
-        }
+            ),
+            self.first_year,
+            self.last_year
+        )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_unit_land_surface_flows_traj_full_traj(self):
         """ Chosen scenario of annual unitary land surfaces, whose trajectory
         is now in array format (needed for matrix-like calculations).
@@ -2001,11 +2511,38 @@ class LandSurfaceFlows(ts.Cache):
         >>> o.scenarized_unit_land_surface_flows_traj_full_traj
         array([[5.25487282, 5.25487282, 5.25487282, 5.25487282, 5.25487282]])
         """
-        return ts.dict_time_serie_as_row_array(
-            self.scenarized_unit_land_surface_flows_traj_full_traj_as_dict
-        )
+        return self.scenarized_unit_land_surface_flows_traj_full_traj_as_serie\
+               .row
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
+    def unit_land_surface_flows_full_matrix(self):
+        """ Annual unitary land surfaces of all the eligible scenarios (i.e.
+        final landuses), whose trajectories are completed in one vectorized
+        pass (see `tools.matrix_poler`), as a (scenario x year) array whose
+        rows are ordered as `eligible_scenarios`.
+
+        Example
+        -------
+        >>> o = LandSurfaceFlows(
+        ...     country         = 'FraNCE',
+        ...     final_landuse   = 'wheat',
+        ...     first_year      = 2020,
+        ...     project_horizon = 3,
+        ... )
+        >>> m = o.unit_land_surface_flows_full_matrix
+        >>> m[o.eligible_scenarios.index('WHEAT')]
+        array([2.57608696, 2.57608696, 2.57608696])
+        >>> m.shape
+        (6, 3)
+        """
+        return ts.matrix_poler(
+            self.land_surface_flows_traj_and_infos.keys_and_values,
+            self.eligible_scenarios,
+            self.repeated_pattern_polation,
+            y0 = 1950, yT = self.last_year + 10
+        )[:, self.first_year - 1951:self.last_year - 1950]
+
+    @ts.Cache._shared_property
     def scenarized_unit_land_surface_infos(self):
         """ Informations (unit, year, etc...) about unitary land scenarii.
 
@@ -2062,6 +2599,10 @@ class Co2Prices(ts.Cache):
         self.first_year = first_year
         self.last_year = first_year + project_horizon
         self.resources = ts.DataReader(**kwargs).resources['externality']
+        self._sharer(
+            first_year, project_horizon, scenario, repeated_pattern_polation,
+            final_currency, **kwargs
+        )
 
     @ts.Cache._property
     def co2_prices_and_infos(self):
@@ -2094,7 +2635,7 @@ class Co2Prices(ts.Cache):
             'year', self.resources['co2_prices'], pop=False
         )
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def eligible_scenarios(self):
         """ Scenario that can be chosen for simulations.
 
@@ -2133,7 +2674,7 @@ class Co2Prices(ts.Cache):
             .keys_and_values[self.first_year].keys()
         )  if s != 'year']
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_co2_prices_sparse_traj(self):
         """ Chosen scenario of CO2 prices per tonne, whose trajectory is still.
         sparse.
@@ -2173,7 +2714,7 @@ class Co2Prices(ts.Cache):
             in self.co2_prices_and_infos.keys_and_values.items()
         }
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
     def scenarized_co2_prices_full_traj_as_dict(self):
         """ Chosen scenario of CO2 prices per tonne, whose trajectory is now
         completed.
@@ -2222,17 +2763,40 @@ class Co2Prices(ts.Cache):
         Remember that on open year-intervals, neighbor intrapolated rates
         are reused for retro- and extra-polation.        
         """
-        return {
-            year : price for year, price
-            in ts.poler(
-                self.scenarized_co2_prices_sparse_traj,
-                self.repeated_pattern_polation,
-                yT = self.last_year + 10
-            ).items() if self.first_year<year<=self.last_year
-        }
+        return self.scenarized_co2_prices_full_traj_as_serie.as_dict()
 
-    @ts.Cache._property
-    def scenarized_co2_prices_full_traj(self):
+    @ts.Cache._shared_property
+    def scenarized_co2_prices_full_traj_as_serie(self):
+        """ Chosen scenario of CO2 prices per tonne, whose trajectory is now
+        completed, as a year-indexed serie. Note that it starts the year
+        after `first_year`.
+
+        Example
+        -------
+        >>> o = Co2Prices(
+        ...     country         = 'FraNCE',
+        ...     scenario        = 'WEO2015-450S',
+        ...     first_year      = 2019,
+        ...     project_horizon = 21,
+        ... )
+        >>> s = o.scenarized_co2_prices_full_traj_as_serie
+        >>> s.first_year, s.last_year, s[2030]
+        (2020, 2040, 100.0)
+        >>> s.window(2029, 2031)
+        YearSerie(2029, array([[ 85.94928498, 100.        , 103.42196941]]))
+        """
+        return ts.YearSerie.from_dict(
+            ts.poler(
+                self.scenarized_co2_prices_sparse_traj,
+                self.repeated_pattern_polation,
+                yT = self.last_year + 10
+            ),
+            self.first_year + 1,
+            self.last_year
+        )
+
+    @ts.Cache._shared_property
+    def scenarized_co2_prices_full_traj(self):
         """ Chosen scenario of CO2 prices per tonne, whose trajectory is now in
         array format (needed for matrix-like calculations).
 
@@ -2277,12 +2841,60 @@ class Co2Prices(ts.Cache):
                 37.        , 38.13103136, 39.29663655, 40.49787244, 41.73582822,
                 43.01162634, 44.32642358, 45.68141209, 47.07782046, 48.51691481,
                 50.        ]])
+
+        Trajectories are shared (as copies) between the instances built
+        with the same arguments, which thus do not re-interpolate them
+        >>> o2 = Co2Prices(
+        ...     country         = 'FraNCE',
+        ...     scenario        = 'WEO2015-NPS',
+        ...     first_year      = 2019,
+        ...     project_horizon = 21,
+        ... )
+        >>> t2 = o2.scenarized_co2_prices_full_traj
+        >>> np.array_equal(t2, o.scenarized_co2_prices_full_traj), t2 is o.scenarized_co2_prices_full_traj
+        (True, False)
+        >>> 'scenarized_co2_prices_full_traj_as_serie' in o2._cache
+        False
         """
-        return ts.dict_time_serie_as_row_array(
-            self.scenarized_co2_prices_full_traj_as_dict
-        )
+        return self.scenarized_co2_prices_full_traj_as_serie.row
 
-    @ts.Cache._property
+    @ts.Cache._shared_property
+    def co2_prices_full_matrix(self):
+        """ CO2 prices per tonne of all the eligible scenarios (each in its
+        own currency, see `co2_prices_and_infos`), whose trajectories are
+        completed in one vectorized pass (see `tools.matrix_poler`), as a
+        (scenario x year) array whose rows are ordered as `eligible_scenarios`.
+
+        Example
+        -------
+        >>> o = Co2Prices(
+        ...     country         = 'FraNCE',
+        ...     scenario        = 'WEO2015-450S',
+        ...     first_year      = 2019,
+        ...     project_horizon = 21,
+        ... )
+        >>> m = o.co2_prices_full_matrix
+        >>> m.shape
+        (14, 21)
+        >>> m[o.eligible_scenarios.index('WEO2015-450S'), :4]
+        array([22.        , 25.59648984, 29.78092238, 34.6494126 ])
+
+        Up to rounding errors, rows are the trajectories that are obtained
+        scenario by scenario
+        >>> bool(np.allclose(
+        ...     m[o.eligible_scenarios.index('WEO2015-450S')][None, :],
+        ...     o.scenarized_co2_prices_full_traj
+        ... ))
+        True
+        """
+        return ts.matrix_poler(
+            self.co2_prices_and_infos.keys_and_values,
+            self.eligible_scenarios,
+            self.repeated_pattern_polation,
+            y0 = 1950, yT = self.last_year + 10
+        )[:, self.first_year - 1950:self.last_year - 1950]
+
+    @ts.Cache._shared_property
     def scenarized_co2_infos(self):
         """ Informations (currency, year, etc...) about CO2 prices/tonne scenarii.
 
@@ -2386,7 +2998,7 @@ class CBACalculator(ts.Cache):
             **kws
         )
 
-    def _clear_caches(self):
+    def _clear_caches(self, verbose=True):
         """
         Testing
         -------
@@ -2398,18 +3010,72 @@ class CBACalculator(ts.Cache):
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-1518.4971863 , -1600.9335023 , -1584.75831751, -1472.35798716]])
         >>> o._clear_caches()
-        GlobalWarmingPotential
-        OutputFlows
         CarbonAndCo2FlowsAnnualizer
         LandSurfaceFlows
+        OutputFlows
+        GlobalWarmingPotential
         Co2Prices
         CBACalculator
         """
         for obj in self.__caobjs + [self]:
-            print(type(obj).__name__)
+            if verbose:
+                print(type(obj).__name__)
             obj._clear_cache()
         self.__caobjs = []
 
+    _caobjs_dependencies = {
+        'deltas_computer': (
+            'initial_landuse', 'final_landuse', 'country', 'from_local_data',
+        ),
+        'carbon_and_co2_flows_traj_annualizer': (
+            'initial_landuse', 'final_landuse', 'country', 'project_horizon',
+            'T_so', 'T_vg_diff', 'T_vg_unif', 'dtype', 'from_local_data',
+        ),
+        'co2_prices_computer': (
+            'co2_prices_scenario', 'project_first_year', 'project_timing',
+            'project_horizon', 'polat_repeated_pattern', 'final_currency',
+            'country', 'dtype', 'from_local_data',
+        ),
+        'output_flows_traj_computer': (
+            'output', 'output_flows_scenario', 'project_first_year',
+            'project_horizon', 'polat_repeated_pattern', 'country', 'dtype',
+            'from_local_data',
+        ),
+        'input_flows_traj_computer': (
+            'final_landuse', 'input_flows_scenario', 'project_first_year',
+            'project_horizon', 'polat_repeated_pattern', 'country', 'dtype',
+            'from_local_data',
+        ),
+        'co2eq_computer': (
+            'project_first_year', 'project_horizon', 'GWP_horizon',
+            'GWP_static', 'from_local_data', 'other_ghgs',
+        ),
+        'land_surface_flows_traj_computer': (
+            'output', 'final_landuse', 'project_first_year', 'project_horizon',
+            'polat_repeated_pattern', 'country', 'dtype', 'from_local_data',
+        ),
+    }
+
+    def _caobjs_signature(self, key):
+        """ Hashable signature of the sub-computer stored under `key`, made of
+        the values of the parameters it depends on (see `_caobjs_dependencies`).
+        Two instances with equal signatures can share the sub-computer.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=3)
+        >>> o._caobjs_signature('co2eq_computer')
+        ('co2eq_computer', 2020, 4, 100, True, False, ('N2O', 'CH4'))
+        >>> p = CBACalculator._testing_instancer(ph=3, dr=.05, sc='WEO2015-CPS')
+        >>> o._caobjs_signature('co2eq_computer') == p._caobjs_signature('co2eq_computer')
+        True
+        >>> o._caobjs_signature('co2_prices_computer') == p._caobjs_signature('co2_prices_computer')
+        False
+        """
+        return (key, ) + tuple(
+            getattr(self, attr) for attr in self._caobjs_dependencies[key]
+        )
+
     def __init__(self,
             run_name               = '',
             discount_rate          = .0,
@@ -2487,22 +3153,85 @@ class CBACalculator(ts.Cache):
         ...     return_charts          = True,
         ...     from_local_data        = False,
         ...     GWP_horizon            = 20,      # <-----------
-        ...     GWP_static             = False    # <-----------
+        ...     GWP_static             = True     # <-----------
         ... )
-        `GWP_horizon` and `GWP_static` must be set to 100 years and `True` respectively.
-        The only reason behind this is that these two parameters are implictly assumed
+        `GWP_horizon` must be set to 100 years when `GWP_static` is `True`.
+        The only reason behind this is that this parameter is implictly assumed
         to be such in data exposed by attribute `ghgs_emissions_per_tonne_of_eth` of
         the class named `VegetationsAndSoilSpecificities`.
+
+        In dynamic mode (`GWP_static=False`, see [2] of `GlobalWarmingPotential`),
+        `GWP_horizon` is the time horizon of the assessment, which must exceed
+        the project horizon. GWPs then vary with the year of emission, and the
+        radiative forcings of the project are given by `diff_dynamic_LCA` and
+        `unif_dynamic_LCA`.
+        >>> o = CBACalculator._testing_instancer(
+        ...     ph=4, ts=3, tu=2, GWP_horizon=10, GWP_static=False
+        ... )
+        >>> '[Tgwp10DYNAMIC]' in o.run_name
+        True
+        >>> o.NPV_total_unif_co2_flows_traj
+        array([[ -718.46329799, -1441.19559862, -1833.94092202, -1963.69946514,
+                -2023.33919552]])
+        >>> o = CBACalculator._testing_instancer(
+        ...     ph=20, GWP_horizon=10, GWP_static=False
+        ... )
+        In dynamic mode (`GWP_static=False`), `GWP_horizon` is the time horizon of the assessment,
+        which must exceed the project horizon.
+
+        Large batches of runs may be conducted in single precision, passing
+        `dtype=np.float32`. Annualized flows, prices, flows and values are then
+        stored (and computed) as float32 row-arrays, while cumulative sums
+        (NPVs and cumulated output flows) are accumulated in float64. Since each
+        term being summed is a product of a few float32-rounded factors (of
+        relative error u=2**-24 each), the absolute error on NPVs is bounded by
+        about 10*u times the cumulated sum of the absolute discounted values,
+        i.e. ~6e-7 in relative terms (~1e-7 is observed on the shipped data).
+        >>> o64 = CBACalculator._testing_instancer(ph=60, sc='WEO2015-CPS')
+        >>> o32 = CBACalculator._testing_instancer(
+        ...     ph=60, sc='WEO2015-CPS', dtype=np.float32
+        ... )
+        >>> npv32 = o32.NPV_total_diff_co2_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> npv32.dtype, o32.co2_prices_traj.dtype
+        (dtype('float32'), dtype('float32'))
+        >>> npv64 = o64.NPV_total_diff_co2_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> bound = 10*2**-24*np.cumsum(
+        ...     np.abs(o64.timed_total_diff_co2_flows_traj_disc_values), axis=1
+        ... )
+        >>> bool((np.abs(npv32 - npv64) <= bound).all())
+        True
+        >>> o32.diff_payback_period == o64.diff_payback_period
+        True
         """
+        self._init_params = dict(
+            (k, v) for k, v in locals().items() if k not in ('self', 'kwargs')
+        )
+        self._init_kwargs = dict(kwargs)
+        self.other_ghgs   = tuple(kwargs.pop('other_ghgs', ('N2O', 'CH4')))
         self._GWP_horizon = GWP_horizon
         self._GWP_static  = GWP_static
-        if GWP_horizon != 100 or not GWP_static:
+        if GWP_static and GWP_horizon != 100:
+            print(
+                '`GWP_horizon` must be set to 100 years when `GWP_static` is '
+                '`True`.\nThe only reason behind this is that this parameter '
+                'is implictly assumed\nto be such in data exposed by attribute '
+                '`ghgs_emissions_per_tonne_of_eth` of\nthe class named '
+                '`VegetationsAndSoilSpecificities`.'
+            )
+            return
+        if not GWP_static and not GWP_horizon > project_horizon:
             print(
-                '`GWP_horizon` and `GWP_static` must be set to 100 years '
-                'and `True` respectively.\nThe only reason behind this is '
-                'that these two parameters are implictly assumed\nto be such '
-                'in data exposed by attribute `ghgs_emissions_per_tonne_of_eth` '
-                'of\nthe class named `VegetationsAndSoilSpecificities`.'
+                'In dynamic mode (`GWP_static=False`), `GWP_horizon` is the '
+                'time horizon of the assessment,\nwhich must exceed the project '
+                'horizon.'
             )
             return
         
@@ -2883,6 +3612,7 @@ class CBACalculator(ts.Cache):
             T_vg_diff       = self.T_vg_diff,
             T_vg_unif       = self.T_vg_unif,
             verbose         = self.verbose,
+            dtype           = self.dtype,
             from_local_data = self.from_local_data
         )
         self.__caobjs.append(obj)
@@ -3832,6 +4562,7 @@ class CBACalculator(ts.Cache):
             final_currency            = self.final_currency,
             country                   = self.country,
             verbose                   = self.verbose,
+            dtype                     = self.dtype,
             from_local_data           = self.from_local_data
         )
         self.__caobjs.append(obj)
@@ -3884,6 +4615,49 @@ class CBACalculator(ts.Cache):
             ) if _infos_['toConvert'] else 1.
         )
 
+    @property
+    def co2_prices_scenarios(self):
+        """ CO2 prices scenarios which can be chosen for simulations, i.e.
+        the rows of `co2_prices_matrix`.
+
+        Testing
+        -------
+        >>> CBACalculator._testing_instancer().co2_prices_scenarios[:4]
+        ['A', 'B', 'C', 'DEBUG']
+        """
+        return self.co2_prices_computer.eligible_scenarios
+
+    @ts.Cache._property
+    def co2_prices_matrix(self):
+        """ CO2 prices per tonne of all the eligible CO2 prices scenarios (see
+        `co2_prices_scenarios`), converted into `final_currency`, as a
+        (scenario x year) array. All the scenarios are interpolated at once.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(y0=2020, ph=20, sc='WEO2015-450S')
+        >>> m = o.co2_prices_matrix
+        >>> m.shape
+        (14, 21)
+        >>> i = o.co2_prices_scenarios.index('WEO2015-450S')
+        >>> m[i, :4]
+        array([19.29824561, 22.45306127, 26.12361612, 30.39422158])
+        >>> bool(np.allclose(m[i], o.co2_prices_traj))
+        True
+        """
+        cpc     = self.co2_prices_computer
+        _infos_ = cpc.co2_prices_and_infos.keys_and_infos
+        _rates_ = []
+        for scenario in cpc.eligible_scenarios:
+            _currency_ = _infos_[scenario.lower()]['unit'].split('/')[0]\
+                         .upper().strip()
+            _rates_.append(
+                ts.change_rate_extractor(
+                    self.change_rates, _currency_, self.final_currency
+                ) if _currency_ != self.final_currency else 1.
+            )
+        return cpc.co2_prices_full_matrix*np.array(_rates_)[:, None]
+
     @property
     def chart_of_co2_prices_traj(self):
         """
@@ -3985,6 +4759,7 @@ class CBACalculator(ts.Cache):
             repeated_pattern_polation = self.polat_repeated_pattern,
             country                   = self.country,
             verbose                   = self.verbose,
+            dtype                     = self.dtype,
             from_local_data           = self.from_local_data
         )
         self.__caobjs.append(obj)
@@ -4086,7 +4861,7 @@ class CBACalculator(ts.Cache):
         >>> o.cum_output_flows_traj
         array([[1., 2., 3., 4., 5., 6.]])
         """
-        return np.cumsum(self.output_flows_traj, axis=1)
+        return np.cumsum(self.output_flows_traj, axis=1, dtype=np.float64)
 
     @ts.Cache._property
     def timed_P_cum_output_flows_traj(self):
@@ -4158,6 +4933,7 @@ class CBACalculator(ts.Cache):
             repeated_pattern_polation = self.polat_repeated_pattern,
             country                   = self.country,
             verbose                   = self.verbose,
+            dtype                     = self.dtype,
             from_local_data           = self.from_local_data
         )
         self.__caobjs.append(obj)
@@ -4270,6 +5046,7 @@ class CBACalculator(ts.Cache):
             project_horizon = self.project_horizon,
             GWP_horizon     = self.GWP_horizon,
             static          = self.GWP_static,
+            other_ghgs      = list(self.other_ghgs),
             verbose         = self.verbose,
             from_local_data = self.from_local_data
         )
@@ -4371,13 +5148,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_cult_input_co2eq_flows_traj
         array([[-1.04039, -1.04039, -1.04039,  0.     ]])
         """
-        _D_ = self.project_timing
-        return np.hstack((
-            self.cultivated_input_co2eq_flows_traj[
-                :, :(-_D_ if _D_ else None)
-            ],
-            np.zeros((1, _D_))
-        ))
+        return self._input_flows_timer(
+            self.cultivated_input_co2eq_flows_traj, 'culture'
+        )
 
     @property
     def chart_of_cult_input_co2eq_flows_traj(self):
@@ -4495,11 +5268,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_proc_input_co2eq_flows_traj
         array([[ 0.     , -0.88958, -0.88958, -0.88958]])
         """
-        _D_ = self.project_timing
-        return np.hstack((
-            np.zeros((1, _D_)),
-            self.processed_input_co2eq_flows_traj
-        ))[:, :(-_D_ if _D_ else None)]
+        return self._input_flows_timer(
+            self.processed_input_co2eq_flows_traj, 'process'
+        )
         
     @property
     def chart_of_proc_input_co2eq_flows_traj(self):
@@ -4543,6 +5314,7 @@ class CBACalculator(ts.Cache):
             repeated_pattern_polation = self.polat_repeated_pattern,
             country                   = self.country,
             verbose                   = self.verbose,
+            dtype                     = self.dtype,
             from_local_data           = self.from_local_data
         )
         self.__caobjs.append(obj)
@@ -4646,8 +5418,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_proc_co2_flows_traj_values
         array([[  0.     , -77.39346]])
         """
-        return self.timed_proc_input_co2eq_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._common_co2_values_kernel, 'proc', 'values'
+        )
 
     @property
     def chart_of_proc_co2_flows_traj_values(self):
@@ -4698,7 +5471,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_proc_co2_flows_traj_disc_values
         array([[  0.        , -75.13928155]])
         """
-        return self.timed_proc_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'proc', 'disc_values'
+        )
 
     @property
     def chart_of_proc_co2_flows_traj_disc_values(self):
@@ -4750,8 +5525,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_cult_co2_flows_traj_values
         array([[-90.51393, -90.51393,   0.     ]])
         """
-        return self.timed_cult_input_co2eq_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._common_co2_values_kernel, 'cult', 'values'
+        )
 
     @property
     def chart_of_cult_co2_flows_traj_values(self):
@@ -4802,7 +5578,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_cult_co2_flows_traj_disc_values
         array([[-90.51393   , -87.87760194,   0.        ]])
         """
-        return self.timed_cult_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'cult', 'disc_values'
+        )
 
     @property
     def chart_of_cult_co2_flows_traj_disc_values(self):
@@ -4850,9 +5628,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_cult_co2_flows_traj
         array([[ -90.51393   , -178.39153194, -178.39153194]])
         """
-        return np.cumsum(
-            self.timed_cult_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'cult', 'NPV'
         )
 
     @property
@@ -4904,8 +5681,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_cult_co2_flows_traj_per_cum_output_flows_traj
         array([[-90.51393   , -89.19576597, -89.19576597]])
         """
-        return np.nan_to_num(
-            self.NPV_cult_co2_flows_traj/self.timed_C_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._common_co2_per_output_kernel, 'cult', 'NPV_per_cum_output'
         )
 
     @property
@@ -4955,9 +5732,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_cult_co2_flows_traj_per_cum_MJs_output_flows_traj
         array([[-0.00338891, -0.00333956, -0.00333956]])
         """
-        return self.NPV_cult_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._common_co2_per_MJs_kernel, 'cult', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -5012,10 +5788,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_proc_plus_cult_co2_flows_traj_values
         array([[ -90.51393, -167.90739,  -77.39346]])
         """
-        return (
-            self.timed_proc_input_co2eq_flows_traj\
-            + self.timed_cult_input_co2eq_flows_traj
-        )*self.co2_prices_traj
+        return self._co2_cube_row(
+            self._common_co2_values_kernel, 'proc_plus_cult', 'values'
+        )
 
     @property
     def chart_of_proc_plus_cult_co2_flows_traj_values(self):
@@ -5062,9 +5837,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_co2_flows_traj
         array([[   0.        ,  -75.13928155, -148.09004034]])
         """
-        return np.cumsum(
-            self.timed_proc_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'proc', 'NPV'
         )
 
     @property
@@ -5116,8 +5890,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_co2_flows_traj_per_cum_output_flows_traj
         array([[  0.        , -75.13928155, -74.04502017]])
         """
-        return np.nan_to_num(
-            self.NPV_proc_co2_flows_traj/self.timed_P_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._common_co2_per_output_kernel, 'proc', 'NPV_per_cum_output'
         )
 
     @property
@@ -5167,9 +5941,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_co2_flows_traj_per_cum_MJs_output_flows_traj
         array([[ 0.        , -0.00281327, -0.0027723 ]])
         """
-        return self.NPV_proc_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._common_co2_per_MJs_kernel, 'proc', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -5221,8 +5994,9 @@ class CBACalculator(ts.Cache):
         >>> o.timed_proc_plus_cult_co2_flows_traj_disc_values
         array([[ -90.51393   , -163.0168835 ,  -72.95075879]])
         """
-        return self.timed_proc_plus_cult_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'proc_plus_cult', 'disc_values'
+        )
 
     @property
     def chart_of_proc_plus_cult_co2_flows_traj_disc_values(self):
@@ -5270,9 +6044,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_plus_cult_co2_flows_traj
         array([[ -90.51393   , -253.5308135 , -326.48157228]])
         """
-        return np.cumsum(
-            self.timed_proc_plus_cult_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._common_co2_disc_kernel, 'proc_plus_cult', 'NPV'
         )
 
     @property
@@ -5324,8 +6097,9 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_plus_cult_co2_flows_traj_per_cum_output_flows_traj
         array([[ -90.51393   , -164.33504752, -163.24078614]])
         """
-        return self.NPV_proc_co2_flows_traj_per_cum_output_flows_traj\
-        + self.NPV_cult_co2_flows_traj_per_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._common_co2_per_output_kernel, 'proc_plus_cult', 'NPV_per_cum_output'
+        )
 
     @property
     def chart_of_NPV_proc_plus_cult_co2_flows_traj_per_cum_output_flows_traj(self):
@@ -5375,9 +6149,8 @@ class CBACalculator(ts.Cache):
         >>> o.NPV_proc_plus_cult_co2_flows_traj_per_cum_MJs_output_flows_traj
         array([[-0.00338891, -0.00615283, -0.00611186]])
         """
-        return self.NPV_proc_plus_cult_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._common_co2_per_MJs_kernel, 'proc_plus_cult', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -5430,6 +6203,8 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=1
         ... ).timed_vg_diff_co2_flows_traj_values
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-620.3944303,    0.       ,    0.       ,    0.       ,
@@ -5438,13 +6213,16 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=2
         ... ).timed_vg_diff_co2_flows_traj_values
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-6.20394430e+02, -4.47322267e-07,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.vgco2_diff_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._diff_co2_values_kernel, 'vg', 'values'
+        )
 
     @property
     def chart_of_vg_diff_co2_flows_traj_values(self):
@@ -5455,6 +6233,8 @@ class CBACalculator(ts.Cache):
         ...     rn='.doctests', return_charts=True
         ... )
         >>> c = o.chart_of_vg_diff_co2_flows_traj_values
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
@@ -5496,13 +6276,16 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=2
         ... ).timed_vg_diff_co2_flows_traj_disc_values
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-6.20394430e+02, -4.34293463e-07,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.timed_vg_diff_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'vg', 'disc_values'
+        )
 
     @property
     def chart_of_vg_diff_co2_flows_traj_disc_values(self):
@@ -5513,6 +6296,8 @@ class CBACalculator(ts.Cache):
         ...     rn='.doctests', return_charts=True
         ... )
         >>> c = o.chart_of_vg_diff_co2_flows_traj_disc_values
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
@@ -5551,14 +6336,15 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=2
         ... ).NPV_vg_diff_co2_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-620.39442985, -620.39443029, -620.39443029, -620.39443029,
                 -620.39443029, -620.39443029]])
         """
-        return np.cumsum(
-            self.timed_vg_diff_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'vg', 'NPV'
         )
 
     @property
@@ -5570,6 +6356,8 @@ class CBACalculator(ts.Cache):
         ...     rn='.doctests', return_charts=True
         ... )
         >>> c = o.chart_of_NPV_vg_diff_co2_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
@@ -5611,14 +6399,15 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=2
         ... ).NPV_vg_diff_co2_flows_traj_per_cum_output_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-620.39442985, -310.19721514, -206.79814343, -155.09860757,
                 -124.07888606, -124.07888606]])
         """
-        return np.nan_to_num(
-            self.NPV_vg_diff_co2_flows_traj
-            /self.timed_C_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._diff_co2_per_output_kernel, 'vg', 'NPV_per_cum_output'
         )
 
     @property
@@ -5630,6 +6419,8 @@ class CBACalculator(ts.Cache):
         ...     rn='.doctests', return_charts=True
         ... )
         >>> c = o.chart_of_NPV_vg_diff_co2_flows_traj_per_cum_output_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
@@ -5670,14 +6461,15 @@ class CBACalculator(ts.Cache):
         >>> CBACalculator._testing_instancer(
         ...     ph=5, td=2
         ... ).NPV_vg_diff_co2_flows_traj_per_cum_MJs_output_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-0.02322804, -0.01161402, -0.00774268, -0.00580701, -0.00464561,
                 -0.00464561]])
         """
-        return self.NPV_vg_diff_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._diff_co2_per_MJs_kernel, 'vg', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -5689,6 +6481,8 @@ class CBACalculator(ts.Cache):
         ...     rn='.doctests', return_charts=True
         ... )
         >>> c = o.chart_of_NPV_vg_diff_co2_flows_traj_per_cum_MJs_output_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
@@ -5734,8 +6528,9 @@ class CBACalculator(ts.Cache):
         array([[-9.48336381e+02, -1.16020926e-05,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.soco2_diff_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._so_diff_co2_values_kernel, 'so', 'values'
+        )
 
     @property
     def chart_of_so_diff_co2_flows_traj_values(self):
@@ -5792,8 +6587,9 @@ class CBACalculator(ts.Cache):
         array([[-9.48336381e+02, -1.12641675e-05,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.timed_so_diff_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._so_diff_co2_disc_kernel, 'so', 'disc_values'
+        )
 
     @property
     def chart_of_so_diff_co2_flows_traj_disc_values(self):
@@ -5847,9 +6643,8 @@ class CBACalculator(ts.Cache):
         array([[-948.33638116, -948.33639242, -948.33639242, -948.33639242,
                 -948.33639242, -948.33639242]])
         """
-        return np.cumsum(
-            self.timed_so_diff_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._so_diff_co2_disc_kernel, 'so', 'NPV'
         )
 
     @property
@@ -5907,9 +6702,8 @@ class CBACalculator(ts.Cache):
         array([[-948.33638116, -474.16819621, -316.11213081, -237.08409811,
                 -189.66727848, -189.66727848]])
         """
-        return np.nan_to_num(
-            self.NPV_so_diff_co2_flows_traj
-            /self.timed_C_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._so_diff_co2_per_output_kernel, 'so', 'NPV_per_cum_output'
         )
 
     @property
@@ -5966,9 +6760,8 @@ class CBACalculator(ts.Cache):
         array([[-0.03550643, -0.01775322, -0.01183548, -0.00887661, -0.00710129,
                 -0.00710129]])
         """
-        return self.NPV_so_diff_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._so_diff_co2_per_MJs_kernel, 'so', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -6023,13 +6816,18 @@ class CBACalculator(ts.Cache):
         ... ).timed_so_plus_vg_diff_co2_flows_traj_values
         ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.05488765]
         ---- [***]The solution converged.[3.552714e-15][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
         ---- [***]The solution converged.[0.000000e+00][***]
         array([[-1.56873081e+03, -1.20494148e-05,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.diff_co2_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._diff_co2_values_kernel, 'so_plus_vg', 'values'
+        )
 
     @property
     def chart_of_so_plus_vg_diff_co2_flows_traj_values(self):
@@ -6044,6 +6842,10 @@ class CBACalculator(ts.Cache):
         ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
         >>> c.show()  # doctest: +SKIP
         >>> c.close()
         """
@@ -6090,8 +6892,9 @@ class CBACalculator(ts.Cache):
         array([[-1.56873081e+03, -1.16984610e-05,  0.00000000e+00,
                  0.00000000e+00,  0.00000000e+00,  0.00000000e+00]])
         """
-        return self.timed_so_plus_vg_diff_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'so_plus_vg', 'disc_values'
+        )
 
     @property
     def chart_of_so_plus_vg_diff_co2_flows_traj_disc_values(self):
@@ -6149,9 +6952,8 @@ class CBACalculator(ts.Cache):
         array([[-1568.73081101, -1568.73082271, -1568.73082271, -1568.73082271,
                 -1568.73082271, -1568.73082271]])
         """
-        return np.cumsum(
-            self.timed_so_plus_vg_diff_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'so_plus_vg', 'NPV'
         )
 
     @property
@@ -6213,8 +7015,9 @@ class CBACalculator(ts.Cache):
         array([[-1568.73081101,  -784.36541136,  -522.91027424,  -392.18270568,
                  -313.74616454,  -313.74616454]])
         """
-        return self.NPV_so_diff_co2_flows_traj_per_cum_output_flows_traj\
-        + self.NPV_vg_diff_co2_flows_traj_per_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._diff_co2_per_output_kernel, 'so_plus_vg', 'NPV_per_cum_output'
+        )
 
     @property
     def chart_of_NPV_so_plus_vg_diff_co2_flows_traj_per_cum_output_flows_traj(self):
@@ -6274,9 +7077,8 @@ class CBACalculator(ts.Cache):
         array([[-0.05873447, -0.02936724, -0.01957816, -0.01468362, -0.01174689,
                 -0.01174689]])
         """
-        return self.NPV_so_plus_vg_diff_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._diff_co2_per_MJs_kernel, 'so_plus_vg', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -6345,9 +7147,9 @@ class CBACalculator(ts.Cache):
         array([[-19.07177863,  -1.92997014,  -1.92997   ,  -1.92997   ,
                  -1.92997   ,  -0.88958   ]])
         """
-        return self.timed_proc_input_co2eq_flows_traj\
-        + self.timed_cult_input_co2eq_flows_traj\
-        + self.diff_co2_flows_traj
+        return self._co2_cube_row(
+            self._diff_co2_values_kernel, 'total', 'flows'
+        )
 
     @property
     def chart_of_total_diff_co2_flows_traj(self):
@@ -6401,8 +7203,9 @@ class CBACalculator(ts.Cache):
         array([[-1659.24474101,  -167.90740205,  -167.90739   ,  -167.90739   ,
                  -167.90739   ,   -77.39346   ]])
         """
-        return self.timed_total_diff_co2_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._diff_co2_values_kernel, 'total', 'values'
+        )
 
     @property
     def chart_of_total_diff_co2_flows_traj_values(self):
@@ -6463,8 +7266,9 @@ class CBACalculator(ts.Cache):
         array([[-1659.24474101,  -163.01689519,  -158.26881893,  -153.6590475 ,
                  -149.18354126,   -66.76027845]])
         """
-        return self.timed_total_diff_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'total', 'disc_values'
+        )
 
     @property
     def chart_of_total_diff_co2_flows_traj_disc_values(self):
@@ -6522,9 +7326,8 @@ class CBACalculator(ts.Cache):
         array([[-1659.24474101, -1822.26163621, -1980.53045513, -2134.18950263,
                 -2283.3730439 , -2350.13332235]])
         """
-        return np.cumsum(
-            self.timed_total_diff_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._diff_co2_disc_kernel, 'total', 'NPV'
         )
 
     @property
@@ -6586,8 +7389,9 @@ class CBACalculator(ts.Cache):
         array([[-1659.24474101,  -948.70045888,  -684.85849177,  -551.7903773 ,
                  -471.05856411,  -470.02666447]])
         """
-        return self.NPV_so_plus_vg_diff_co2_flows_traj_per_cum_output_flows_traj\
-        + self.NPV_proc_plus_cult_co2_flows_traj_per_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._diff_co2_per_output_kernel, 'total', 'NPV_per_cum_output'
+        )
 
     @property
     def chart_of_NPV_total_diff_co2_flows_traj_per_cum_output_flows_traj(self):
@@ -6647,9 +7451,8 @@ class CBACalculator(ts.Cache):
         array([[-0.06212338, -0.03552006, -0.02564162, -0.02065945, -0.01763679,
                 -0.01759815]])
         """
-        return self.NPV_total_diff_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(
-            self.output, 1.
+        return self._co2_cube_row(
+            self._diff_co2_per_MJs_kernel, 'total', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -6710,7 +7513,9 @@ class CBACalculator(ts.Cache):
         array([[-310.19721515, -310.19721515,    0.        ,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.vgco2_unif_flows_traj*self.co2_prices_traj
+        return self._co2_cube_row(
+            self._unif_co2_values_kernel, 'vg', 'values'
+        )
 
     @property
     def chart_of_vg_unif_co2_flows_traj_values(self):
@@ -6762,7 +7567,9 @@ class CBACalculator(ts.Cache):
         array([[-310.19721515, -301.16234481,    0.        ,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.timed_vg_unif_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'vg', 'disc_values'
+        )
 
     @property
     def chart_of_vg_unif_co2_flows_traj_disc_values(self):
@@ -6812,9 +7619,8 @@ class CBACalculator(ts.Cache):
         array([[-310.19721515, -611.35955996, -611.35955996, -611.35955996,
                 -611.35955996, -611.35955996]])
         """
-        return np.cumsum(
-            self.timed_vg_unif_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'vg', 'NPV'
         )
 
     @property
@@ -6868,9 +7674,8 @@ class CBACalculator(ts.Cache):
         array([[-310.19721515, -305.67977998, -203.78651999, -152.83988999,
                 -122.27191199, -122.27191199]])
         """
-        return np.nan_to_num(
-            self.NPV_vg_unif_co2_flows_traj\
-            /self.timed_C_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._unif_co2_per_output_kernel, 'vg', 'NPV_per_cum_output'
         )
 
     @property
@@ -6923,8 +7728,9 @@ class CBACalculator(ts.Cache):
         array([[-0.01161402, -0.01144488, -0.00762992, -0.00572244, -0.00457795,
                 -0.00457795]])
         """
-        return self.NPV_vg_unif_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(self.output, 1. )
+        return self._co2_cube_row(
+            self._unif_co2_per_MJs_kernel, 'vg', 'NPV_per_cum_MJs'
+        )
 
     @property
     def chart_of_NPV_vg_unif_co2_flows_traj_per_cum_MJs_output_flows_traj(self):
@@ -6977,8 +7783,9 @@ class CBACalculator(ts.Cache):
         array([[-316.11213092, -316.11213092, -316.11213092,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.soco2_unif_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._so_unif_co2_values_kernel, 'so', 'values'
+        )
 
     @property
     def chart_of_so_unif_co2_flows_traj_values(self):
@@ -7031,7 +7838,9 @@ class CBACalculator(ts.Cache):
         array([[-316.11213092, -306.90498148, -297.96600143,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.timed_so_unif_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._so_unif_co2_disc_kernel, 'so', 'disc_values'
+        )
 
     @property
     def chart_of_so_unif_co2_flows_traj_disc_values(self):
@@ -7081,8 +7890,8 @@ class CBACalculator(ts.Cache):
         array([[-316.11213092, -623.0171124 , -920.98311383, -920.98311383,
                 -920.98311383, -920.98311383]])
         """
-        return np.cumsum(
-            self.timed_so_unif_co2_flows_traj_disc_values, axis=1
+        return self._co2_cube_row(
+            self._so_unif_co2_disc_kernel, 'so', 'NPV'
         )
 
     @property
@@ -7136,9 +7945,8 @@ class CBACalculator(ts.Cache):
         array([[-316.11213092, -311.5085562 , -306.99437128, -230.24577846,
                 -184.19662277, -184.19662277]])
         """
-        return np.nan_to_num(
-            self.NPV_so_unif_co2_flows_traj\
-            /self.timed_C_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._so_unif_co2_per_output_kernel, 'so', 'NPV_per_cum_output'
         )
 
     @property
@@ -7191,8 +7999,9 @@ class CBACalculator(ts.Cache):
         array([[-0.01183548, -0.01166312, -0.0114941 , -0.00862058, -0.00689646,
                 -0.00689646]])
         """
-        return self.NPV_so_unif_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(self.output, 1.)
+        return self._co2_cube_row(
+            self._so_unif_co2_per_MJs_kernel, 'so', 'NPV_per_cum_MJs'
+        )
 
     @property
     def chart_of_NPV_so_unif_co2_flows_traj_per_cum_MJs_output_flows_traj(self):
@@ -7247,7 +8056,9 @@ class CBACalculator(ts.Cache):
         array([[-626.30934607, -626.30934607, -316.11213092,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.unif_co2_flows_traj*self.co2_prices_traj
+        return self._co2_cube_row(
+            self._unif_co2_values_kernel, 'so_plus_vg', 'values'
+        )
 
     @property
     def chart_of_so_plus_vg_unif_co2_flows_traj_values(self):
@@ -7300,8 +8111,9 @@ class CBACalculator(ts.Cache):
         array([[-626.30934607, -608.06732628, -297.96600143,    0.        ,
                    0.        ,    0.        ]])
         """
-        return self.timed_so_plus_vg_unif_co2_flows_traj_values\
-        *self.discounting_factors
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'so_plus_vg', 'disc_values'
+        )
 
     @property
     def chart_of_so_plus_vg_unif_co2_flows_traj_disc_values(self):
@@ -7351,9 +8163,8 @@ class CBACalculator(ts.Cache):
         array([[ -626.30934607, -1234.37667235, -1532.34267379, -1532.34267379,
                 -1532.34267379, -1532.34267379]])
         """
-        return np.cumsum(
-            self.timed_so_plus_vg_unif_co2_flows_traj_disc_values,
-            axis=1
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'so_plus_vg', 'NPV'
         )
 
     @property
@@ -7407,8 +8218,9 @@ class CBACalculator(ts.Cache):
         array([[-626.30934607, -617.18833618, -510.78089126, -383.08566845,
                 -306.46853476, -306.46853476]])
         """
-        return self.NPV_so_unif_co2_flows_traj_per_cum_output_flows_traj\
-        + self.NPV_vg_unif_co2_flows_traj_per_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._unif_co2_per_output_kernel, 'so_plus_vg', 'NPV_per_cum_output'
+        )
 
     @property
     def chart_of_NPV_so_plus_vg_unif_co2_flows_traj_per_cum_output_flows_traj(self):
@@ -7460,8 +8272,9 @@ class CBACalculator(ts.Cache):
         array([[-0.0234495 , -0.023108  , -0.01912402, -0.01434302, -0.01147441,
                 -0.01147441]])
         """
-        return self.NPV_so_plus_vg_unif_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(self.output, 1. )
+        return self._co2_cube_row(
+            self._unif_co2_per_MJs_kernel, 'so_plus_vg', 'NPV_per_cum_MJs'
+        )
 
     @property
     def chart_of_NPV_so_plus_vg_unif_co2_flows_traj_per_cum_MJs_output_flows_traj(self):
@@ -7521,9 +8334,9 @@ class CBACalculator(ts.Cache):
         array([[-8.239348  , -9.128928  , -5.56344277, -1.92997   , -1.92997   ,
                 -0.88958   ]])
         """
-        return self.timed_proc_input_co2eq_flows_traj\
-        + self.timed_cult_input_co2eq_flows_traj\
-        + self.unif_co2_flows_traj
+        return self._co2_cube_row(
+            self._unif_co2_values_kernel, 'total', 'flows'
+        )
 
     @property
     def chart_of_total_unif_co2_flows_traj(self):
@@ -7567,8 +8380,9 @@ class CBACalculator(ts.Cache):
         array([[-716.82327607, -794.21673607, -484.01952092, -167.90739   ,
                 -167.90739   ,  -77.39346   ]])
         """
-        return self.timed_total_unif_co2_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._unif_co2_values_kernel, 'total', 'values'
+        )
 
     @property
     def chart_of_total_unif_co2_flows_traj_values(self):
@@ -7621,7 +8435,9 @@ class CBACalculator(ts.Cache):
         array([[-716.82327607, -771.08420978, -456.23482036, -153.6590475 ,
                 -149.18354126,  -66.76027845]])
         """
-        return self.timed_total_unif_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'total', 'disc_values'
+        )
 
     @property
     def chart_of_total_unif_co2_flows_traj_disc_values(self):
@@ -7671,8 +8487,8 @@ class CBACalculator(ts.Cache):
         array([[ -716.82327607, -1487.90748585, -1944.14230621, -2097.80135371,
                 -2246.98489497, -2313.74517342]])
         """
-        return np.cumsum(
-            self.timed_total_unif_co2_flows_traj_disc_values, axis=1
+        return self._co2_cube_row(
+            self._unif_co2_disc_kernel, 'total', 'NPV'
         )
 
     @property
@@ -7726,8 +8542,9 @@ class CBACalculator(ts.Cache):
         array([[-716.82327607, -781.5233837 , -672.72910879, -542.69334007,
                 -463.78093432, -462.74903468]])
         """
-        return self.NPV_so_plus_vg_unif_co2_flows_traj_per_cum_output_flows_traj\
-        + self.NPV_proc_plus_cult_co2_flows_traj_per_cum_output_flows_traj
+        return self._co2_cube_row(
+            self._unif_co2_per_output_kernel, 'total', 'NPV_per_cum_output'
+        )
 
     @property
     def chart_of_NPV_total_unif_co2_flows_traj_per_cum_output_flows_traj(self):
@@ -7779,8 +8596,9 @@ class CBACalculator(ts.Cache):
         array([[-0.02683841, -0.02926083, -0.02518749, -0.02031885, -0.01736431,
                 -0.01732567]])
         """
-        return self.NPV_total_unif_co2_flows_traj_per_cum_output_flows_traj\
-        /self.output_flows_traj_converter.tonnes_to_MJs_computer(self.output, 1.)
+        return self._co2_cube_row(
+            self._unif_co2_per_MJs_kernel, 'total', 'NPV_per_cum_MJs'
+        )
 
     @property
     def chart_of_NPV_total_unif_co2_flows_traj_per_cum_MJs_output_flows_traj(self):
@@ -7896,7 +8714,7 @@ class CBACalculator(ts.Cache):
         ... ).cum_black_output_flows_traj
         array([[0.        , 0.58683364, 1.17366728, 1.76050092, 2.34733456]])
         """
-        return np.cumsum(self.timed_black_output_flows_traj, axis=1)
+        return np.cumsum(self.timed_black_output_flows_traj, axis=1, dtype=np.float64)
 
     @ts.Cache._property
     def cum_MJs_black_output_flows_traj(self):
@@ -7916,7 +8734,7 @@ class CBACalculator(ts.Cache):
         array([[     0.     ,  26708.86076,  53417.72152,  80126.58228,
                 106835.44304]])
         """
-        return np.cumsum(self.timed_output_MJs_flows_traj, axis=1)
+        return np.cumsum(self.timed_output_MJs_flows_traj, axis=1, dtype=np.float64)
 
     @property
     def chart_of_black_output_flows_traj(self):
@@ -8041,8 +8859,9 @@ class CBACalculator(ts.Cache):
         array([[   0.        , -202.85646836, -202.85646836, -202.85646836,
                 -202.85646836]])
         """
-        return self.timed_black_output_co2eq_flows_traj\
-        *self.co2_prices_traj
+        return self._co2_cube_row(
+            self._black_output_co2_values_kernel, 'black_output', 'values'
+        )
 
     @property
     def chart_of_black_output_co2_flows_traj_values(self):
@@ -8095,7 +8914,9 @@ class CBACalculator(ts.Cache):
         array([[   0.        , -196.94802753, -191.21167722, -185.64240506,
                 -180.23534472]])
         """
-        return self.timed_black_output_co2_flows_traj_values*self.discounting_factors
+        return self._co2_cube_row(
+            self._black_output_co2_disc_kernel, 'black_output', 'disc_values'
+        )
 
     @property
     def chart_of_black_output_co2_flows_traj_disc_values(self):
@@ -8145,8 +8966,8 @@ class CBACalculator(ts.Cache):
         array([[   0.        , -196.94802753, -388.15970475, -573.80210981,
                 -754.03745453]])
         """
-        return np.cumsum(
-            self.timed_black_output_co2_flows_traj_disc_values, axis=1
+        return self._co2_cube_row(
+            self._black_output_co2_disc_kernel, 'black_output', 'NPV'
         )
 
     @property
@@ -8200,9 +9021,8 @@ class CBACalculator(ts.Cache):
         array([[   0.        , -335.61134608, -330.7238022 , -325.93116209,
                 -321.23135261]])
         """
-        return np.nan_to_num(
-            self.NPV_black_output_co2_flows_traj\
-            /self.cum_black_output_flows_traj
+        return self._co2_cube_row(
+            self._black_output_co2_per_output_kernel, 'black_output', 'NPV_per_cum_output'
         )
     
     @property
@@ -8255,9 +9075,8 @@ class CBACalculator(ts.Cache):
         ... ).NPV_black_output_co2_flows_traj_per_cum_MJs_black_output_flows_traj
         array([[ 0.        , -0.00737388, -0.0072665 , -0.0071612 , -0.00705793]])
         """
-        return np.nan_to_num(
-            self.NPV_black_output_co2_flows_traj\
-            /self.cum_MJs_black_output_flows_traj
+        return self._co2_cube_row(
+            self._black_output_co2_per_MJs_kernel, 'black_output', 'NPV_per_cum_MJs'
         )
 
     @property
@@ -8292,86 +9111,348 @@ class CBACalculator(ts.Cache):
 
 
 
-    """**[PAYBACK*RELATED-OBJECTS]******************************************************************"""
+    """**[PER-GAS*FLOWS]*****************************************************************************"""
+
+    def _input_flows_timer(self, traj, phase):
+        """ Times the input-related flows `traj` (array of dimensions gas x
+        year, or co2eq row) of `phase`, i.e. shifts cultivation-related flows
+        `project_timing` years backward and process-related ones forward."""
+        _D_ = self.project_timing
+        _z_ = np.zeros((traj.shape[0], _D_))
+        if phase == 'culture':
+            return np.hstack((traj[:, :(-_D_ if _D_ else None)], _z_))
+        return np.hstack((_z_, traj))[:, :(-_D_ if _D_ else None)]
+
+    def _ghgs_flows_timer(self, unit_co2_flows_traj):
+        """ Timed input-related flows of each GHG plus the land-use-change
+        related CO2 flows, annualized as `unit_co2_flows_traj` is."""
+        flows = self._input_flows_timer(
+            self.cultivated_input_ghgs_flows_traj, 'culture'
+        ) + self._input_flows_timer(
+            self.processed_input_ghgs_flows_traj, 'process'
+        )
+        flows[0] += (unit_co2_flows_traj*self.land_surface_flows_traj)[0]
+        return flows
+
+    def _ghgs_yields(self, phase):
+        yields = self.co2eq_computer.ghgs_emissions_per_tonne_of_eth[phase]
+        return np.array([
+            [float(yields[self.final_landuse].get(ghg, 0.))]
+            for ghg in self.co2eq_computer.GWP_trajs['ghgs']
+        ])
+
     @ts.Cache._property
-    def NPV_total_diff_minus_black_output_co2_flows_trajs(self):
-        """
-        Resolution order:
-               ...
-                  \ ...
-        ---------->\ NPV_total_diff_co2_flows_traj
-               ...
-                  \ ...
-        ---------->\ NPV_black_output_co2_flows_traj
-        ===========
-        ---------->| NPV_total_diff_minus_black_output_co2_flows_trajs
+    def cultivated_input_ghgs_flows_traj(self):
+        """ Flows (tonnes) of each GHG related to the cultivation of inputs,
+        as an array of dimensions gas x year (gases being those of
+        `co2eq_computer`), i.e. before any conversion into CO2eq.
 
         Testing/Example
         ---------------
-        >>> CBACalculator._testing_instancer(
-        ...     ph=4, ts=3, td=2
-        ... ).NPV_total_diff_minus_black_output_co2_flows_trajs
-        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.0613595]
-        ---- [***]The solution converged.[0.000000e+00][***]
-        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
-        ---- [***]The solution converged.[0.000000e+00][***]
-        array([[-1659.24467335, -1625.3136067 , -1592.37074841, -1560.38739085,
-                -1448.91513293]])
-        """
-        return self.NPV_total_diff_co2_flows_traj\
-        - self.NPV_black_output_co2_flows_traj
-    
-    @property
-    def chart_of_NPV_total_diff_minus_black_output_co2_flows_trajs(self):
+        >>> o = CBACalculator._testing_instancer(ph=3)
+        >>> o.cultivated_input_ghgs_flows_traj
+        array([[-0.46313, -0.46313, -0.46313, -0.46313],
+               [-0.00187, -0.00187, -0.00187, -0.00187],
+               [-0.0008 , -0.0008 , -0.0008 , -0.0008 ]])
         """
+        return self._ghgs_yields('culture')*self.output_flows_traj
+
+    @ts.Cache._property
+    def processed_input_ghgs_flows_traj(self):
+        """ Flows (tonnes) of each GHG related to the processing of inputs,
+        as an array of dimensions gas x year, i.e. before any conversion into
+        CO2eq.
+
         Testing/Example
         ---------------
-        >>> o = CBACalculator._testing_instancer(
-        ...     rn='.doctests', return_charts=True
-        ... )
-        >>> c = o.chart_of_NPV_total_diff_minus_black_output_co2_flows_trajs
-        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
-        ---- [***]The solution converged.[0.000000e+00][***]
-        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
-        ---- [***]The solution converged.[0.000000e+00][***]
-        >>> c.show()  # doctest: +SKIP
-        >>> c.close()
+        >>> o = CBACalculator._testing_instancer(ph=3)
+        >>> o.processed_input_ghgs_flows_traj
+        array([[-0.82958, -0.82958, -0.82958, -0.82958],
+               [ 0.     ,  0.     ,  0.     ,  0.     ],
+               [-0.0024 , -0.0024 , -0.0024 , -0.0024 ]])
         """
-        return self.dashboard.plot(
-            abs_=self.horizon,
-            imas=self.NPV_total_diff_minus_black_output_co2_flows_trajs.T,
-            labels=['DIFF %s minus %s NPVs [%s][%s]'%(
-                self.output,
-                self.black_output,
-                self.co2_prices_scenario,
-                self.final_currency
-            )],
-            colors=['orange'],
-            save=self.save_charts,
-            save_dir=self.save_dir,
-            file_name='dNPV co2 total [diff-%s-%svs%s]'%(
-                self.co2_prices_scenario,
-                self.output,
-                self.black_output
-            ),
-            bar=False
-        )
+        return self._ghgs_yields('process')*self.output_flows_traj
 
     @ts.Cache._property
-    def diff_payback_period(self):
-        """ Time required for the "green" project to become more profitable
-        than its black counterpart when co2 flows are differentiated.
+    def diff_ghgs_flows_traj(self):
+        """ Flows (tonnes) of each GHG, as an array of dimensions gas x year,
+        i.e. the timed input-related flows plus the land-use-change related
+        CO2 flows annualized in a differentiated way.
 
         Testing/Example
         ---------------
-        >>> CBACalculator._testing_instancer(
-        ...     ph=60, sc='WEO2015-CPS'
-        ... ).diff_payback_period
-        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> o.diff_ghgs_flows_traj.shape
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
         ---- [***]The solution converged.[0.000000e+00][***]
         ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
         ---- [***]The solution converged.[0.000000e+00][***]
-        45
+        (3, 5)
+        """
+        return self._ghgs_flows_timer(self.unit_diff_co2_flows_traj)
+
+    @ts.Cache._property
+    def unif_ghgs_flows_traj(self):
+        """ Flows (tonnes) of each GHG, as an array of dimensions gas x year,
+        i.e. the timed input-related flows plus the land-use-change related
+        CO2 flows annualized in a uniform way.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> o.unif_ghgs_flows_traj
+        array([[-7.66208800e+00, -8.49166800e+00, -4.92618277e+00,
+                -1.29271000e+00, -8.29580000e-01],
+               [-1.87000000e-03, -1.87000000e-03, -1.87000000e-03,
+                -1.87000000e-03,  0.00000000e+00],
+               [-8.00000000e-04, -3.20000000e-03, -3.20000000e-03,
+                -3.20000000e-03, -2.40000000e-03]])
+        """
+        return self._ghgs_flows_timer(self.unit_unif_co2_flows_traj)
+
+    def metric_co2_flows_traj(self, metric, annualization='unif'):
+        """ Total co2 flows (tonnes of CO2eq) of the project, the per-gas
+        flows being weighted under `metric` (e.g. 'GWP20', 'GWP100' or
+        'GTP100', see `GlobalWarmingPotential.metric_weights`). Since per-gas
+        flows are cached, comparing metrics only costs a re-weighting. As in
+        the co2eq pipeline, input-related flows are weighted at their year of
+        production, then timed (see `_input_flows_timer`).
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> bool(np.allclose(
+        ...     o.metric_co2_flows_traj('GWP100'), o.timed_total_unif_co2_flows_traj
+        ... ))
+        True
+        >>> o.metric_co2_flows_traj('GTP100', 'diff')
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        array([[-18.98931758,  -1.7966079 ,  -1.7965982 ,  -1.7965982 ,
+                 -0.83865969]])
+
+        In dynamic mode, weights also vary with the year of emission
+        >>> o = CBACalculator._testing_instancer(
+        ...     ph=4, ts=3, tu=2, GWP_horizon=10, GWP_static=False
+        ... )
+        >>> bool(np.allclose(
+        ...     o.metric_co2_flows_traj('GWP10'), o.timed_total_unif_co2_flows_traj
+        ... ))
+        True
+        >>> o.metric_co2_flows_traj('GWP100', 'none')
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown annualization: none
+        """
+        if annualization not in ('diff', 'unif'):
+            raise ValueError('Unknown annualization: %s'%annualization)
+        weights = self.co2eq_computer.metric_weights(metric)
+        land    = self.unit_diff_co2_flows_traj if annualization == 'diff'\
+                  else self.unit_unif_co2_flows_traj
+        return self._input_flows_timer(
+            (weights*self.processed_input_ghgs_flows_traj).sum(axis=0, keepdims=True),
+            'process'
+        ) + self._input_flows_timer(
+            (weights*self.cultivated_input_ghgs_flows_traj).sum(axis=0, keepdims=True),
+            'culture'
+        ) + weights[:1]*land*self.land_surface_flows_traj
+
+    def metric_NPV_co2_flows_traj(self, metric, annualization='unif'):
+        """ NPV of the total co2 flows of the project under `metric` (see
+        `metric_co2_flows_traj`).
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> bool(np.allclose(
+        ...     o.metric_NPV_co2_flows_traj('GWP100'), o.NPV_total_unif_co2_flows_traj
+        ... ))
+        True
+        >>> o.metric_NPV_co2_flows_traj('GWP20')
+        array([[ -719.188441  , -1502.14149176, -1969.89945871, -2134.74602717,
+                -2212.26936641]])
+        >>> o.metric_NPV_co2_flows_traj('GTP100')
+        array([[ -709.6499961 , -1469.46882055, -1914.76637359, -2057.80671497,
+                -2122.63374469]])
+        """
+        return self._co2_cube_discounter(self._co2_cube_valuer(
+            ('total', ), (self.metric_co2_flows_traj(metric, annualization), )
+        ))['NPV']
+
+    """**[DYNAMIC*LCA]*******************************************************************************"""
+
+    @ts.Cache._property
+    def diff_ghgs_emissions_trajs(self):
+        """ Yearly emissions (tonnes) of each GHG, with land-use-change
+        related CO2 flows annualized in a differentiated way.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> e = o.diff_ghgs_emissions_trajs
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> sorted(e)
+        ['CH4', 'CO2', 'N2O']
+
+        Weighted by the GWP100s, they sum up to the opposite of the total co2
+        flows
+        >>> bool(np.allclose(
+        ...     -sum(gwp*e[ghg] for ghg, gwp in (('CO2', 1.), ('N2O', 298.), ('CH4', 25.))),
+        ...     o.timed_total_diff_co2_flows_traj
+        ... ))
+        True
+        """
+        return dict(
+            (ghg, -self.diff_ghgs_flows_traj[i][None, :])
+            for i, ghg in enumerate(self.co2eq_computer.GWP_trajs['ghgs'])
+        )
+
+    @ts.Cache._property
+    def unif_ghgs_emissions_trajs(self):
+        """ Yearly emissions (tonnes) of each GHG, with land-use-change
+        related CO2 flows annualized in a uniform way.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> np.round(o.unif_ghgs_emissions_trajs['CO2'], 4)
+        array([[7.6621, 8.4917, 4.9262, 1.2927, 0.8296]])
+        """
+        return dict(
+            (ghg, -self.unif_ghgs_flows_traj[i][None, :])
+            for i, ghg in enumerate(self.co2eq_computer.GWP_trajs['ghgs'])
+        )
+
+    @ts.Cache._property
+    def diff_dynamic_LCA(self):
+        """ Dynamic LCA (see `GlobalWarmingPotential.dynamic_LCA`) of the
+        emissions of the project, over `GWP_horizon` years, with land-use-change
+        related CO2 flows annualized in a differentiated way.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(
+        ...     ph=4, ts=3, tu=2, GWP_horizon=150, GWP_static=False
+        ... )
+        >>> r = o.diff_dynamic_LCA
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> r['years'][0], r['years'][-1], r['cumulative'].shape
+        (2020, 2169, (3, 150))
+        """
+        return self.co2eq_computer.dynamic_LCA(
+            self.diff_ghgs_emissions_trajs,
+            time_horizon = self.GWP_horizon,
+            first_year   = self.horizon[0]
+        )
+
+    @ts.Cache._property
+    def unif_dynamic_LCA(self):
+        """ Dynamic LCA (see `GlobalWarmingPotential.dynamic_LCA`) of the
+        emissions of the project, over `GWP_horizon` years, with land-use-change
+        related CO2 flows annualized in a uniform way.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(
+        ...     ph=4, ts=3, tu=2, GWP_horizon=150, GWP_static=False
+        ... )
+        >>> np.round(o.unif_dynamic_LCA['co2eq'], 4)
+        array([23.0739,  2.0351,  0.2344])
+        """
+        return self.co2eq_computer.dynamic_LCA(
+            self.unif_ghgs_emissions_trajs,
+            time_horizon = self.GWP_horizon,
+            first_year   = self.horizon[0]
+        )
+
+    """**[PAYBACK*RELATED-OBJECTS]******************************************************************"""
+    @ts.Cache._property
+    def NPV_total_diff_minus_black_output_co2_flows_trajs(self):
+        """
+        Resolution order:
+               ...
+                  \ ...
+        ---------->\ NPV_total_diff_co2_flows_traj
+               ...
+                  \ ...
+        ---------->\ NPV_black_output_co2_flows_traj
+        ===========
+        ---------->| NPV_total_diff_minus_black_output_co2_flows_trajs
+
+        Testing/Example
+        ---------------
+        >>> CBACalculator._testing_instancer(
+        ...     ph=4, ts=3, td=2
+        ... ).NPV_total_diff_minus_black_output_co2_flows_trajs
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.0613595]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.04750517]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        array([[-1659.24467335, -1625.3136067 , -1592.37074841, -1560.38739085,
+                -1448.91513293]])
+        """
+        return self.NPV_total_diff_co2_flows_traj\
+        - self.NPV_black_output_co2_flows_traj
+    
+    @property
+    def chart_of_NPV_total_diff_minus_black_output_co2_flows_trajs(self):
+        """
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(
+        ...     rn='.doctests', return_charts=True
+        ... )
+        >>> c = o.chart_of_NPV_total_diff_minus_black_output_co2_flows_trajs
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> c.show()  # doctest: +SKIP
+        >>> c.close()
+        """
+        return self.dashboard.plot(
+            abs_=self.horizon,
+            imas=self.NPV_total_diff_minus_black_output_co2_flows_trajs.T,
+            labels=['DIFF %s minus %s NPVs [%s][%s]'%(
+                self.output,
+                self.black_output,
+                self.co2_prices_scenario,
+                self.final_currency
+            )],
+            colors=['orange'],
+            save=self.save_charts,
+            save_dir=self.save_dir,
+            file_name='dNPV co2 total [diff-%s-%svs%s]'%(
+                self.co2_prices_scenario,
+                self.output,
+                self.black_output
+            ),
+            bar=False
+        )
+
+    @ts.Cache._property
+    def diff_payback_period(self):
+        """ Time required for the "green" project to become more profitable
+        than its black counterpart when co2 flows are differentiated.
+
+        Testing/Example
+        ---------------
+        >>> CBACalculator._testing_instancer(
+        ...     ph=60, sc='WEO2015-CPS'
+        ... ).diff_payback_period
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.52418009]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        45
         """
         s_ = np.sign(self.NPV_total_diff_minus_black_output_co2_flows_trajs)
         s  = ((np.roll(s_, 1) - s_) != 0).astype(int) 
@@ -8744,6 +9825,896 @@ class CBACalculator(ts.Cache):
                     100.*(i + 1)/nb_keys)
                 )
         return True
+
+    def freeze(self):
+        """ Returns an immutable and slotted snapshot of the instance, made of
+        its parameters and of the arrays and scalars computed so far. The
+        dashboard, the data readers/resources and the sub-computers are
+        dropped, so that the snapshot can be kept (or pickled) at low cost.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> o.NPV_total_unif_minus_black_output_co2_flows_trajs
+        array([[ -716.82327607, -1290.95945832, -1555.98260146, -1523.9992439 ,
+                -1412.52698598]])
+        >>> f = o.freeze()
+        >>> f.NPV_total_unif_minus_black_output_co2_flows_trajs
+        array([[ -716.82327607, -1290.95945832, -1555.98260146, -1523.9992439 ,
+                -1412.52698598]])
+        >>> f.run_name == o.run_name
+        True
+        >>> f.horizon
+        (2020, 2021, 2022, 2023, 2024)
+        >>> 'co2_prices_computer' in f, 'dashboard' in f
+        (False, False)
+        >>> f.discount_rate = .05
+        Traceback (most recent call last):
+        ...
+        AttributeError: FrozenCBACalculator instances are immutable
+        >>> f.discounting_factors[0, 0] = 0.
+        Traceback (most recent call last):
+        ...
+        ValueError: assignment destination is read-only
+        """
+        self.run_name
+        return FrozenCBACalculator(self)
+
+    """**[FORK]**************************************************************************************"""
+    _nodes_graph    = None
+    _kwargs_objects = ('dluc_delays', 'output_flows_traj_converter', 'dashboard')
+
+    @classmethod
+    def _dependencies_graph(cls):
+        """ Dict which maps the name of each property and method of the class
+        to the names of the attributes that it reads from `self`, as found by
+        parsing its source, or to `None` if it reads attributes whose names
+        are only known at run time (e.g. `getattr(self, name)`). Built once.
+
+        Testing/Example
+        ---------------
+        >>> g = CBACalculator._dependencies_graph()
+        >>> sorted(g['discounting_factors'])
+        ['discount_rate', 'economic_horizon']
+        >>> g['all_charts'] is None
+        True
+        """
+        if cls._nodes_graph is None:
+            graph = {}
+            for klass in reversed(cls.__mro__):
+                for name, member in vars(klass).items():
+                    func = member.fget if isinstance(member, property) else member
+                    func = getattr(func, '__wrapped__', func)
+                    if not inspect.isfunction(func):
+                        continue
+                    try:
+                        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+                    except (IOError, TypeError, SyntaxError):
+                        graph[name] = None
+                        continue
+                    reads = set()
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.Attribute)\
+                        and getattr(node.value, 'id', None) == 'self':
+                            reads.add(node.attr)
+                        elif isinstance(node, ast.Call)\
+                        and getattr(node.func, 'id', None) == 'getattr'\
+                        and getattr(node.args[0], 'id', None) == 'self'\
+                        and type(node.args[1]).__name__ not in ('Str', 'Constant'):
+                            reads = None
+                            break
+                    graph[name] = reads
+            cls._nodes_graph = graph
+        return cls._nodes_graph
+
+    @staticmethod
+    def _same(a, b):
+        if a is b:
+            return True
+        try:
+            return type(a) == type(b) and bool(np.all(a == b))
+        except Exception:
+            return False
+
+    def fork(self, **changed_params):
+        """ Returns a new instance built with the parameters of the present
+        one, updated with `changed_params`. The new instance shares (without
+        copying them) all the values and sub-computers cached so far which do
+        not depend, directly or not, on the attributes that the changed
+        parameters alter. The dependencies of each cached value are those of
+        the source of its property (see `_dependencies_graph`).
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> o.NPV_total_unif_co2_flows_traj
+        array([[ -716.82327607, -1487.90748585, -1944.14230621, -2097.80135371,
+                -2166.56444051]])
+        >>> f = o.fork(discount_rate=.045)
+        >>> f.discount_rate, o.discount_rate
+        (0.045, 0.03)
+        >>> f.NPV_total_unif_co2_flows_traj
+        array([[ -716.82327607, -1476.83929145, -1920.07046374, -2067.20713939,
+                -2132.10630319]])
+        >>> np.array_equal(
+        ...     f.NPV_total_unif_co2_flows_traj,
+        ...     CBACalculator._testing_instancer(ph=4, ts=3, tu=2, dr=.045).NPV_total_unif_co2_flows_traj
+        ... )
+        True
+
+        Undiscounted flows and sub-computers are shared, discounted ones are not
+        >>> f._cache['unif_co2_flows_traj'] is o._cache['unif_co2_flows_traj']
+        True
+        >>> f.carbon_and_co2_flows_traj_annualizer is o.carbon_and_co2_flows_traj_annualizer
+        True
+        >>> f._cache['discounting_factors'] is o._cache['discounting_factors']
+        False
+        """
+        named  = dict(self._init_params)
+        extra  = dict(self._init_kwargs)
+        for k, v in changed_params.items():
+            (named if k in named else extra)[k] = v
+        new = type(self)(**dict(named, **extra))
+        if not hasattr(new, 'dashboard') or not hasattr(self, 'dashboard'):
+            return new
+        if self._same(extra, self._init_kwargs):
+            for attr in self._kwargs_objects:
+                setattr(new, attr, getattr(self, attr))
+
+        _missing = object()
+        roots    = set(
+            k for k, v in vars(new).items()
+            if k not in ('_cache', '_init_params', '_init_kwargs')
+            and not k.endswith('__caobjs')
+            and not self._same(v, vars(self).get(k, _missing))
+        )
+        if 'dtype' in roots:
+            return new
+
+        graph    = self._dependencies_graph()
+        affected = {}
+        def is_affected(name):
+            if name in roots:
+                return True
+            if name not in graph:
+                return False
+            if name not in affected:
+                affected[name] = False ## guards against cycles
+                reads = graph[name]
+                affected[name] = reads is None or any(
+                    is_affected(r) for r in reads
+                )
+            return affected[name]
+
+        for key, value in self._cache.items():
+            if key in graph and not is_affected(key):
+                new._cache[key] = value
+        return new
+
+    """**[CUBE]**************************************************************************************"""
+    #: Labels of the axes of `co2_flows_cube`, years aside.
+    co2_cube_components     = (
+        'cult', 'proc', 'proc_plus_cult',
+        'so', 'vg', 'so_plus_vg', 'total',
+        'black_output',
+    )
+    co2_cube_annualizations = ('diff', 'unif')
+    co2_cube_metrics        = (
+        'flows', 'values', 'disc_values', 'NPV',
+        'NPV_per_cum_output', 'NPV_per_cum_MJs',
+    )
+
+    @staticmethod
+    def _co2_cube_row(kernel, component, metric):
+        """ (Row-)view of the trajectory of `component` in the `metric` block
+        of `kernel`."""
+        return kernel[metric][kernel['components'].index(component)][None, :]
+
+    def _co2_cube_valuer(self, components, flows):
+        """ Stacks `flows` (one row per component) and values them, in a
+        single pass over all components."""
+        flows = self._dtyper(np.vstack(flows))
+        return {
+            'components': components,
+            'flows'     : flows,
+            'values'    : self._dtyper(flows*self.co2_prices_traj),
+        }
+
+    def _co2_cube_discounter(self, values_kernel):
+        """ Discounts and cumulates the values of `values_kernel`, in a single
+        pass over all its components."""
+        disc_values = self._dtyper(
+            values_kernel['values']*self.discounting_factors
+        )
+        return {
+            'components' : values_kernel['components'],
+            'disc_values': disc_values,
+            'NPV'        : self._dtyper(
+                np.cumsum(disc_values, axis=1, dtype=np.float64)
+            ),
+        }
+
+    def _co2_cube_per_output(self, components, NPVs_per_cum_output):
+        return {
+            'components'        : components,
+            'NPV_per_cum_output': np.vstack(NPVs_per_cum_output),
+        }
+
+    def _co2_cube_per_MJs(self, per_output_kernel):
+        """ Converts the NPVs per cumulated output (tonnes) of
+        `per_output_kernel` into NPVs per cumulated MJs."""
+        return {
+            'components'     : per_output_kernel['components'],
+            'NPV_per_cum_MJs': self._dtyper(
+                per_output_kernel['NPV_per_cum_output']\
+                /self.output_flows_traj_converter.tonnes_to_MJs_computer(
+                    self.output, 1.
+                )
+            ),
+        }
+
+    @ts.Cache._property
+    def _common_co2_values_kernel(self):
+        return self._co2_cube_valuer(
+            ('cult', 'proc', 'proc_plus_cult'),
+            (
+                self.timed_cult_input_co2eq_flows_traj,
+                self.timed_proc_input_co2eq_flows_traj,
+                self.timed_proc_input_co2eq_flows_traj\
+                + self.timed_cult_input_co2eq_flows_traj,
+            )
+        )
+
+    @ts.Cache._property
+    def _common_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._common_co2_values_kernel)
+
+    @ts.Cache._property
+    def _common_co2_per_output_kernel(self):
+        NPV  = self._common_co2_disc_kernel['NPV']
+        cult = self._dtyper(np.nan_to_num(
+            NPV[0][None, :]/self.timed_C_cum_output_flows_traj
+        ))
+        proc = self._dtyper(np.nan_to_num(
+            NPV[1][None, :]/self.timed_P_cum_output_flows_traj
+        ))
+        return self._co2_cube_per_output(
+            self._common_co2_disc_kernel['components'], (cult, proc, proc + cult)
+        )
+
+    @ts.Cache._property
+    def _common_co2_per_MJs_kernel(self):
+        return self._co2_cube_per_MJs(self._common_co2_per_output_kernel)
+
+    @ts.Cache._property
+    def _black_output_co2_values_kernel(self):
+        return self._co2_cube_valuer(
+            ('black_output', ),
+            (self.timed_black_output_co2eq_flows_traj, )
+        )
+
+    @ts.Cache._property
+    def _black_output_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._black_output_co2_values_kernel)
+
+    @ts.Cache._property
+    def _black_output_co2_per_output_kernel(self):
+        return self._co2_cube_per_output(('black_output', ), (
+            self._dtyper(np.nan_to_num(
+                self._black_output_co2_disc_kernel['NPV']/self.cum_black_output_flows_traj
+            )),
+        ))
+
+    @ts.Cache._property
+    def _black_output_co2_per_MJs_kernel(self):
+        return {
+            'components'     : ('black_output', ),
+            'NPV_per_cum_MJs': self._dtyper(np.nan_to_num(
+                self._black_output_co2_disc_kernel['NPV']/self.cum_MJs_black_output_flows_traj
+            )),
+        }
+
+    def _so_co2_per_output_kernel(self, so_disc_kernel):
+        return self._co2_cube_per_output(('so', ), (
+            self._dtyper(np.nan_to_num(
+                so_disc_kernel['NPV']/self.timed_C_cum_output_flows_traj
+            )),
+        ))
+
+    def _annualized_co2_values_kernel(self, co2_flows_traj, vgco2_flows_traj):
+        return self._co2_cube_valuer(
+            ('vg', 'so_plus_vg', 'total'),
+            (
+                vgco2_flows_traj,
+                co2_flows_traj,
+                self.timed_proc_input_co2eq_flows_traj\
+                + self.timed_cult_input_co2eq_flows_traj\
+                + co2_flows_traj,
+            )
+        )
+
+    def _annualized_co2_per_output_kernel(self, disc_kernel, so_per_output_kernel):
+        vg = self._dtyper(np.nan_to_num(
+            disc_kernel['NPV'][0][None, :]/self.timed_C_cum_output_flows_traj
+        ))
+        so_plus_vg = so_per_output_kernel['NPV_per_cum_output'] + vg
+        return self._co2_cube_per_output(disc_kernel['components'], (
+            vg, so_plus_vg, so_plus_vg + self._co2_cube_row(
+                self._common_co2_per_output_kernel, 'proc_plus_cult', 'NPV_per_cum_output'
+            )
+        ))
+
+    @ts.Cache._property
+    def _so_diff_co2_values_kernel(self):
+        return self._co2_cube_valuer(('so', ), (self.soco2_diff_flows_traj, ))
+
+    @ts.Cache._property
+    def _so_diff_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._so_diff_co2_values_kernel)
+
+    @ts.Cache._property
+    def _so_diff_co2_per_output_kernel(self):
+        return self._so_co2_per_output_kernel(self._so_diff_co2_disc_kernel)
+
+    @ts.Cache._property
+    def _so_diff_co2_per_MJs_kernel(self):
+        return self._co2_cube_per_MJs(self._so_diff_co2_per_output_kernel)
+
+    @ts.Cache._property
+    def _diff_co2_values_kernel(self):
+        return self._annualized_co2_values_kernel(
+            self.diff_co2_flows_traj,
+            self.vgco2_diff_flows_traj,
+        )
+
+    @ts.Cache._property
+    def _diff_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._diff_co2_values_kernel)
+
+    @ts.Cache._property
+    def _diff_co2_per_output_kernel(self):
+        return self._annualized_co2_per_output_kernel(
+            self._diff_co2_disc_kernel, self._so_diff_co2_per_output_kernel
+        )
+
+    @ts.Cache._property
+    def _diff_co2_per_MJs_kernel(self):
+        return self._co2_cube_per_MJs(self._diff_co2_per_output_kernel)
+
+    @ts.Cache._property
+    def _so_unif_co2_values_kernel(self):
+        return self._co2_cube_valuer(('so', ), (self.soco2_unif_flows_traj, ))
+
+    @ts.Cache._property
+    def _so_unif_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._so_unif_co2_values_kernel)
+
+    @ts.Cache._property
+    def _so_unif_co2_per_output_kernel(self):
+        return self._so_co2_per_output_kernel(self._so_unif_co2_disc_kernel)
+
+    @ts.Cache._property
+    def _so_unif_co2_per_MJs_kernel(self):
+        return self._co2_cube_per_MJs(self._so_unif_co2_per_output_kernel)
+
+    @ts.Cache._property
+    def _unif_co2_values_kernel(self):
+        return self._annualized_co2_values_kernel(
+            self.unif_co2_flows_traj,
+            self.vgco2_unif_flows_traj,
+        )
+
+    @ts.Cache._property
+    def _unif_co2_disc_kernel(self):
+        return self._co2_cube_discounter(self._unif_co2_values_kernel)
+
+    @ts.Cache._property
+    def _unif_co2_per_output_kernel(self):
+        return self._annualized_co2_per_output_kernel(
+            self._unif_co2_disc_kernel, self._so_unif_co2_per_output_kernel
+        )
+
+    @ts.Cache._property
+    def _unif_co2_per_MJs_kernel(self):
+        return self._co2_cube_per_MJs(self._unif_co2_per_output_kernel)
+
+    @ts.Cache._property
+    def co2_flows_cube(self):
+        """ All the CO2 trajectories of the project, valued, discounted and
+        cumulated, as a single cube of dimensions component x annualization
+        x metric x year (see `tools.NamedCube`). The trajectories which do
+        not depend on the annualization (i.e. cult, proc, proc_plus_cult and
+        black_output) are repeated along that axis. For black_output, the
+        per-output metrics are per cumulated black output (tonnes and MJs).
+        The usual properties (e.g. `NPV_total_unif_co2_flows_traj`) are
+        views of the blocks in which the cube is computed, each block being
+        computed in one vectorized pass over its components. Values,
+        discounted values, per-output and per-MJ blocks are computed (and
+        cached) separately, such that each property only computes what it
+        needs, and so flows are apart from vg ones.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> c = o.co2_flows_cube
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> c.names, c.shape
+        (('component', 'annualization', 'metric', 'year'), (8, 2, 6, 5))
+        >>> c.sel(component='total', annualization='unif', metric='NPV')
+        array([ -716.82327607, -1487.90748585, -1944.14230621, -2097.80135371,
+               -2166.56444051])
+        >>> all(
+        ...     np.array_equal(
+        ...         c.sel(component=k, annualization=a, metric='NPV')[None, :],
+        ...         getattr(o, 'NPV_%s_co2_flows_traj'%(k if k in ('cult', 'proc', 'proc_plus_cult', 'black_output') else '%s_%s'%(k, a)))
+        ...     )
+        ...     for k in c.labels('component') for a in c.labels('annualization')
+        ... )
+        True
+        >>> o.NPV_total_unif_co2_flows_traj.base is o._unif_co2_disc_kernel['NPV']
+        True
+
+        so trajectories are computed apart from vg ones
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> _ = o.NPV_so_diff_co2_flows_traj
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        >>> 'vgco2_diff_flows_traj' in o._cache
+        False
+        """
+        T    = len(self.horizon)
+        cube = np.empty((
+            len(self.co2_cube_components),
+            len(self.co2_cube_annualizations),
+            len(self.co2_cube_metrics),
+            T
+        ), dtype=self.dtype or np.float64)
+        common = (
+            (
+                self._common_co2_values_kernel, self._common_co2_disc_kernel,
+                self._common_co2_per_output_kernel, self._common_co2_per_MJs_kernel,
+            ),
+            (
+                self._black_output_co2_values_kernel, self._black_output_co2_disc_kernel,
+                self._black_output_co2_per_output_kernel, self._black_output_co2_per_MJs_kernel,
+            ),
+        )
+        for j, annualized in enumerate((
+            (
+                (
+                    self._so_diff_co2_values_kernel, self._so_diff_co2_disc_kernel,
+                    self._so_diff_co2_per_output_kernel, self._so_diff_co2_per_MJs_kernel,
+                ),
+                (
+                    self._diff_co2_values_kernel, self._diff_co2_disc_kernel,
+                    self._diff_co2_per_output_kernel, self._diff_co2_per_MJs_kernel,
+                ),
+            ),
+            (
+                (
+                    self._so_unif_co2_values_kernel, self._so_unif_co2_disc_kernel,
+                    self._so_unif_co2_per_output_kernel, self._so_unif_co2_per_MJs_kernel,
+                ),
+                (
+                    self._unif_co2_values_kernel, self._unif_co2_disc_kernel,
+                    self._unif_co2_per_output_kernel, self._unif_co2_per_MJs_kernel,
+                ),
+            ),
+        )):
+            for kernels in common + annualized:
+                for component in kernels[0]['components']:
+                    i = self.co2_cube_components.index(component)
+                    for m, metric in enumerate(self.co2_cube_metrics):
+                        kernel = [k for k in kernels if metric in k][0]
+                        cube[i, j, m] = self._co2_cube_row(
+                            kernel, component, metric
+                        )[0]
+        return ts.NamedCube(cube, (
+            ('component'    , self.co2_cube_components),
+            ('annualization', self.co2_cube_annualizations),
+            ('metric'       , self.co2_cube_metrics),
+            ('year'         , self.horizon),
+        ))
+
+    def co2_prices_scenarios_NPV_cube(self, annualization='unif'):
+        """ Cumulated NPVs of the total co2 flows of the project (i.e.
+        `NPV_total_<annualization>_co2_flows_traj`) under all the eligible
+        CO2 prices scenarios at once, as a cube of dimensions
+        co2_prices_scenario x year (see `tools.NamedCube`). Flows and
+        discounting factors are computed once, whatever the number of
+        scenarios.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, tu=2, sc='SPC2009')
+        >>> c = o.co2_prices_scenarios_NPV_cube('unif')
+        >>> c.shape
+        (14, 5)
+        >>> c.sel(co2_prices_scenario=['SPC2009', 'WEO2015-CPS'], year=2024)
+        array([-1033.03850609,  -313.07164829])
+        >>> bool(np.allclose(
+        ...     c.sel(co2_prices_scenario='SPC2009'),
+        ...     o.NPV_total_unif_co2_flows_traj
+        ... ))
+        True
+        >>> o.co2_prices_scenarios_NPV_cube('none')
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown annualization: none
+        """
+        if annualization not in ('diff', 'unif'):
+            raise ValueError('Unknown annualization: %s'%annualization)
+        flows = self.timed_total_diff_co2_flows_traj\
+                if annualization == 'diff'\
+                else self.timed_total_unif_co2_flows_traj
+        disc_values = self._dtyper(
+            self._dtyper(flows*self.co2_prices_matrix)*self.discounting_factors
+        )
+        return ts.NamedCube(
+            self._dtyper(np.cumsum(disc_values, axis=1, dtype=np.float64)),
+            (
+                ('co2_prices_scenario', self.co2_prices_scenarios),
+                ('year'               , self.horizon),
+            )
+        )
+
+    """**[LANDUSE*TRANSITIONS]***********************************************************************"""
+    def _landuses_checker(self, landuses, eligible_landuses):
+        landuses = [l.upper() for l in landuses]
+        unknown  = [l for l in landuses if l not in eligible_landuses]
+        if unknown:
+            raise ValueError('Unknown landuse(s): %s'%', '.join(unknown))
+        return landuses
+
+    def _transitions_input_flows_scenario(self, final_landuse):
+        """ Input flows scenario used for the transitions toward
+        `final_landuse`, i.e. that of the present instance if eligible, or
+        else the only one (debugging scenario aside) which is."""
+        eligible = InputFlows(
+            final_landuse   = final_landuse,
+            first_year      = self.project_first_year,
+            project_horizon = self.project_horizon,
+            country         = self.country,
+            from_local_data = self.from_local_data
+        ).eligible_scenarios
+        if self.input_flows_scenario in eligible:
+            return self.input_flows_scenario
+        eligible = [s for s in eligible if s != 'DEBUG']
+        if len(eligible) != 1:
+            raise ValueError(
+                'Ambiguous input_flows_scenario for %s: %s'%(
+                    final_landuse, ', '.join(eligible)
+                )
+            )
+        return eligible[0]
+
+    def landuse_transitions_cube(self, initial_landuses=None, final_landuses=None,
+                                 input_flows_scenarios=None,
+                                 annualizations=('diff', 'unif')):
+        """ Final NPVs and payback periods of all the transitions from
+        `initial_landuses` to `final_landuses`, the other parameters being
+        those of the present instance, as a cube of dimensions output x
+        initial_landuse x final_landuse (see `tools.NamedCube`). For each
+        annualization, outputs are
+            NPV_total_<annualization>                    last value of NPV_total_<annualization>_co2_flows_traj
+            NPV_total_<annualization>_minus_black_output last value of NPV_total_<annualization>_minus_black_output_co2_flows_trajs
+            <annualization>_payback_period               <annualization>_payback_period, NaN if none
+
+        By default, initial landuses are all those whose carbon stocks are
+        known (see `VGCAndSOCDeltas.landuses`), and final landuses are those
+        which also have land surface flows (debugging ones aside). The
+        input flows scenario of each final landuse is that found in
+        `input_flows_scenarios` (a dict), or else `self.input_flows_scenario`
+        if eligible, or else the only eligible one.
+
+        Carbon stock differentials are taken as matrices from the deltas
+        computer. Everything which does not depend on the initial landuse
+        (input flows, land surfaces, prices, discounting) is computed once per
+        final landuse (by forking the present instance), and all the initial
+        landuses are then valued, discounted and cumulated at once. Annualized
+        unit flows are computed once per distinct couple of differentials.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, tu=2)
+        >>> c = o.landuse_transitions_cube(
+        ...     initial_landuses = ['improved grassland', 'forestland30', 'wheat'],
+        ...     annualizations   = ('unif', ),
+        ... )
+        >>> c.names, c.shape
+        (('output', 'initial_landuse', 'final_landuse'), (3, 3, 3))
+        >>> c.labels('final_landuse')
+        ('MISCANTHUS', 'SUGARBEET', 'WHEAT')
+        >>> c.sel(output='NPV_total_unif', final_landuse='WHEAT')
+        array([-1469.25113087, -9917.31912069,  -634.22176673])
+        >>> o.NPV_total_unif_co2_flows_traj[0, -1]
+        -1469.251130866251
+        >>> c.sel(output='unif_payback_period', initial_landuse='IMPROVED GRASSLAND')
+        array([ 3., nan, nan])
+        >>> o.unif_payback_period
+        []
+
+        Unknown landuses are reported as such
+        >>> o.landuse_transitions_cube(final_landuses=['wheat', 'forestland30'])
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown landuse(s): FORESTLAND30
+        """
+        deltas   = self.deltas_computer
+        landuses = deltas.landuses
+        eligible_finals = [
+            l for l in landuses
+            if l in self.land_surface_flows_traj_computer.eligible_scenarios
+        ]
+        initial_landuses = self._landuses_checker(
+            initial_landuses or [l for l in landuses if l != 'DEBUG'], landuses
+        )
+        final_landuses   = self._landuses_checker(
+            final_landuses or [l for l in eligible_finals if l != 'DEBUG'],
+            eligible_finals
+        )
+        for a in annualizations:
+            if a not in ('diff', 'unif'):
+                raise ValueError('Unknown annualization: %s'%a)
+        input_flows_scenarios = dict(
+            (k.upper(), v.upper()) for k, v in (input_flows_scenarios or {}).items()
+        )
+        outputs = []
+        for a in annualizations:
+            outputs += [
+                'NPV_total_%s'%a,
+                'NPV_total_%s_minus_black_output'%a,
+                '%s_payback_period'%a,
+            ]
+
+        rows  = [landuses.index(l) for l in initial_landuses]
+        cube  = np.empty(
+            (len(outputs), len(initial_landuses), len(final_landuses))
+        )
+        annualizers = {}
+        for j, final_landuse in enumerate(final_landuses):
+            col  = landuses.index(final_landuse)
+            base = self.fork(
+                final_landuse        = final_landuse,
+                input_flows_scenario = input_flows_scenarios.get(
+                    final_landuse,
+                    self._transitions_input_flows_scenario(final_landuse)
+                )
+            ) if final_landuse != self.final_landuse\
+                 or final_landuse in input_flows_scenarios else self
+            inputs_flows = base.timed_proc_input_co2eq_flows_traj\
+                           + base.timed_cult_input_co2eq_flows_traj
+            land_flows   = base.land_surface_flows_traj\
+                           *ts.dict_time_serie_as_row_array(
+                               base.co2eq_computer.co2eq_yields_GWP_traj_computer(
+                                   {'CO2':1., 'N2O':.0, 'CH4':.0}
+                               )
+                           )
+            keys = []
+            for row in rows:
+                key = (
+                    deltas.absolute_SOC_differentials[row, col],
+                    deltas.absolute_VGC_differentials[row, col],
+                    final_landuse,
+                    base.project_horizon,
+                )
+                if key not in annualizers:
+                    annualizers[key] = CarbonAndCo2FlowsAnnualizer(
+                        delta_soc       = key[0],
+                        delta_vgc       = key[1],
+                        final_landuse   = final_landuse,
+                        project_horizon = base.project_horizon,
+                        T_so            = self.T_so,
+                        T_vg_diff       = self.T_vg_diff,
+                        T_vg_unif       = self.T_vg_unif,
+                        verbose         = self.verbose,
+                        dtype           = self.dtype,
+                        from_local_data = self.from_local_data
+                    )
+                keys.append(key)
+            for k, a in enumerate(annualizations):
+                unit_flows  = np.vstack([
+                    getattr(annualizers[key], 'unit_%s_co2_flows_traj'%a)
+                    for key in keys
+                ])
+                flows       = base._dtyper(
+                    inputs_flows + base._dtyper(unit_flows*land_flows)
+                )
+                values      = base._dtyper(flows*base.co2_prices_traj)
+                disc_values = base._dtyper(values*base.discounting_factors)
+                NPV         = base._dtyper(
+                    np.cumsum(disc_values, axis=1, dtype=np.float64)
+                )
+                NPV_minus_black = NPV - base.NPV_black_output_co2_flows_traj
+                s_ = np.sign(NPV_minus_black)
+                s  = np.cumsum(np.roll(s_, 1, axis=1) != s_, axis=1)
+                cube[3*k    , :, j] = NPV[:, -1]
+                cube[3*k + 1, :, j] = NPV_minus_black[:, -1]
+                cube[3*k + 2, :, j] = np.where(
+                    s[:, -1] >= 2, np.argmax(s >= 2, axis=1), np.nan
+                )
+        return ts.NamedCube(cube, (
+            ('output'         , outputs),
+            ('initial_landuse', initial_landuses),
+            ('final_landuse'  , final_landuses),
+        ))
+
+    """**[EVALUATION]********************************************************************************"""
+    #: Named sets of outputs, as `(names, final)` tuples. If `final`, only
+    #: the value of the last year of each (row-)array is returned, as float.
+    output_profiles = {
+        'payback-only': ((
+            'diff_payback_period',
+            'unif_payback_period',
+        ), False),
+        'npv-final'   : ((
+            'NPV_total_diff_co2_flows_traj',
+            'NPV_total_unif_co2_flows_traj',
+            'NPV_total_diff_minus_black_output_co2_flows_trajs',
+            'NPV_total_unif_minus_black_output_co2_flows_trajs',
+        ), True),
+        'carbon-flows': ((
+            'horizon',
+            'diff_carbon_flows_traj',
+            'unif_carbon_flows_traj',
+            'diff_co2_flows_traj',
+            'unif_co2_flows_traj',
+            'timed_total_diff_co2_flows_traj',
+            'timed_total_unif_co2_flows_traj',
+        ), False),
+        'full'        : (None, False),
+    }
+
+    @classmethod
+    def evaluable_outputs(cls):
+        """ Names of the properties that can be evaluated (i.e. all of them
+        but charts, exports, sub-computers and `save_dir`).
+
+        Testing/Example
+        ---------------
+        >>> outputs = CBACalculator.evaluable_outputs()
+        >>> 'diff_payback_period' in outputs, 'all_XLSXed' in outputs
+        (True, False)
+        """
+        return sorted(
+            k for k in dir(cls)
+            if isinstance(getattr(cls, k), property)
+            and not k.startswith(('chart_of_', 'all_', '_'))
+            and k not in cls._caobjs_dependencies
+            and k not in (
+                'save_dir', 'co2_flows_cube', 'diff_dynamic_LCA', 'unif_dynamic_LCA',
+                'diff_ghgs_emissions_trajs', 'unif_ghgs_emissions_trajs',
+            )
+        )
+
+    def evaluate(self, outputs=('payback-only', )):
+        """ Returns a dict of the values of `outputs`, which are names of
+        evaluable properties (see `evaluable_outputs`) and/or of profiles (see
+        `output_profiles`). Since properties are lazily computed, only the
+        subgraph needed by `outputs` is, leaving aside charts and every
+        per-MJ/per-output value that `outputs` does not need.
+
+        Testing/Example
+        ---------------
+        >>> o = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        >>> sorted(o.evaluate(['npv-final', 'horizon']).items())
+        ---- a_parameter_which_solves_soc_chosen_CRF_constrained sol=[0.07177617]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        ---- a_parameter_which_solves_vgc_chosen_CRF_constrained sol=[0.02458071]
+        ---- [***]The solution converged.[0.000000e+00][***]
+        [('NPV_total_diff_co2_flows_traj', -2202.9525652100065), ('NPV_total_diff_minus_black_output_co2_flows_trajs', -1448.9151106757065), ('NPV_total_unif_co2_flows_traj', -2166.56444051355), ('NPV_total_unif_minus_black_output_co2_flows_trajs', -1412.52698597925), ('horizon', [2020, 2021, 2022, 2023, 2024])]
+        >>> sorted(set(o._cache) & set([
+        ...     'cum_black_output_flows_traj', 'cum_MJs_black_output_flows_traj',
+        ...     'timed_C_cum_output_flows_traj', 'timed_P_cum_output_flows_traj',
+        ... ]))
+        []
+        >>> any('_per_' in k or k.startswith('chart_of_') for k in o._cache)
+        False
+        >>> o.evaluate('payback-only')
+        {'diff_payback_period': [], 'unif_payback_period': []}
+        >>> o.evaluate(['discounted_everything'])
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown output(s) or profile(s): discounted_everything
+        """
+        if isinstance(outputs, str):
+            outputs = [outputs]
+        evaluables = self.evaluable_outputs()
+        unknowns   = [
+            o for o in outputs
+            if o not in self.output_profiles and o not in evaluables
+        ]
+        if unknowns:
+            raise ValueError(
+                'Unknown output(s) or profile(s): %s'%', '.join(unknowns)
+            )
+        values = {}
+        for output in outputs:
+            names, final = self.output_profiles.get(output, ((output, ), False))
+            for name in (evaluables if names is None else names):
+                value = getattr(self, name)
+                if final and isinstance(value, np.ndarray):
+                    value = float(value[0, -1])
+                values[name] = value
+        return values
+
+    """**[ASYNC]*************************************************************************************"""
+    _executor         = None
+    _executor_workers = None
+
+    @classmethod
+    def async_executor(cls, max_workers=None):
+        """ Returns the executor shared by all asynchronous evaluations. Its
+        number of workers (`_executor_workers`) bounds the number of runs
+        computed concurrently. It is replaced when `max_workers` is given and
+        differs from that of the current executor, the previous one being
+        dropped without being shut down, so that its holders can still submit
+        runs to it, and its threads end once it is garbage-collected.
+
+        Testing/Example
+        ---------------
+        >>> e = CBACalculator.async_executor(max_workers=2)
+        >>> e is CBACalculator.async_executor(), CBACalculator._executor_workers
+        (True, 2)
+        >>> CBACalculator.async_executor(max_workers=3) is e
+        False
+        >>> e.submit(sum, [1, 2]).result(), CBACalculator._executor_workers
+        (3, 3)
+        """
+        max_workers = max_workers or cls._executor_workers or mp.cpu_count()
+        if cls._executor is None or cls._executor_workers != max_workers:
+            cls._executor         = cf.ThreadPoolExecutor(max_workers=max_workers)
+            cls._executor_workers = max_workers
+        return cls._executor
+
+    @classmethod
+    def _async_runner(cls, func):
+        """ Runs `func(cancelled)` in the shared executor and returns an
+        awaitable future. Cancelling the future sets the event `cancelled`,
+        which `func` is expected to check between two (long) computations."""
+        try:
+            loop = asyncio.get_running_loop()
+        except (AttributeError, RuntimeError):
+            loop = asyncio.get_event_loop()
+        cancelled = threading.Event()
+        future    = loop.run_in_executor(
+            cls.async_executor(), func, cancelled
+        )
+        future.add_done_callback(lambda f: f.cancelled() and cancelled.set())
+        return future
+
+    def _outputs_evaluator(self, outputs, cancelled=None):
+        """ Returns a dict of the values of `outputs`, stopping early if
+        `cancelled` (an event) is set."""
+        values = {}
+        for output in outputs:
+            if cancelled is not None and cancelled.is_set():
+                raise cf.CancelledError()
+            values[output] = getattr(self, output)
+        return values
+
+    def aevaluate(self, outputs=('diff_payback_period', 'unif_payback_period')):
+        """ Awaitable version of the evaluation of `outputs`, whose CPU work
+        is offloaded to the shared executor (see `async_executor`) so that the
+        event loop is not blocked. Once cancelled, the evaluation stops before
+        the next output is computed.
+
+        Testing/Example
+        ---------------
+        >>> import asyncio
+        >>> async def main():
+        ...     cba = CBACalculator._testing_instancer(ph=4, ts=3, tu=2)
+        ...     return await cba.aevaluate(outputs=['unif_payback_period', 'horizon'])
+        >>> sorted(asyncio.run(main()).items())
+        [('horizon', [2020, 2021, 2022, 2023, 2024]), ('unif_payback_period', [])]
+        """
+        outputs = list(outputs)
+        return self._async_runner(
+            lambda cancelled: self._outputs_evaluator(outputs, cancelled)
+        )
     
     _charts_keys = [
         'chart_of_NPV_black_output_co2_flows_traj',
@@ -8837,6 +10808,370 @@ class CBACalculator(ts.Cache):
         'chart_of_vgco2_unif_flows_traj',
     ]
 
+##******************************************
+##    ╔═╗┬─┐┌─┐┌─┐┌─┐┌┐┌╔═╗╔╗ ╔═╗╔═╗┌─┐┬  ┌─┐┬ ┬┬  ┌─┐┌┬┐┌─┐┬─┐
+##    ╠╣ ├┬┘│ │┌─┘├┤ │││║  ╠╩╗╠═╣║  ├─┤│  │  │ ││  ├─┤ │ │ │├┬┘
+##    ╚  ┴└─└─┘└─┘└─┘┘└┘╚═╝╚═╝╩ ╩╚═╝┴ ┴┴─┘└─┘└─┘┴─┘┴ ┴ ┴ └─┘┴└─
+class FrozenCBACalculator(object):
+    """ Immutable snapshot of a CBACalculator instance, as returned by
+    `CBACalculator.freeze`. Only parameters and computed arrays/scalars are
+    kept, arrays being read-only copies.
+
+    Testing/Example
+    ---------------
+    >>> f = CBACalculator._testing_instancer(ph=3).freeze()
+    >>> hasattr(f, '__dict__')
+    False
+    >>> f.project_horizon, f.final_landuse
+    (4, 'WHEAT')
+    >>> f.dashboard
+    Traceback (most recent call last):
+    ...
+    AttributeError: 'FrozenCBACalculator' object has no attribute 'dashboard'
+    >>> import pickle
+    >>> pickle.loads(pickle.dumps(f)).run_name == f.run_name
+    True
+    """
+
+    _PARAMETERS = (
+        'run_name',
+        'discount_rate',
+        'output',
+        'black_output',
+        'initial_landuse',
+        'final_landuse',
+        'country',
+        'project_horizon',
+        'project_timing',
+        'project_first_year',
+        'T_so',
+        'T_vg_diff',
+        'T_vg_unif',
+        'co2_prices_scenario',
+        'output_flows_scenario',
+        'input_flows_scenario',
+        'polat_repeated_pattern',
+        'final_currency',
+        'GWP_horizon',
+        'GWP_static',
+    )
+    __slots__ = ('_values', )
+
+    @staticmethod
+    def _freezer(value):
+        """ Returns an immutable version of `value`, or `None` if `value`
+        is neither an array nor a scalar (nor a sequence of scalars).
+
+        Testing/Example
+        ---------------
+        >>> FrozenCBACalculator._freezer([2020, 2021])
+        (2020, 2021)
+        >>> FrozenCBACalculator._freezer(np.ones((1, 2))).flags.writeable
+        False
+        >>> FrozenCBACalculator._freezer({2020: 1.}) is None
+        True
+        """
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+            value.setflags(write=False)
+            return value
+        if isinstance(value, (bool, int, float, str, np.generic)):
+            return value
+        if isinstance(value, (list, tuple)) and all(
+            isinstance(v, (bool, int, float, np.generic)) for v in value
+        ):
+            return tuple(value)
+
+    def __init__(self, CBACalculator_instance):
+        values = {}
+        for key, value in CBACalculator_instance._cache.items():
+            if key == 'endogenizing':
+                continue
+            value = self._freezer(value)
+            if value is not None:
+                values[key] = value
+        for key in self._PARAMETERS:
+            values[key] = self._freezer(getattr(CBACalculator_instance, key))
+        object.__setattr__(self, '_values', values)
+
+    def __getattr__(self, key):
+        try:
+            return object.__getattribute__(self, '_values')[key]
+        except KeyError:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'"%(type(self).__name__, key)
+            )
+
+    def __setattr__(self, key, value=None):
+        raise AttributeError(
+            '%s instances are immutable'%type(self).__name__
+        )
+    __delattr__ = __setattr__
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __dir__(self):
+        return sorted(self._values)
+
+    def __getstate__(self):
+        return self._values
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_values', state)
+
+    def __repr__(self):
+        return '<%s %s>'%(type(self).__name__, self.run_name)
+
+
+##******************************************
+##    ╔═╗┌─┐┬ ┬┌┐┌┌─┐╔═╗╔╗ ╔═╗╔╗ ┌─┐┌┬┐┌─┐┬ ┬
+##    ╠═╣└─┐└┬┘││││  ║  ╠╩╗╠═╣╠╩╗├─┤ │ │  ├─┤
+##    ╩ ╩└─┘ ┴ ┘└┘└─┘╚═╝╚═╝╩ ╩╚═╝┴ ┴ ┴ └─┘┴ ┴
+class AsyncCBABatch(object):
+    """ Asynchronous iterator over the evaluations of the `CBACalculator`
+    instances defined by the dicts of parameters of `params_iterable`. Runs
+    are computed in the shared executor (see `CBACalculator.async_executor`),
+    at most `max_concurrency` at a time, and are yielded as `(params, values)`
+    tuples in order of completion. `cancel` stops the pending runs and ends
+    the iteration, including that which is waiting for a run. Cancellation
+    is checked between two outputs (see `CBACalculator._outputs_evaluator`),
+    so that the run of a thread stops once its current output is computed,
+    and not before.
+
+    Testing/Example
+    ---------------
+    >>> import asyncio
+    >>> async def main():
+    ...     batch = AsyncCBABatch(
+    ...         [dict(ph=4, ts=3, tu=2, dr=dr) for dr in (.0, .03, .05)],
+    ...         outputs         = ['NPV_total_unif_co2_flows_traj'],
+    ...         max_concurrency = 2,
+    ...         instancer       = CBACalculator._testing_instancer,
+    ...     )
+    ...     return [
+    ...         (p['dr'], v['NPV_total_unif_co2_flows_traj'][0, -1])
+    ...         async for p, v in batch
+    ...     ]
+    >>> for dr, npv in sorted(asyncio.run(main())):
+    ...     print(dr, round(npv, 4))
+    0.0 -2240.3604
+    0.03 -2166.5644
+    0.05 -2120.9566
+
+    Cancelling the batch while it waits for a run ends the iteration
+    >>> import time
+    >>> def slow_instancer(**params):
+    ...     time.sleep(.5)
+    ...     return CBACalculator._testing_instancer(**params)
+    >>> async def cancelled():
+    ...     batch = AsyncCBABatch(
+    ...         [dict(ph=4, ts=3, tu=2)],
+    ...         outputs   = ['NPV_total_unif_co2_flows_traj'],
+    ...         instancer = slow_instancer,
+    ...     )
+    ...     asyncio.get_running_loop().call_later(.05, batch.cancel)
+    ...     return [v async for _, v in batch]
+    >>> asyncio.run(cancelled())
+    []
+    """
+
+    def __init__(self, params_iterable, outputs=('diff_payback_period', 'unif_payback_period'),
+            max_concurrency=None, instancer=None):
+        self.outputs         = list(outputs)
+        self.max_concurrency = max_concurrency or (
+            CBACalculator.async_executor() and CBACalculator._executor_workers
+        )
+        self.instancer       = instancer or CBACalculator
+        self._params         = iter(params_iterable)
+        self._pending        = {}
+        self._waiter         = None
+        self._cancelled      = False
+
+    def _evaluator(self, params, cancelled):
+        return self.instancer(**params)._outputs_evaluator(
+            self.outputs, cancelled
+        )
+
+    def _filler(self):
+        while len(self._pending) < self.max_concurrency:
+            try:
+                params = next(self._params)
+            except StopIteration:
+                break
+            future = CBACalculator._async_runner(
+                lambda cancelled, params=params: self._evaluator(params, cancelled)
+            )
+            self._pending[future] = params
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        self._filler()
+        result = asyncio.get_running_loop().create_future()
+        if not self._pending:
+            result.set_exception(StopAsyncIteration())
+            return result
+
+        def resulter(waiter):
+            if result.done():
+                return
+            if self._cancelled:
+                return result.set_exception(StopAsyncIteration())
+            if waiter.cancelled():
+                return result.cancel()
+            future = waiter.result()[0].pop()
+            params = self._pending.pop(future, None)
+            if params is None or future.cancelled():
+                result.cancel()
+            elif future.exception() is not None:
+                result.set_exception(future.exception())
+            else:
+                result.set_result((params, future.result()))
+
+        waiter = self._waiter = asyncio.ensure_future(asyncio.wait(
+            list(self._pending), return_when=asyncio.FIRST_COMPLETED
+        ))
+        waiter.add_done_callback(resulter)
+        result.add_done_callback(lambda r: r.cancelled() and waiter.cancel())
+        return result
+
+    def cancel(self):
+        """ Cancels the pending runs and the wait for them, and exhausts the
+        iterator."""
+        self._cancelled = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._params = iter(())
+        if self._waiter is not None:
+            self._waiter.cancel()
+
+##******************************************
+##    ┬┌┬┐┌─┐┬─┐    ┬─┐┬ ┬┌┐┌┌─┐
+##    │ │ ├┤ ├┬┘    ├┬┘│ ││││└─┐
+##    ┴ ┴ └─┘┴└─────┴└─└─┘┘└┘└─┘
+def iter_runs(params_iterable, outputs=('diff_payback_period', 'unif_payback_period'),
+        instancer=None):
+    """ Generator of the slim records (dicts with keys `params`, `run_name`
+    and `outputs`) of the `CBACalculator` runs defined by the dicts of
+    parameters of `params_iterable`. Each record is yielded as soon as its
+    run is done, and the caches of the run (and of its sub-computers) are
+    cleared beforehand, so that memory does not grow with the number of
+    runs. Arrays are copied out of the caches for that purpose.
+
+    Testing/Example
+    ---------------
+    >>> for r in iter_runs(
+    ...     (dict(ph=4, ts=3, tu=2, dr=dr) for dr in (.0, .03, .05)),
+    ...     outputs   = ['NPV_total_unif_co2_flows_traj', 'unif_payback_period'],
+    ...     instancer = CBACalculator._testing_instancer,
+    ... ):
+    ...     print(r['params']['dr'], round(r['outputs']['NPV_total_unif_co2_flows_traj'][0, -1], 4), r['outputs']['unif_payback_period'])
+    0.0 -2240.3604 []
+    0.03 -2166.5644 []
+    0.05 -2120.9566 []
+    """
+    outputs   = list(outputs)
+    instancer = instancer or CBACalculator
+    for params in params_iterable:
+        cba    = instancer(**params)
+        values = dict(
+            (k, np.array(v) if isinstance(v, np.ndarray) else v)
+            for k, v in cba._outputs_evaluator(outputs).items()
+        )
+        record = {'params': params, 'run_name': cba.run_name, 'outputs': values}
+        cba._clear_caches(verbose=False)
+        del cba
+        yield record
+
+##******************************************
+##    ╔═╗╔╗ ╔═╗╔═╗┌┬┐┬ ┬┌┬┐┬ ┬╔═╗┬  ┌─┐┌┐┌┌┐┌┌─┐┬─┐
+##    ║  ╠╩╗╠═╣╚═╗ │ │ │ ││└┬┘╠═╝│  ├─┤││││││├┤ ├┬┘
+##    ╚═╝╚═╝╩ ╩╚═╝ ┴ └─┘─┴┘ ┴ ╩  ┴─┘┴ ┴┘└┘┘└┘└─┘┴└─
+class CBAStudyPlanner(object):
+    """ Planner of a study made of the `CBACalculator` runs defined by the
+    dicts of parameters `params_list`. Runs are grouped by the sub-computers
+    they can share (e.g. `VGCAndSOCDeltas` for the same land-use pair,
+    `CarbonAndCo2FlowsAnnualizer` for the same deltas and T values,
+    `Co2Prices` for the same scenario and window, `GlobalWarmingPotential`
+    for the same horizon, see `CBACalculator._caobjs_dependencies`), so that
+    each shared piece is computed once, and released after its last run.
+    The (not yet evaluated) instances built to group runs are those which
+    are run afterwards, each being dropped after its run.
+
+    Testing/Example
+    ---------------
+    Only the CO2 prices scenario differs between runs
+    >>> planner = CBAStudyPlanner(
+    ...     [dict(ph=4, ts=3, tu=2, sc=sc) for sc in ('O', 'A', 'B', 'O')],
+    ...     instancer = CBACalculator._testing_instancer,
+    ... )
+    >>> sorted(planner.builds.items())
+    [('carbon_and_co2_flows_traj_annualizer', 1), ('co2_prices_computer', 3), ('co2eq_computer', 1), ('deltas_computer', 1), ('input_flows_traj_computer', 1), ('land_surface_flows_traj_computer', 1), ('output_flows_traj_computer', 1)]
+    >>> planner.calculator(0) is planner.calculator(0)
+    True
+    >>> for r in planner.iter_runs(outputs=['NPV_total_unif_co2_flows_traj']):
+    ...     print(r['params']['sc'], round(r['outputs']['NPV_total_unif_co2_flows_traj'][0, -1], 4))
+    O -2166.5644
+    A -2240.3604
+    B -2278.1779
+    O -2166.5644
+    >>> planner._shared
+    {}
+    """
+
+    def __init__(self, params_list, instancer=None):
+        self.params_list = list(params_list)
+        self.instancer   = instancer or CBACalculator
+        self._shared     = {}
+        self._lasts      = {}
+        self._instances  = [self.instancer(**params) for params in self.params_list]
+        self.groups      = dict((key, {}) for key in CBACalculator._caobjs_dependencies)
+        for i, cba in enumerate(self._instances):
+            for key in self.groups:
+                sign = cba._caobjs_signature(key)
+                self.groups[key].setdefault(sign, []).append(i)
+                self._lasts[sign] = i
+
+    @property
+    def builds(self):
+        """ Number of sub-computers built per kind, instead of
+        `len(params_list)` each if runs were computed independently."""
+        return dict((key, len(signs)) for key, signs in self.groups.items())
+
+    def calculator(self, i):
+        """ Returns the `CBACalculator` instance of the run `i`, fed with
+        the sub-computers it shares with the other runs of the study."""
+        cba = self._instances[i] or self.instancer(**self.params_list[i])
+        for key in self.groups:
+            sign = cba._caobjs_signature(key)
+            if sign in self._shared:
+                cba._cache[key] = self._shared[sign]
+            elif len(self.groups[key][sign]) > 1:
+                self._shared[sign] = getattr(cba, key)
+        return cba
+
+    def iter_runs(self, outputs=('diff_payback_period', 'unif_payback_period')):
+        """ Generator of the slim records of the runs (see `iter_runs`), in
+        order. Shared sub-computers are dropped after their last run."""
+        outputs = list(outputs)
+        for i, params in enumerate(self.params_list):
+            cba    = self.calculator(i)
+            self._instances[i] = None
+            values = dict(
+                (k, np.array(v) if isinstance(v, np.ndarray) else v)
+                for k, v in cba._outputs_evaluator(outputs).items()
+            )
+            for key in self.groups:
+                sign = cba._caobjs_signature(key)
+                if self._lasts[sign] == i:
+                    self._shared.pop(sign, None)
+            yield {'params': params, 'run_name': cba.run_name, 'outputs': values}
+            del cba
+
+
 ##******************************************
 ##    ╔═╗╔╗ ╔═╗╔═╗┌─┐┬─┐┌─┐┌┬┐┌─┐┌┬┐┌─┐┬─┐┌─┐╔═╗┌┐┌┌┬┐┌─┐┌─┐┌─┐┌┐┌┬┌─┐┌─┐┬─┐
 ##    ║  ╠╩╗╠═╣╠═╝├─┤├┬┘├─┤│││├┤  │ ├┤ ├┬┘└─┐║╣ │││ │││ ││ ┬├┤ ││││┌─┘├┤ ├┬┘
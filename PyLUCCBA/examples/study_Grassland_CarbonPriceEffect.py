@@ -4,7 +4,7 @@ from PyLUCCBA.examples import studies_constant_settings as cs
 import PyLUCCBA as cc
 
 
-scenarizer = lambda name : cc.CBACalculator(
+scenarizer = lambda name : dict(
     run_name               = 'Grassland-Cropland_DR=0_CP=%s'%name,
     project_horizon        = 20,
     T_so                   = 20,
@@ -20,9 +20,12 @@ scenarizer = lambda name : cc.CBACalculator(
 
 co2_prices_scenarios = ['O', 'A', 'B', 'C', 'SPC2019']
 
+## deltas, annualization, flows and GWP are shared by all runs
+planner = cc.CBAStudyPlanner(map(scenarizer, co2_prices_scenarios))
+
 objects = {}
-for s_name in co2_prices_scenarios:    
-    cba = scenarizer(s_name)
+for i, s_name in enumerate(co2_prices_scenarios):
+    cba = planner.calculator(i)
     objects[cba.run_name] = {'summary':cba.summary_args,'object':cba}
 
 
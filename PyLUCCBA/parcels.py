@@ -0,0 +1,358 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'ParcelsGrid',
+]
+
+import numpy as np
+import os
+
+if __package__:
+    from . import core as cb
+else:
+    import core as cb
+
+##******************************************
+##    ╔═╗┌─┐┬─┐┌─┐┌─┐┬  ┌─┐╔═╗┬─┐┬┌┬┐
+##    ╠═╝├─┤├┬┘│  ├┤ │  └─┐║ ╦├┬┘│ ││
+##    ╩  ┴ ┴┴└─└─┘└─┘┴─┘└─┘╚═╝┴└─┴─┴┘
+class ParcelsGrid(object):
+    """ Spatial mode of the CBA, in which each parcel of a (possibly national)
+    raster is a project whose parameters are those of `calculator`, but for
+    its initial and final landuses, its area and, optionally, its local carbon
+    stocks. Parcels are read from arrays (typically `np.memmap`s) and their
+    outputs are written to memory-mapped arrays, chunk by chunk, so that the
+    peak memory only depends on `chunk_size` and on the project horizon,
+    whatever the number of parcels.
+
+    All the flows of a project are proportional to its size, and the carbon
+    flows of its land use change are, per hectare, those of its carbon stock
+    differentials (see `CarbonAndCo2FlowsAnnualizer`). Hence, per couple of
+    landuses, the NPVs of the inputs and of the black output are computed
+    once (see `kernel`), and so are, per final landuse, those of each
+    distinct soil and vegetation differential (see `unit_kernel`), every
+    parcel being then a linear combination of those kernels, scaled by its
+    area. The area of a parcel is that of the land surface of the project at
+    its first year.
+
+    The uniform annualization is linear in the differential, but the
+    differentiated one is not: the CRFs are parametrized per differential,
+    and e.g. the first-year soil co2 flows per unit of differential are 0.931
+    at -1, 0.917 at -5 and 0.939 at -30 (tonnes of carbon per HA). Tabulated
+    differentials are thus annualized as they are (so that parcels with
+    tabulated stocks are evaluated as their project would be), and local ones
+    once rounded to the nearest multiple of `stocks_resolution` (in tonnes of
+    carbon per HA), their flows being those of their rounded value scaled by
+    the differential. The error is then that of the variation of the unit
+    flows over half a `stocks_resolution`, which is not smooth: over 0.05,
+    it is typically of 0.1% of the largest (first-year) flows, but up to 6%.
+    It is null if `stocks_resolution` is None, each distinct local
+    differential being then annualized.
+
+    Outputs are, per annualization, the last values of `NPV_total_<a>` and
+    `NPV_total_<a>_minus_black_output`, and `<a>_payback_period` (NaN if none),
+    as in `CBACalculator.landuse_transitions_cube`.
+
+    Testing/Example
+    ---------------
+    >>> import tempfile
+    >>> d = tempfile.mkdtemp()
+    >>> o = cb.CBACalculator._testing_instancer(ph=4, tu=2)
+    >>> g = ParcelsGrid(
+    ...     o, ['improved grassland', 'forestland30', 'wheat', 'miscanthus'],
+    ...     chunk_size=2, annualizations=('unif', )
+    ... )
+
+    Parcels are given as arrays of codes, i.e. of indexes in `landuses`
+    >>> initial = np.memmap(os.path.join(d, 'initial.dat'), dtype=np.int8, mode='w+', shape=(5, ))
+    >>> final   = np.memmap(os.path.join(d, 'final.dat'), dtype=np.int8, mode='w+', shape=(5, ))
+    >>> area    = np.memmap(os.path.join(d, 'area.dat'), dtype=np.float32, mode='w+', shape=(5, ))
+    >>> initial[:], final[:], area[:] = [0, 1, 0, 2, 0], [2, 2, 3, 3, 2], [1., 1., 1., 1., 2.]
+    >>> out = g.run(initial, final, area, directory=d)
+    >>> sorted(out)
+    ['NPV_total_unif', 'NPV_total_unif_minus_black_output', 'unif_payback_period']
+    >>> type(out['NPV_total_unif']).__name__
+    'memmap'
+    >>> out['NPV_total_unif']
+    memmap([ -3784.91867478, -25547.87643522,  -2347.99585491,
+              -196.88760124,  -7569.83734956])
+
+    Up to the area, the first parcel is the project of `o`
+    >>> l0 = o.land_surface_flows_traj[0, 0]
+    >>> bool(np.isclose(out['NPV_total_unif'][0]*l0, o.NPV_total_unif_co2_flows_traj[0, -1]))
+    True
+
+    Results are memory-mapped `.npy` files, that can be re-opened later on
+    >>> np.load(os.path.join(d, 'unif_payback_period.npy'), mmap_mode='r')
+    memmap([nan, nan,  3., nan, nan])
+
+    Local carbon stocks (NaN where the tabulated ones apply) override those
+    of `resources/dluc/cs_changes_<country>.csv`
+    >>> vgc = np.array([np.nan, 60., np.nan, np.nan, np.nan])
+    >>> g.run(initial, final, area, initial_vgc=vgc)['NPV_total_unif'][:2]
+    array([ -3784.91867478, -18757.82206629])
+    """
+
+    def __init__(self, calculator, landuses, chunk_size=100000,
+                 annualizations=('diff', 'unif'), input_flows_scenarios=None,
+                 stocks_resolution=.1):
+        self.calculator     = calculator
+        self.landuses       = calculator._landuses_checker(
+            landuses, calculator.deltas_computer.landuses
+        )
+        self.chunk_size     = int(chunk_size)
+        self.stocks_resolution = stocks_resolution
+        self.annualizations = tuple(annualizations)
+        for a in self.annualizations:
+            if a not in ('diff', 'unif'):
+                raise ValueError('Unknown annualization: %s'%a)
+        self.input_flows_scenarios = dict(
+            (k.upper(), v.upper()) for k, v in (input_flows_scenarios or {}).items()
+        )
+        self.outputs = []
+        for a in self.annualizations:
+            self.outputs += [
+                'NPV_total_%s'%a,
+                'NPV_total_%s_minus_black_output'%a,
+                '%s_payback_period'%a,
+            ]
+        specs = calculator.deltas_computer.vegetations_and_so_specificities
+        self.vgc_stocks = np.array([
+            float(specs.vegetation_carbon_stock_specificities['values'][l])
+            for l in self.landuses
+        ])
+        self.soc_stocks = np.array([
+            float(specs.soil_carbon_stock_specificities['values'][l])
+            for l in self.landuses
+        ])
+        self._kernels       = {}
+        self._final_kernels = {}
+        self._unit_kernels  = {}
+        self._annualizers   = {}
+
+    def _final_kernel(self, code):
+        """ Parts of the kernels which only depend on the final landuse,
+        `landuses[code]`, computed once per final landuse."""
+        if code in self._final_kernels:
+            return self._final_kernels[code]
+        calc          = self.calculator
+        final_landuse = self.landuses[code]
+        if final_landuse not in calc.land_surface_flows_traj_computer.eligible_scenarios:
+            raise ValueError('Unknown landuse(s): %s'%final_landuse)
+        base = calc.fork(
+            final_landuse        = final_landuse,
+            input_flows_scenario = self.input_flows_scenarios.get(
+                final_landuse,
+                calc._transitions_input_flows_scenario(final_landuse)
+            )
+        ) if final_landuse != calc.final_landuse\
+             or final_landuse in self.input_flows_scenarios else calc
+        per_ha = 1./base.land_surface_flows_traj[0, 0]
+        kernel = {
+            'base'        : base,
+            'inputs'      : per_ha*base.NPV_proc_plus_cult_co2_flows_traj[0],
+            'black_output': per_ha*base.NPV_black_output_co2_flows_traj[0],
+            'disc_values' : per_ha*base.land_surface_flows_traj\
+                            *cb.ts.dict_time_serie_as_row_array(
+                                base.co2eq_computer.co2eq_yields_GWP_traj_computer(
+                                    {'CO2':1., 'N2O':.0, 'CH4':.0}
+                                )
+                            )*base.co2_prices_traj*base.discounting_factors,
+        }
+        self._final_kernels[code] = kernel
+        return kernel
+
+    def _annualizer(self, delta_soc, delta_vgc, final_landuse, project_horizon):
+        key = (delta_soc, delta_vgc, final_landuse, project_horizon)
+        if key not in self._annualizers:
+            calc = self.calculator
+            self._annualizers[key] = cb.CarbonAndCo2FlowsAnnualizer(
+                delta_soc       = delta_soc,
+                delta_vgc       = delta_vgc,
+                final_landuse   = final_landuse,
+                project_horizon = project_horizon,
+                T_so            = calc.T_so,
+                T_vg_diff       = calc.T_vg_diff,
+                T_vg_unif       = calc.T_vg_unif,
+                verbose         = calc.verbose,
+                dtype           = calc.dtype,
+                from_local_data = calc.from_local_data
+            )
+        return self._annualizers[key]
+
+    def unit_kernel(self, final_code, key, delta):
+        """ Cumulated NPVs (over the horizon of the project) of the `key`
+        ('so' for soil, 'vg' for vegetation) co2 flows of the parcels which go
+        to `landuses[final_code]` with a carbon stock differential `delta`,
+        per hectare and per unit of differential, as a dict of 1-d arrays
+        keyed by annualization. Computed once per final landuse, `key` and
+        `delta`.
+
+        Testing/Example
+        ---------------
+        >>> o = cb.CBACalculator._testing_instancer(ph=4, tu=2)
+        >>> g = ParcelsGrid(o, ['wheat', 'miscanthus'], annualizations=('unif', ))
+        >>> bool(np.allclose(g.unit_kernel(1, 'so', -1.)['unif'], g.unit_kernel(1, 'so', -5.)['unif']))
+        True
+        >>> g.unit_kernel(1, 'vg', 0.)
+        {'unif': array([0., 0., 0., 0., 0.])}
+        """
+        ukey = (final_code, key, delta)
+        if ukey in self._unit_kernels:
+            return self._unit_kernels[ukey]
+        final  = self._final_kernel(final_code)
+        kernel = {}
+        if delta == 0:
+            for a in self.annualizations:
+                kernel[a] = np.zeros(final['disc_values'].shape[1])
+        else:
+            annualizer = self._annualizer(
+                delta, delta, self.landuses[final_code],
+                final['base'].project_horizon
+            )
+            for a in self.annualizations:
+                kernel[a] = np.cumsum(
+                    getattr(annualizer, '%sco2_unit_%s_flows_traj'%(key, a))/delta
+                    *final['disc_values'], axis=1
+                )[0]
+        self._unit_kernels[ukey] = kernel
+        return kernel
+
+    def kernel(self, initial_code, final_code):
+        """ Cumulated NPVs (over the horizon of the project) of the parcels
+        which go from `landuses[initial_code]` to `landuses[final_code]`, per
+        hectare, as a dict of
+            inputs       inputs (i.e. processed and cultivated) co2 flows
+            black_output co2 flows of the black output
+            delta_<k>    tabulated soil (k='so') and vegetation (k='vg')
+                         carbon stock differentials
+            <k>_<a>      unit kernels of the tabulated differentials (see
+                         `unit_kernel`)
+        Kernels are computed once per couple of landuses."""
+        key = (initial_code, final_code)
+        if key in self._kernels:
+            return self._kernels[key]
+        kernel = dict(self._final_kernel(final_code))
+        for k, stocks in (('so', self.soc_stocks), ('vg', self.vgc_stocks)):
+            delta = float(stocks[final_code] - stocks[initial_code])
+            kernel['delta_%s'%k] = delta
+            unit = self.unit_kernel(final_code, k, delta)
+            for a in self.annualizations:
+                kernel['%s_%s'%(k, a)] = unit[a]
+        self._kernels[key] = kernel
+        return kernel
+
+    def _rounder(self, deltas, tabulated):
+        """ `deltas` rounded to the nearest (non-null, unless they are)
+        multiples of `stocks_resolution`, but for the `tabulated` ones."""
+        r = self.stocks_resolution
+        if not r:
+            return deltas
+        rounded = r*np.round(deltas/r)
+        rounded = np.where((rounded == 0) & (deltas != 0), r*np.sign(deltas), rounded)
+        return np.where(deltas == tabulated, deltas, rounded)
+
+    def _opener(self, directory, n, dtype):
+        if directory is None:
+            return dict((k, np.empty(n, dtype=dtype)) for k in self.outputs)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        return dict(
+            (k, np.lib.format.open_memmap(
+                os.path.join(directory, '%s.npy'%k),
+                mode='w+', dtype=dtype, shape=(n, )
+            )) for k in self.outputs
+        )
+
+    def run(self, initial_landuse, final_landuse, area, directory=None,
+            initial_vgc=None, initial_soc=None, final_vgc=None, final_soc=None,
+            dtype=np.float64):
+        """ Evaluates all the parcels and returns their outputs, as a dict of
+        1-d arrays. Parcels are defined by the (equally long) 1-d arrays
+            initial_landuse  codes (indexes in `landuses`) of the initial landuses
+            final_landuse    codes of the final landuses
+            area             areas, in HA
+            initial_vgc, ... optional local carbon stocks, NaN where the
+                             tabulated stocks of the landuse apply
+        If `directory` is given, outputs are memory-mapped `<output>.npy`
+        files of that directory, flushed after each chunk. Inputs are only
+        read chunk by chunk. Codes out of `landuses` (e.g. the -1 of nodata
+        cells) are refused.
+
+        Testing/Example
+        ---------------
+        >>> o = cb.CBACalculator._testing_instancer(ph=4, tu=2)
+        >>> g = ParcelsGrid(o, ['wheat', 'miscanthus'], annualizations=('unif', ))
+        >>> g.run([0, -1, 0, 1], [1, 1, 2, 1], [1., 1., 1., 1.])
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown landuse code(s) at cell(s): 1, 2
+        """
+        n   = len(area)
+        out = self._opener(directory, n, dtype)
+        for start in range(0, n, self.chunk_size):
+            chunk   = slice(start, min(start + self.chunk_size, n))
+            initial = np.asarray(initial_landuse[chunk], dtype=np.intp)
+            final   = np.asarray(final_landuse[chunk], dtype=np.intp)
+            unknown = np.where(
+                (initial < 0) | (initial >= len(self.landuses))
+                | (final < 0) | (final >= len(self.landuses))
+            )[0]
+            if len(unknown):
+                raise ValueError('Unknown landuse code(s) at cell(s): %s'%', '.join(
+                    str(start + i) for i in unknown
+                ))
+            areas   = np.asarray(area[chunk], dtype=np.float64)
+            deltas  = {}
+            for key, stocks, initial_local, final_local in (
+                ('vg', self.vgc_stocks, initial_vgc, final_vgc),
+                ('so', self.soc_stocks, initial_soc, final_soc),
+            ):
+                ini, fin = stocks[initial], stocks[final]
+                if initial_local is not None:
+                    local = np.asarray(initial_local[chunk], dtype=np.float64)
+                    ini   = np.where(np.isnan(local), ini, local)
+                if final_local is not None:
+                    local = np.asarray(final_local[chunk], dtype=np.float64)
+                    fin   = np.where(np.isnan(local), fin, local)
+                deltas[key] = fin - ini
+            pairs = initial*len(self.landuses) + final
+            for pair in np.unique(pairs):
+                initial_code, final_code = divmod(int(pair), len(self.landuses))
+                kernel = self.kernel(initial_code, final_code)
+                where  = np.where(pairs == pair)[0]
+                scale  = areas[where][:, None]
+                NPVs   = dict(
+                    (a, np.repeat(kernel['inputs'][None, :], len(where), axis=0))
+                    for a in self.annualizations
+                )
+                for key in ('so', 'vg'):
+                    delta   = deltas[key][where]
+                    rounded = self._rounder(delta, kernel['delta_%s'%key])
+                    for d in np.unique(rounded):
+                        sub  = np.where(rounded == d)[0]
+                        unit = self.unit_kernel(final_code, key, float(d))
+                        for a in self.annualizations:
+                            NPVs[a][sub] += delta[sub][:, None]*unit[a][None, :]
+                for a in self.annualizations:
+                    NPV             = NPVs[a]
+                    NPV_minus_black = scale*(NPV - kernel['black_output'][None, :])
+                    NPV             = scale*NPV
+                    s_ = np.sign(NPV_minus_black)
+                    s  = np.cumsum(np.roll(s_, 1, axis=1) != s_, axis=1)
+                    out['NPV_total_%s'%a][start + where] = NPV[:, -1]
+                    out['NPV_total_%s_minus_black_output'%a][start + where]\
+                        = NPV_minus_black[:, -1]
+                    out['%s_payback_period'%a][start + where] = np.where(
+                        s[:, -1] >= 2, np.argmax(s >= 2, axis=1), np.nan
+                    )
+            for v in out.values():
+                if hasattr(v, 'flush'):
+                    v.flush()
+        return out
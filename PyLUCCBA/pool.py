@@ -0,0 +1,473 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'AdaptiveExecutor',
+    'SharedArray',
+    'WarmPool',
+]
+
+import multiprocessing as mp
+import numpy as np
+import collections
+import threading
+import pickle
+import time
+import gc
+
+try:
+    from multiprocessing import shared_memory as shm
+    from multiprocessing import resource_tracker
+except ImportError: ## py<3.8
+    shm = resource_tracker = None
+
+if __package__:
+    from . import core as cb
+    from . import serve as sv
+else:
+    import core as cb
+    import serve as sv
+
+VERBOSE_DTESTS = False
+
+_WARM_SERVICE = None
+
+def _warm_service(warm_params, outputs, service=None):
+    """ Returns `service` (or a new one) once it keeps warm the resources and
+    sub-computers (GWP tables, annualization kernels, etc.) implied by
+    `warm_params`. Solver messages are muted meanwhile."""
+    service = service or sv.CBAService(batch_window=0)
+    verbose = cb.VERBOSE_SOLVER
+    cb.VERBOSE_SOLVER = False
+    try:
+        for params in warm_params:
+            service.evaluate(params, outputs)
+    finally:
+        cb.VERBOSE_SOLVER = verbose
+    return service
+
+def _installer(service):
+    """ Initializer of the forked workers, which sets `service` (inherited
+    from the parent process) as the one they evaluate runs with."""
+    global _WARM_SERVICE
+    cb.VERBOSE_SOLVER = False
+    _WARM_SERVICE = service
+
+def _warmer(warm_params, outputs):
+    """ Initializer of the (non-forked) workers, which warm up their own
+    service."""
+    _installer(_warm_service(warm_params, outputs))
+
+def _service_evaluator(service, params, outputs, shared=False):
+    """ Returns the record of the run defined by `params`, i.e. the (raw)
+    values of `outputs`, whose arrays are written in shared memory blocks
+    if `shared`."""
+    try:
+        cba = service.instance(**params)
+        values = cba._outputs_evaluator(outputs)
+        service.warmer(cba)
+        if shared:
+            values = dict(
+                (k, _sharer(v)) for k, v in values.items()
+            )
+        return {'run_name': cba.run_name, 'outputs': values}
+    except Exception as e:
+        return {'error': repr(e)}
+
+def _evaluator(args):
+    """ Function run by the workers."""
+    params, outputs, shared = args
+    return _service_evaluator(_WARM_SERVICE, params, outputs, shared)
+
+def _sharer(value):
+    """ Copies the array `value` into a new shared memory block, and
+    returns the (name, shape, dtype) of the block. The ownership of the
+    block is handed over to the process that attaches it (see `_attacher`).
+    The block stays registered with the resource tracker (shared with the
+    parent process), which unlinks it if it is never attached."""
+    if not isinstance(value, np.ndarray) or not value.nbytes:
+        return value
+    block = shm.SharedMemory(create=True, size=value.nbytes)
+    np.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+    name = block.name
+    block.close()
+    return _SharedBlock(name, value.shape, value.dtype.str)
+
+def _attacher(value):
+    """ Returns a `SharedArray` view of the block described by `value`.
+    The block is unlinked straight away, its memory being released once
+    the view (and all views derived from it) are garbage-collected."""
+    if not isinstance(value, _SharedBlock):
+        return value
+    block = shm.SharedMemory(name=value.name)
+    array = np.ndarray(
+        value.shape, np.dtype(value.dtype), buffer=block.buf
+    ).view(SharedArray)
+    array.block = block
+    block.unlink()
+    return array
+
+def _unlinker(value):
+    """ Unlinks the block described by `value`, if any, without attaching
+    it. Returns whether a block has been unlinked."""
+    if not isinstance(value, _SharedBlock):
+        return False
+    try:
+        block = shm.SharedMemory(name=value.name)
+    except OSError: ## already unlinked
+        return False
+    block.close()
+    block.unlink()
+    return True
+
+class _SharedBlock(tuple):
+    """ (name, shape, dtype) of a shared memory block holding an array."""
+    __slots__ = ()
+    def __new__(cls, name, shape, dtype):
+        return tuple.__new__(cls, (name, shape, dtype))
+    def __getnewargs__(self):
+        return tuple(self)
+    name  = property(lambda self: self[0])
+    shape = property(lambda self: self[1])
+    dtype = property(lambda self: self[2])
+
+##******************************************
+##    ╔═╗┬ ┬┌─┐┬─┐┌─┐┌┬┐╔═╗┬─┐┬─┐┌─┐┬ ┬
+##    ╚═╗├─┤├─┤├┬┘├┤  ││╠═╣├┬┘├┬┘├─┤└┬┘
+##    ╚═╝┴ ┴┴ ┴┴└─└─┘─┴┘╩ ╩┴└─┴└─┴ ┴ ┴
+class SharedArray(np.ndarray):
+    """ Zero-copy view of an array written by a worker in a shared memory
+    block. The view keeps the block mapped (through `block`) for as long as
+    it, or any array derived from it, is alive."""
+
+    def __array_finalize__(self, obj):
+        self.block = getattr(obj, 'block', None)
+
+def _warmth(*args):
+    """ Number of sub-computers kept warm in the current process."""
+    return len(_WARM_SERVICE.warm_keys) if _WARM_SERVICE else 0
+
+##******************************************
+##    ╦ ╦┌─┐┬─┐┌┬┐╔═╗┌─┐┌─┐┬
+##    ║║║├─┤├┬┘│││╠═╝│ ││ ││
+##    ╚╩╝┴ ┴┴└─┴ ┴╩  └─┘└─┘┴─┘
+class WarmPool(object):
+    """ Pool of worker processes that are forked once the parent process has
+    imported numpy/scipy and loaded the resources and sub-computers (parsed
+    CSVs, GWP tables, annualization kernels, etc.) implied by `warm_params`.
+    Workers thus inherit them copy-on-write instead of re-importing and
+    re-parsing everything. Where `fork` is not available (e.g. Windows),
+    each worker warms itself up at start. The state of the parent process
+    (solver verbosity, garbage collector, etc.) is left as it was.
+
+    Testing/Example
+    ---------------
+    >>> base = sv.TESTING_PARAMS
+    >>> verbose = cb.VERBOSE_SOLVER
+    >>> with WarmPool(processes=2, warm_params=[base]) as pool:
+    ...     warmths = pool.warmths()
+    ...     records = pool.map(
+    ...         [dict(base, discount_rate=dr) for dr in (.0, .03)],
+    ...         outputs=['NPV_total_unif_co2_flows_traj']
+    ...     )
+    >>> warmths
+    [6, 6]
+    >>> [round(float(r['outputs']['NPV_total_unif_co2_flows_traj'][0, -1]), 4) for r in records]
+    [-4926.8786, -3740.3823]
+
+    The parent process is left as it was
+    >>> _WARM_SERVICE is None, cb.VERBOSE_SOLVER == verbose, gc.get_freeze_count()
+    (True, True, 0)
+
+    With `shared_memory=True` (py>=3.8), arrays are sent back through shared
+    memory blocks instead of being pickled, and come as zero-copy views
+    >>> with WarmPool(processes=2, warm_params=[base], shared_memory=True) as pool:
+    ...     shared_records = pool.map(
+    ...         [dict(base, discount_rate=dr) for dr in (.0, .03)],
+    ...         outputs=['NPV_total_unif_co2_flows_traj', 'horizon']
+    ...     )
+    >>> npvs = [r['outputs']['NPV_total_unif_co2_flows_traj'] for r in shared_records]
+    >>> [type(npv).__name__ for npv in npvs]
+    ['SharedArray', 'SharedArray']
+    >>> all(
+    ...     np.array_equal(npv, r['outputs']['NPV_total_unif_co2_flows_traj'])
+    ...     for npv, r in zip(npvs, records)
+    ... )
+    True
+    >>> shared_records[0]['outputs']['horizon'][:3]
+    [2020, 2021, 2022]
+
+    The blocks of the records that are never read are unlinked on `close`
+    >>> with WarmPool(processes=2, warm_params=[base], shared_memory=True) as pool:
+    ...     first = next(pool.imap(
+    ...         [dict(base, discount_rate=dr) for dr in (.0, .01, .03)],
+    ...         outputs=['NPV_total_unif_co2_flows_traj']
+    ...     ))
+    >>> pool.unread_blocks
+    2
+    """
+
+    def __init__(self, processes=None, warm_params=(), outputs=None,
+                 shared_memory=False, service=None):
+        if shared_memory and shm is None:
+            raise RuntimeError('shared_memory requires python>=3.8')
+        self.shared    = bool(shared_memory)
+        self.unread_blocks = 0
+        self._iterators    = []
+        if self.shared:
+            resource_tracker.ensure_running() ## shared with the workers
+        self.outputs   = list(outputs or sv.DEFAULT_OUTPUTS)
+        self.processes = processes or mp.cpu_count()
+        methods        = mp.get_all_start_methods()\
+                         if hasattr(mp, 'get_all_start_methods') else ['fork']
+        self.forked    = 'fork' in methods
+        if self.forked:
+            service = _warm_service(warm_params, self.outputs, service)
+            frozen  = hasattr(gc, 'freeze') and not gc.get_freeze_count()
+            if frozen:
+                gc.freeze() ## keeps the gc of the workers from touching (i.e. copying) inherited pages
+            try:
+                context = mp.get_context('fork') if hasattr(mp, 'get_context') else mp
+                self._pool = context.Pool(
+                    self.processes,
+                    initializer = _installer,
+                    initargs    = (service, )
+                )
+            finally:
+                if frozen:
+                    gc.unfreeze() ## the workers have been forked already
+        else:
+            self._pool = mp.Pool(
+                self.processes,
+                initializer = _warmer,
+                initargs    = (list(warm_params), self.outputs)
+            )
+
+    def warmths(self):
+        """ Numbers of sub-computers kept warm in each worker."""
+        return self._pool.map(_warmth, range(self.processes), chunksize=1)[:self.processes]
+
+    def imap(self, params_iterable, outputs=None, chunksize=1):
+        """ Iterator over the records (i.e. dicts with keys `run_name` and
+        `outputs`, or `error`) of the runs defined by `params_iterable`,
+        in order. If the pool has been built with `shared_memory=True`,
+        arrays are `SharedArray` views of the blocks written by the workers,
+        and the blocks of the records that are not read by the time the pool
+        is closed are unlinked then (see `close`)."""
+        outputs = sv.CBAService.outputs_checker(outputs or self.outputs)
+        records = self._pool.imap(
+            _evaluator,
+            ((p, outputs, self.shared) for p in params_iterable),
+            chunksize
+        )
+        if not self.shared:
+            return records
+        self._iterators.append(records)
+        return (self._attached(record) for record in records)
+
+    @staticmethod
+    def _attached(record):
+        if 'outputs' in record:
+            record['outputs'] = dict(
+                (k, _attacher(v)) for k, v in record['outputs'].items()
+            )
+        return record
+
+    def map(self, params_iterable, outputs=None, chunksize=1):
+        """ List version of `imap`."""
+        return list(self.imap(params_iterable, outputs, chunksize))
+
+    def close(self):
+        """ Waits for the workers to be done, and unlinks the shared memory
+        blocks of the records that have not been read, whose number is kept
+        in `unread_blocks`."""
+        self._pool.close()
+        self._pool.join()
+        for records in self._iterators:
+            while True:
+                try:
+                    record = records.next(timeout=0)
+                except (StopIteration, mp.TimeoutError):
+                    break
+                for value in record.get('outputs', {}).values():
+                    self.unread_blocks += _unlinker(value)
+        self._iterators = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+##******************************************
+##    ╔═╗┌┬┐┌─┐┌─┐┌┬┐┬┬  ┬┌─┐╔═╗─┐ ┬┌─┐┌─┐┬ ┬┌┬┐┌─┐┬─┐
+##    ╠═╣ ││├─┤├─┘ │ │└┐┌┘├┤ ║╣ ┌┴┬┘├┤ │  │ │ │ │ │├┬┘
+##    ╩ ╩─┴┘┴ ┴┴   ┴ ┴ └┘ └─┘╚═╝┴ └─└─┘└─┘└─┘ ┴ └─┘┴└─
+class AdaptiveExecutor(object):
+    """ Batch executor that chooses between serial, thread-pool and
+    process-pool (`WarmPool`) execution by itself. The first `pilot_size`
+    runs of a batch are timed serially, so as to get the cost of one run
+    (and of the transfer of its record between processes), and the next
+    `max_workers` runs are timed on threads, so as to get the speedup that
+    threads actually achieve (numpy releasing the GIL in vector operations,
+    threads pay off for long-horizon runs). The rest of the batch is then
+    run with the executor that is expected to be the fastest (see `planner`).
+
+    Testing/Example
+    ---------------
+    >>> base = sv.TESTING_PARAMS
+    >>> executor = AdaptiveExecutor(max_workers=2)
+    >>> records = executor.map(
+    ...     [dict(base, discount_rate=dr) for dr in (.0, .03)],
+    ...     outputs=['NPV_total_unif_co2_flows_traj']
+    ... )
+    >>> executor.plan['executor']
+    'serial'
+    >>> [round(float(r['outputs']['NPV_total_unif_co2_flows_traj'][0, -1]), 4) for r in records]
+    [-4926.8786, -3740.3823]
+    """
+
+    #: Runs taking less than that (in seconds) in total are run serially.
+    min_parallel_time  = 1.
+    #: Estimated start-up cost (in seconds) of one worker process.
+    process_start_cost = .05
+    #: Targeted duration (in seconds) of the chunks sent to worker processes.
+    chunk_time         = .1
+
+    def __init__(self, max_workers=None, pilot_size=3, outputs=None,
+                 shared_memory=False, service=None):
+        self.max_workers   = max_workers or mp.cpu_count()
+        self.pilot_size    = max(1, pilot_size)
+        self.outputs       = list(outputs or sv.DEFAULT_OUTPUTS)
+        self.shared_memory = shared_memory
+        self.service       = service or sv.CBAService(batch_window=0)
+        self.plan          = None
+
+    @classmethod
+    def planner(cls, nb_runs, cost, transfer=0., thread_speedup=1., workers=1):
+        """ Returns the execution plan of `nb_runs` runs which take `cost`
+        seconds each, given the `transfer` time of one record between
+        processes and the speedup measured on `workers` threads.
+
+        Testing/Example
+        ---------------
+        Few and cheap runs
+        >>> AdaptiveExecutor.planner(nb_runs=20, cost=.02, workers=4)['executor']
+        'serial'
+
+        Many small runs, that threads do not speed up
+        >>> plan = AdaptiveExecutor.planner(
+        ...     nb_runs=5000, cost=.02, transfer=.0001, thread_speedup=1.05, workers=4
+        ... )
+        >>> plan['executor'], plan['chunksize']
+        ('process', 5)
+
+        Long-horizon runs, mostly spent in vector operations
+        >>> plan = AdaptiveExecutor.planner(
+        ...     nb_runs=200, cost=.15, transfer=.05, thread_speedup=3.6, workers=4
+        ... )
+        >>> plan['executor'], plan['chunksize']
+        ('thread', 1)
+        """
+        times = {'serial': nb_runs*cost}
+        if times['serial'] >= cls.min_parallel_time and workers > 1:
+            times['thread']  = nb_runs*cost/max(thread_speedup, 1.)
+            times['process'] = workers*cls.process_start_cost\
+                               + nb_runs*(cost/workers + transfer)
+        executor  = min(times, key=lambda k: (times[k], k != 'serial'))
+        chunksize = 1
+        if executor == 'process':
+            chunksize = max(1, min(
+                int(cls.chunk_time/max(cost, 1e-9)), nb_runs//(4*workers)
+            ))
+        return {
+            'executor' : executor,
+            'chunksize': chunksize,
+            'workers'  : 1 if executor == 'serial' else workers,
+            'estimates': times,
+        }
+
+    def _serial(self, params_list, outputs):
+        return [
+            _service_evaluator(self.service, params, outputs)
+            for params in params_list
+        ]
+
+    def _timed(self, params_list, outputs):
+        """ Runs the (non-empty) `params_list` serially and returns the
+        records, the cost of one run and the time needed to transfer one
+        record between processes."""
+        records, times = [], []
+        for params in params_list:
+            t0 = time.time()
+            records.extend(self._serial([params], outputs))
+            times.append(time.time() - t0)
+        cost = float(np.median(times[1:] if len(times) > 1 else times))
+        t0 = time.time()
+        pickle.loads(pickle.dumps(records[-1], protocol=-1))
+        return records, cost, time.time() - t0
+
+    def _threaded(self, params_list, outputs, workers):
+        """ Runs `params_list` on `workers` threads, each one with its own
+        service fed with the sub-computers kept warm so far."""
+        local = threading.local()
+        def evaluator(params):
+            if not hasattr(local, 'service'):
+                local.service = sv.CBAService(
+                    max_warm=self.service.max_warm, batch_window=0
+                )
+                local.service._warm = collections.OrderedDict(self.service._warm)
+            return _service_evaluator(local.service, params, outputs)
+        with cb.cf.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(evaluator, params_list))
+
+    def map(self, params_iterable, outputs=None):
+        """ Returns the records (i.e. dicts with keys `run_name` and
+        `outputs`, or `error`) of the runs defined by `params_iterable`, in
+        order. The chosen plan is kept in `plan`."""
+        outputs     = sv.CBAService.outputs_checker(outputs or self.outputs)
+        params_list = list(params_iterable)
+        if not params_list:
+            return []
+        verbose = cb.VERBOSE_SOLVER
+        cb.VERBOSE_SOLVER = False
+        try:
+            return self._mapper(params_list, outputs)
+        finally:
+            cb.VERBOSE_SOLVER = verbose
+
+    def _mapper(self, params_list, outputs):
+        """ Times the pilot runs, plans and runs the rest of `params_list`."""
+        records, cost, transfer = self._timed(
+            params_list[:self.pilot_size], outputs
+        )
+        rest    = params_list[self.pilot_size:]
+        workers = min(self.max_workers, len(rest))
+        self.plan = self.planner(len(rest), cost, transfer, 1., workers)
+        if self.plan['executor'] == 'serial':
+            return records + self._serial(rest, outputs)
+
+        t0 = time.time()
+        records += self._threaded(rest[:workers], outputs, workers)
+        thread_speedup = workers*cost/max(time.time() - t0, 1e-9)
+        rest = rest[workers:]
+        self.plan = self.planner(
+            len(rest), cost, transfer, thread_speedup,
+            min(self.max_workers, len(rest))
+        )
+        if self.plan['executor'] == 'serial':
+            return records + self._serial(rest, outputs)
+        if self.plan['executor'] == 'thread':
+            return records + self._threaded(rest, outputs, self.plan['workers'])
+        with WarmPool(
+            processes     = self.plan['workers'],
+            outputs       = outputs,
+            shared_memory = self.shared_memory,
+            service       = self.service,
+        ) as pool:
+            return records + pool.map(rest, outputs, self.plan['chunksize'])
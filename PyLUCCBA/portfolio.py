@@ -0,0 +1,201 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'ProjectsPortfolio',
+]
+
+import numpy as np
+
+if __package__:
+    from . import core as cb
+else:
+    import core as cb
+
+##******************************************
+##    ╔═╗┬─┐┌─┐ ┬┌─┐┌─┐┌┬┐┌─┐╔═╗┌─┐┬─┐┌┬┐┌─┐┌─┐┬  ┬┌─┐
+##    ╠═╝├┬┘│ │ │├┤ │   │ └─┐╠═╝│ │├┬┘ │ ├┤ │ ││  ││ │
+##    ╩  ┴└─└─┘└┘└─┘└─┘ ┴ └─┘╩  └─┘┴└─ ┴ └  └─┘┴─┘┴└─┘
+class ProjectsPortfolio(object):
+    """ Portfolio of projects which only differ from that of `calculator` by
+    their first year and their size, e.g. the cohorts of a national
+    deployment pathway. `cohorts` maps first years to sizes (multiples of
+    the project of `calculator`), or is an iterable of (first year, size)
+    couples, sizes of a same year being added up.
+
+    The unit (i.e. per HA) land use flows of a project only depend on the
+    years elapsed since its land use change, and are computed once, by the
+    annualizer of `calculator`. All the trajectories which depend on calendar
+    years (land surfaces, inputs, black output, prices and discounting) are
+    computed once over the whole period of the portfolio, by a single fork of
+    `calculator`. The aggregated flows of all the cohorts are then the
+    convolutions of their sizes with the unit flows, times the calendar
+    trajectories.
+
+    Testing/Example
+    ---------------
+    >>> o = cb.CBACalculator._testing_instancer(ph=4, tu=2)
+    >>> p = ProjectsPortfolio(o, {2020: 1., 2022: 2.}, annualizations=('unif', ))
+    >>> p.years
+    [2020, 2021, 2022, 2023, 2024, 2025, 2026]
+    >>> c = p.co2_flows_cube
+    >>> c.names, c.shape
+    (('component', 'annualization', 'metric', 'year'), (8, 1, 4, 7))
+    >>> c.sel(component='total', annualization='unif', metric='NPV')
+    array([ -448.12796479,  -958.34294031, -2006.11383221, -3165.01908413,
+           -3658.53694377, -4030.01805322, -4239.07134176])
+
+    Discounted to their own first year, the NPVs of the cohorts are those
+    of their own project, times their sizes
+    >>> p.cohorts_NPV('unif')
+    array([-1469.25113087, -2938.50226173])
+    >>> 2*o.fork(project_first_year=2022).NPV_total_unif_co2_flows_traj[0, -1]
+    -2938.502261732502
+    """
+
+    #: Labels of the axes of `co2_flows_cube`, years aside.
+    co2_cube_components = cb.CBACalculator.co2_cube_components
+    co2_cube_metrics    = ('flows', 'values', 'disc_values', 'NPV')
+
+    def __init__(self, calculator, cohorts, annualizations=('diff', 'unif')):
+        self.calculator     = calculator
+        self.annualizations = tuple(annualizations)
+        for a in self.annualizations:
+            if a not in ('diff', 'unif'):
+                raise ValueError('Unknown annualization: %s'%a)
+        sizes = {}
+        for first_year, size in (
+            cohorts.items() if isinstance(cohorts, dict) else cohorts
+        ):
+            sizes[int(first_year)] = sizes.get(int(first_year), 0.) + size
+        self.first_years = sorted(sizes)
+        self.sizes       = np.array([sizes[y] for y in self.first_years])
+        self.offsets     = np.array(self.first_years) - self.first_years[0]
+        self.calendar    = calculator.fork(
+            project_first_year = self.first_years[0],
+            project_horizon    = calculator.project_horizon\
+                                 - calculator.project_timing\
+                                 + int(self.offsets[-1])
+        )
+        self.years = self.calendar.horizon
+        self._co2_flows_cube = None
+
+    def _convolved(self, kernel):
+        """ Sum over cohorts of `kernel` (a row indexed by the years elapsed
+        since their land use change), shifted to their first years and
+        weighted by their sizes, as a row over `years`."""
+        n     = len(self.years)
+        sizes = np.zeros(n)
+        np.add.at(sizes, self.offsets, self.sizes)
+        return np.convolve(sizes, kernel.ravel())[None, :n]
+
+    def _windowed(self, row):
+        """ (Cohort x year)-array of the values of `row` (indexed by `years`)
+        over the horizon of each cohort."""
+        H = self.calculator.project_horizon
+        return row.ravel()[self.offsets[:, None] + np.arange(H)[None, :]]
+
+    def _masks(self):
+        """ Masks of the years of the horizon of a project at which its
+        cultivated inputs, and its processed inputs and black output, are
+        accounted for (see `timed_cult_input_co2eq_flows_traj` and
+        `timed_proc_input_co2eq_flows_traj` of `CBACalculator`)."""
+        calc       = self.calculator
+        cultivated = np.ones((1, calc.project_horizon))
+        produced   = np.ones((1, calc.project_horizon))
+        if calc.project_timing:
+            cultivated[:, -calc.project_timing:] = 0.
+            produced[:, :calc.project_timing]    = 0.
+        return {'cult': cultivated, 'proc': produced, 'black_output': produced}
+
+    def _calendar_flows(self):
+        """ Flows of a project over `years`, as if it were running all along,
+        i.e. before masking."""
+        calc = self.calendar
+        return {
+            'cult'        : calc.cultivated_input_co2eq_flows_traj,
+            'proc'        : calc.timed_proc_input_co2eq_flows_traj,
+            'black_output': calc.timed_black_output_co2eq_flows_traj,
+            'land'        : calc.land_surface_flows_traj\
+                            *cb.ts.dict_time_serie_as_row_array(
+                                calc.co2eq_computer.co2eq_yields_GWP_traj_computer(
+                                    {'CO2':1., 'N2O':.0, 'CH4':.0}
+                                )
+                            ),
+        }
+
+    def _flows(self, annualization, shifted, calendar):
+        """ Flows of all the components, `shifted` being the function which
+        sets a kernel (indexed by the years elapsed since the land use
+        change) on the cohorts, and `calendar` that which sets a calendar
+        trajectory on them."""
+        calc  = self.calculator
+        flows = dict(
+            (k, shifted(mask)*calendar(k)) for k, mask in self._masks().items()
+        )
+        for k in ('so', 'vg'):
+            flows[k] = shifted(
+                getattr(calc, '%sco2_unit_%s_flows_traj'%(k, annualization))
+            )*calendar('land')
+        flows['proc_plus_cult'] = flows['proc'] + flows['cult']
+        flows['so_plus_vg']     = flows['so'] + flows['vg']
+        flows['total']          = flows['proc_plus_cult'] + flows['so_plus_vg']
+        return flows
+
+    @property
+    def co2_flows_cube(self):
+        """ Aggregated co2 flows of all the cohorts, valued, discounted (to
+        the first year of the portfolio) and cumulated, as a cube of
+        dimensions component x annualization x metric x year (see
+        `tools.NamedCube`). Computed once."""
+        if self._co2_flows_cube is not None:
+            return self._co2_flows_cube
+        calendar = self._calendar_flows()
+        cube = np.empty((
+            len(self.co2_cube_components),
+            len(self.annualizations),
+            len(self.co2_cube_metrics),
+            len(self.years)
+        ))
+        for j, a in enumerate(self.annualizations):
+            flows = self._flows(a, self._convolved, calendar.get)
+            for i, component in enumerate(self.co2_cube_components):
+                values      = flows[component]*self.calendar.co2_prices_traj
+                disc_values = values*self.calendar.discounting_factors
+                cube[i, j] = np.vstack((
+                    flows[component], values, disc_values,
+                    np.cumsum(disc_values, axis=1),
+                ))
+        self._co2_flows_cube = cb.ts.NamedCube(cube, (
+            ('component'    , self.co2_cube_components),
+            ('annualization', self.annualizations),
+            ('metric'       , self.co2_cube_metrics),
+            ('year'         , self.years),
+        ))
+        return self._co2_flows_cube
+
+    def cohorts_NPV(self, annualization='unif', component='total'):
+        """ Final NPVs of the `component` flows of each cohort (in the order
+        of `first_years`), discounted to its own first year, i.e. the
+        NPVs of their own projects, times their sizes. Only prices are
+        re-indexed per cohort, the discounting factors of a project being
+        relative to its first year."""
+        if annualization not in self.annualizations:
+            raise ValueError('Unknown annualization: %s'%annualization)
+        if component not in self.co2_cube_components:
+            raise ValueError('Unknown component: %s'%component)
+        calendar = self._calendar_flows()
+        flows    = self._flows(
+            annualization,
+            lambda kernel: kernel,
+            lambda k: self._windowed(calendar[k])
+        )
+        return self.sizes*np.sum(
+            flows[component]*self._windowed(self.calendar.co2_prices_traj)
+            *self.calculator.discounting_factors, axis=1
+        )
@@ -0,0 +1,371 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'JobScheduler',
+    'job_runner',
+    'main',
+]
+
+import multiprocessing as mp
+import traceback
+import argparse
+import sqlite3
+import json
+import time
+import sys
+
+if __package__:
+    from . import core as cb
+    from . import serve as sv
+else:
+    import core as cb
+    import serve as sv
+
+VERBOSE_DTESTS = False
+
+STATES = ('queued', 'running', 'done', 'failed', 'cancelled')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    key         TEXT    NOT NULL,
+    priority    INTEGER NOT NULL DEFAULT 0,
+    params      TEXT    NOT NULL,
+    outputs     TEXT    NOT NULL,
+    state       TEXT    NOT NULL DEFAULT 'queued',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL DEFAULT 2,
+    timeout     REAL,
+    result      TEXT,
+    error       TEXT,
+    submitted   REAL,
+    started     REAL,
+    finished    REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_state_priority ON jobs (state, priority);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key);
+"""
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+##******************************************
+##     ┬┌─┐┌┐     ┬─┐┬ ┬┌┐┌┌┐┌┌─┐┬─┐
+##     ││ │├┴┐    ├┬┘│ │││││││├┤ ├┬┘
+##    └┘└─┘└─┘────┴└─└─┘┘└┘┘└┘└─┘┴└─
+def job_runner(db_path, job_id, params, outputs, attempts=1, max_retries=0):
+    """ Function run by worker processes. It evaluates the job and stores
+    its outcome in the database. Runs that fail inside `tools.solver_ND`
+    (whose failure mode is mostly an exhausted recursion) are queued again
+    as long as `attempts <= max_retries`, with a recursion limit that is
+    doubled at each attempt. Solver messages are muted, and the recursion
+    limit is raised, for the time of the evaluation only.
+
+    Testing/Example
+    ---------------
+    >>> import tempfile, os
+    >>> s = JobScheduler(os.path.join(tempfile.mkdtemp(), 'jobs.sqlite'))
+    >>> i = s.submit({'GWP_horizon': 20}, ['horizon'], max_retries=1)
+    >>> s._claimer()[0]['id'] == i
+    True
+    >>> job_runner(s.db_path, i, {'GWP_horizon': 20}, ['horizon'])
+    `GWP_horizon` must be set to 100 years when `GWP_static` is `True`.
+    The only reason behind this is that this parameter is implictly assumed
+    to be such in data exposed by attribute `ghgs_emissions_per_tonne_of_eth` of
+    the class named `VegetationsAndSoilSpecificities`.
+    >>> s.status(i), s.jobs()[0]['error']
+    ('failed', "ValueError('`GWP_horizon` must be set to 100 years when `GWP_static` is `True`, and must exceed the project horizon otherwise.')")
+    """
+    verbose, limit = cb.VERBOSE_SOLVER, sys.getrecursionlimit()
+    cb.VERBOSE_SOLVER = False
+    sys.setrecursionlimit(max(limit, 1000*2**attempts))
+    state, result, error = 'done', None, None
+    try:
+        result = json.dumps(
+            sv.CBAService(batch_window=0).evaluate(params, outputs)
+        )
+    except Exception as e:
+        frames = traceback.extract_tb(sys.exc_info()[2])
+        solver = 'solver_ND' in [f[2] for f in frames]
+        state  = 'queued' if solver and attempts <= max_retries else 'failed'
+        error  = '%s%r'%('[solver_ND] ' if solver else '', e)
+    finally:
+        cb.VERBOSE_SOLVER = verbose
+        sys.setrecursionlimit(limit)
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            "UPDATE jobs SET state=?, result=?, error=?, finished=? "
+            "WHERE id=? AND state='running'",
+            (state, result, error, time.time(), job_id)
+        )
+    finally:
+        conn.close()
+
+##******************************************
+##     ╦┌─┐┌┐ ╔═╗┌─┐┬ ┬┌─┐┌┬┐┬ ┬┬  ┌─┐┬─┐
+##     ║│ │├┴┐╚═╗│  ├─┤├┤  │││ ││  ├┤ ├┬┘
+##    ╚╝└─┘└─┘╚═╝└─┘┴ ┴└─┘─┴┘└─┘┴─┘└─┘┴└─
+class JobScheduler(object):
+    """ Local queue of CBA jobs, whose state is kept in the SQLite file
+    `db_path`. Jobs are run by priority (the higher first) in at most
+    `workers` processes, this bound holding for all the schedulers that
+    share the same file (e.g. from several notebooks). Submitting a job that
+    is already queued, running or done returns the existing job.
+
+    Testing/Example
+    ---------------
+    >>> import tempfile, os
+    >>> s = JobScheduler(os.path.join(tempfile.mkdtemp(), 'jobs.sqlite'), workers=1)
+    >>> base = sv.TESTING_PARAMS
+    >>> ids = [
+    ...     s.submit(dict(base, discount_rate=dr), ['unif_payback_period'], priority=p)
+    ...     for dr, p in [(.01, 0), (.02, 5), (.03, 1)]
+    ... ]
+    >>> s.submit(dict(base, discount_rate=.01), ['unif_payback_period']) == ids[0]
+    True
+    >>> s.cancel(ids[2])
+    True
+    >>> s.run()
+    >>> [s.status(i) for i in ids]
+    ['done', 'done', 'cancelled']
+    >>> [j['id'] for j in sorted(s.jobs('done'), key=lambda j: j['started'])] == ids[1::-1]
+    True
+    >>> s.result(ids[0])['outputs']
+    {'unif_payback_period': []}
+
+    Jobs that last longer than their timeout are stopped
+    >>> i = s.submit(
+    ...     dict(base, project_horizon=3000), ['NPV_total_diff_co2_flows_traj'],
+    ...     timeout=1e-3
+    ... )
+    >>> s.run(poll=.01)
+    >>> s.status(i), s.jobs('failed')[0]['error']
+    ('failed', 'timeout (0.001s)')
+    """
+
+    def __init__(self, db_path='pyluccba_jobs.sqlite', workers=None):
+        self.db_path    = db_path
+        self.workers    = workers or mp.cpu_count()
+        self._processes = {}
+        conn = _connect(self.db_path)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _execute(self, query, args=()):
+        conn = _connect(self.db_path)
+        try:
+            cursor = conn.execute(query, args)
+            return cursor.fetchall(), cursor.rowcount, cursor.lastrowid
+        finally:
+            conn.close()
+
+    def submit(self, params, outputs=None, priority=0, timeout=None, max_retries=2):
+        """ Queues the job made of `params` and `outputs` and returns its id.
+        The lookup of an existing job and the insertion of the new one are
+        made in the same (immediate) transaction, so that concurrent
+        submissions of a same job, e.g. from several processes, share it.
+        NB: `timeout` is expressed in seconds.
+
+        Testing/Example
+        ---------------
+        >>> import tempfile, os
+        >>> s = JobScheduler(os.path.join(tempfile.mkdtemp(), 'jobs.sqlite'))
+        >>> requests = [{'discount_rate': dr/100.} for dr in range(30)]
+        >>> pool = mp.Pool(4)
+        >>> ids  = pool.map(s.submit, 4*requests, chunksize=1)
+        >>> pool.close(); pool.join()
+        >>> len(s.jobs()), ids == 4*[s.submit(r) for r in requests]
+        (30, True)
+        """
+        outputs = sv.CBAService.outputs_checker(outputs or sv.DEFAULT_OUTPUTS)
+        key     = sv.request_hasher(params, outputs)
+        conn    = _connect(self.db_path)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE key=? AND state IN "
+                "('queued', 'running', 'done') ORDER BY id LIMIT 1", (key, )
+            ).fetchone()
+            if row:
+                job_id = row['id']
+                conn.execute(
+                    "UPDATE jobs SET priority=MAX(priority, ?) "
+                    "WHERE id=? AND state='queued'", (priority, job_id)
+                )
+            else:
+                job_id = conn.execute(
+                    "INSERT INTO jobs (key, priority, params, outputs, timeout, "
+                    "max_retries, submitted) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, priority, json.dumps(params), json.dumps(outputs),
+                     timeout, max_retries, time.time())
+                ).lastrowid
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return job_id
+
+    def cancel(self, job_id):
+        """ Cancels the job if it is queued or running. Running jobs are
+        stopped by the scheduler that runs them."""
+        return 1 == self._execute(
+            "UPDATE jobs SET state='cancelled', finished=? "
+            "WHERE id=? AND state IN ('queued', 'running')",
+            (time.time(), job_id)
+        )[1]
+
+    def status(self, job_id):
+        """ State of the job, among `STATES`."""
+        rows = self._execute("SELECT state FROM jobs WHERE id=?", (job_id, ))[0]
+        return rows[0]['state'] if rows else None
+
+    def result(self, job_id):
+        """ Result of the job (as returned by `serve.CBAService.evaluate`),
+        or `None` if the job is not done."""
+        rows = self._execute("SELECT result FROM jobs WHERE id=?", (job_id, ))[0]
+        return json.loads(rows[0]['result']) if rows and rows[0]['result'] else None
+
+    def jobs(self, state=None):
+        """ List of jobs (as dicts, without results), possibly of `state`."""
+        rows = self._execute(
+            "SELECT id, priority, state, attempts, error, submitted, started, "
+            "finished FROM jobs%s ORDER BY id"%(' WHERE state=?' if state else ''),
+            (state, ) if state else ()
+        )[0]
+        return [dict(r) for r in rows]
+
+    def recover(self):
+        """ Queues again the jobs left running by schedulers that died. To be
+        called only when no scheduler is running on `db_path`."""
+        return self._execute(
+            "UPDATE jobs SET state='queued' WHERE state='running'"
+        )[1]
+
+    def _claimer(self):
+        """ Atomically marks as running the queued jobs of highest priority,
+        within the limit of `workers` running jobs, and returns them."""
+        conn = _connect(self.db_path)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            running = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state='running'"
+            ).fetchone()[0]
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE state='queued' "
+                "ORDER BY priority DESC, id LIMIT ?",
+                (max(self.workers - running, 0), )
+            ).fetchall()
+            for row in rows:
+                conn.execute(
+                    "UPDATE jobs SET state='running', attempts=attempts+1, "
+                    "started=? WHERE id=?", (time.time(), row['id'])
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return [dict(r, attempts=r['attempts'] + 1) for r in rows]
+
+    def _watcher(self):
+        """ Stops the processes of cancelled and timed out jobs, and reaps
+        the processes that are over."""
+        for job_id, process in list(self._processes.items()):
+            job = self._execute(
+                "SELECT state, started, timeout FROM jobs WHERE id=?", (job_id, )
+            )[0][0]
+            if process.is_alive():
+                if job['state'] == 'cancelled':
+                    process.terminate()
+                elif job['timeout'] and time.time() - job['started'] > job['timeout']:
+                    process.terminate()
+                    self._execute(
+                        "UPDATE jobs SET state='failed', error=?, finished=? "
+                        "WHERE id=? AND state='running'",
+                        ('timeout (%ss)'%job['timeout'], time.time(), job_id)
+                    )
+                else:
+                    continue
+            process.join()
+            self._execute(
+                "UPDATE jobs SET state='failed', error=?, finished=? "
+                "WHERE id=? AND state='running'",
+                ('worker exited with code %s'%process.exitcode, time.time(), job_id)
+            )
+            del self._processes[job_id]
+
+    def run(self, until_empty=True, poll=.05):
+        """ Runs queued jobs until none is left (or forever if `until_empty`
+        is `False`). On interruption, the jobs being run are queued again."""
+        try:
+            while True:
+                self._watcher()
+                for job in self._claimer():
+                    process = mp.Process(target=job_runner, args=(
+                        self.db_path, job['id'], json.loads(job['params']),
+                        json.loads(job['outputs']), job['attempts'],
+                        job['max_retries']
+                    ))
+                    process.daemon = True
+                    process.start()
+                    self._processes[job['id']] = process
+                if until_empty and not self._processes and not self._execute(
+                    "SELECT 1 FROM jobs WHERE state IN ('queued', 'running') LIMIT 1"
+                )[0]:
+                    break
+                time.sleep(poll)
+        finally:
+            for job_id, process in self._processes.items():
+                process.terminate()
+                process.join()
+                self._execute(
+                    "UPDATE jobs SET state='queued' WHERE id=? AND state='running'",
+                    (job_id, )
+                )
+            self._processes.clear()
+
+##******************************************
+##    ┌┬┐┌─┐┬┌┐┌
+##    │││├─┤││││
+##    ┴ ┴┴ ┴┴┘└┘
+def main(argv=None):
+    """ Entry point of `python -m PyLUCCBA.scheduler`, which runs the jobs
+    queued in a database."""
+    parser = argparse.ArgumentParser(
+        prog='python -m PyLUCCBA.scheduler',
+        description='Runs the CBA jobs queued in a SQLite database.'
+    )
+    parser.add_argument('db_path', nargs='?', default='pyluccba_jobs.sqlite')
+    parser.add_argument('-w', '--workers', default=None, type=int,
+        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--forever', action='store_true',
+        help='keep waiting for new jobs once the queue is empty')
+    parser.add_argument('--recover', action='store_true',
+        help='queue again the jobs left running by a dead scheduler')
+    args = parser.parse_args(argv)
+
+    scheduler = JobScheduler(args.db_path, workers=args.workers)
+    if args.recover:
+        print('%s job(s) queued again'%scheduler.recover())
+    try:
+        scheduler.run(until_empty=not args.forever)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
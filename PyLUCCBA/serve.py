@@ -0,0 +1,565 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'CBAService',
+    'evaluable_outputs',
+    'jsoner',
+    'main',
+    'request_hasher',
+    'serve',
+]
+
+import collections
+import threading
+import argparse
+import hashlib
+import copy
+import json
+import time
+import sys
+import numpy as np
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError: ## python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+if __package__:
+    from . import core as cb
+else:
+    import core as cb
+
+VERBOSE_DTESTS = False
+
+DEFAULT_HOST    = '127.0.0.1'
+DEFAULT_PORT    = 8765
+DEFAULT_OUTPUTS = ['diff_payback_period', 'unif_payback_period']
+
+#: Parameters of the (20-year) project evaluated in the doctests of the
+#: service-related modules.
+TESTING_PARAMS  = {
+    'project_horizon': 20, 'project_first_year': 2020, 'T_so': 20,
+    'T_vg_diff': 1, 'T_vg_unif': 20, 'co2_prices_scenario': 'O',
+    'initial_landuse': 'improved grassland', 'final_landuse': 'wheat',
+    'input_flows_scenario': 'IFP', 'output_flows_scenario': 'O',
+    'country': 'france', 'change_rates': {'EUR':{'USD/EUR':1.14}},
+}
+
+##******************************************
+##    ┌─┐┬  ┬┌─┐┬  ┬ ┬┌─┐┌┐ ┬  ┌─┐    ┌─┐┬ ┬┌┬┐┌─┐┬ ┬┌┬┐┌─┐
+##    ├┤ └┐┌┘├─┤│  │ │├─┤├┴┐│  ├┤     │ ││ │ │ ├─┘│ │ │ └─┐
+##    └─┘ └┘ ┴ ┴┴─┘└─┘┴ ┴└─┘┴─┘└─┘────└─┘└─┘ ┴ ┴  └─┘ ┴ └─┘
+evaluable_outputs = cb.CBACalculator.evaluable_outputs()
+
+##******************************************
+##    ┬─┐┌─┐┌─┐ ┬ ┬┌─┐┌─┐┌┬┐   ┬ ┬┌─┐┌─┐┬ ┬┌─┐┬─┐
+##    ├┬┘├┤ │─┼┐│ │├┤ └─┐ │    ├─┤├─┤└─┐├─┤├┤ ├┬┘
+##    ┴└─└─┘└─┘└└─┘└─┘└─┘ ┴────┴ ┴┴ ┴└─┘┴ ┴└─┘┴└─
+def request_hasher(params, outputs=None):
+    """ Returns the hash (sha1) of the request made of `params` and
+    `outputs`, insensitive to the order of both.
+
+    Testing/Example
+    ---------------
+    >>> h = request_hasher({'a': 1, 'b': 2}, ['x', 'y'])
+    >>> h == request_hasher({'b': 2, 'a': 1}, ['y', 'x'])
+    True
+    >>> request_hasher({'a': 1}) == request_hasher({'a': 2})
+    False
+    """
+    outputs = sorted(set(outputs or DEFAULT_OUTPUTS))
+    return hashlib.sha1(json.dumps(
+        [params, outputs], sort_keys=True, default=repr
+    ).encode('utf8')).hexdigest()
+
+##******************************************
+##     ┬┌─┐┌─┐┌┐┌┌─┐┬─┐
+##     │└─┐│ ││││├┤ ├┬┘
+##    └┘└─┘└─┘┘└┘└─┘┴└─
+def jsoner(value):
+    """ Returns a JSON-serializable version of `value`.
+
+    Testing/Example
+    ---------------
+    >>> jsoner(np.ones((1, 2)))
+    [[1.0, 1.0]]
+    >>> jsoner(np.int64(45))
+    45
+    >>> jsoner({'a': (np.float32(.5), [])})
+    {'a': [0.5, []]}
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {k:jsoner(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsoner(v) for v in value]
+    return value
+
+##******************************************
+##    ╔═╗╔╗ ╔═╗╔═╗┌─┐┬─┐┬  ┬┬┌─┐┌─┐
+##    ║  ╠╩╗╠═╣╚═╗├┤ ├┬┘└┐┌┘││  ├┤
+##    ╚═╝╚═╝╩ ╩╚═╝└─┘┴└─ └┘ ┴└─┘└─┘
+class CBAService(object):
+    """ Evaluation engine of the HTTP service. Sub-computers (i.e. parsed
+    resources, GWP tables, annualization kernels, etc.) are kept warm
+    across evaluations and shared between `CBACalculator` instances whose
+    parameters they depend on are the same.
+
+    Testing/Example
+    ---------------
+    >>> s = CBAService()
+    >>> params = dict(TESTING_PARAMS, discount_rate=.03)
+    >>> r = s.evaluate(params, ['unif_payback_period'])
+    >>> sorted(r.keys())
+    ['outputs', 'run_name']
+    >>> r['outputs']
+    {'unif_payback_period': []}
+
+    Sub-computers are shared across requests
+    >>> params['discount_rate'] = .05
+    >>> p = s.instance(**params)
+    >>> p.co2eq_computer is s.instance(**params).co2eq_computer
+    True
+    >>> len(s.warm_keys)
+    6
+
+    Illegal outputs are refused
+    >>> s.evaluate(params, ['chart_of_co2_prices_traj'])
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown or non-evaluable output(s): chart_of_co2_prices_traj
+
+    Repeated requests are served from the LRU cache of responses
+    >>> _ = s.evaluate(params, ['unif_payback_period'])
+    >>> _ = s.evaluate(params, ['unif_payback_period'])
+    >>> s.stats['evaluations'], s.stats['cache_hits']
+    (2, 1)
+
+    In-flight identical requests are coalesced, and near-simultaneous
+    requests are queued as a single batch
+    >>> s = CBAService(batch_window=.2)
+    >>> threads = [
+    ...     threading.Thread(
+    ...         target = s.evaluate,
+    ...         args   = (dict(params, discount_rate=dr), ['unif_payback_period'])
+    ...     )
+    ...     for dr in [.01, .01, .01, .02, .03]
+    ... ]
+    >>> for t in threads: t.start()
+    >>> for t in threads: t.join()
+    >>> s.stats['evaluations'], s.stats['coalesced'], s.stats['batches']
+    (3, 2, 1)
+
+    Requests of a batch which only differ by their landuses (and input flows
+    scenarios) and only ask for payback periods are evaluated at once,
+    through `CBACalculator.landuse_transitions_cube`, with the responses
+    that they would get one by one
+    >>> s = CBAService(batch_window=.2)
+    >>> transitions = [
+    ...     ('improved grassland', 'wheat'), ('forestland30', 'wheat'),
+    ...     ('improved grassland', 'miscanthus'),
+    ... ]
+    >>> requests = [
+    ...     dict(params, initial_landuse=i, final_landuse=f, input_flows_scenario='IFP')
+    ...     for i, f in transitions
+    ... ]
+    >>> responses = [None]*len(requests)
+    >>> def requester(i):
+    ...     responses[i] = s.evaluate(requests[i], ['unif_payback_period'])
+    >>> threads = [
+    ...     threading.Thread(target=requester, args=(i, ))
+    ...     for i in range(len(requests))
+    ... ]
+    >>> for t in threads: t.start()
+    >>> for t in threads: t.join()
+    >>> s.stats['evaluations'], s.stats['vectorized'], s.stats['batches']
+    (3, 3, 1)
+    >>> responses == [
+    ...     CBAService(batch_window=0).evaluate(r, ['unif_payback_period'])
+    ...     for r in requests
+    ... ]
+    True
+    """
+
+    _forced_params = {'save_charts': False, 'return_charts': False}
+
+    #: Parameters by which the requests evaluated at once may differ.
+    transitions_params  = ('initial_landuse', 'final_landuse', 'input_flows_scenario')
+    #: Outputs which can be evaluated at once, i.e. read from the transitions cube.
+    transitions_outputs = ('diff_payback_period', 'unif_payback_period')
+
+    def __init__(self, max_warm=256, max_responses=1024, batch_window=.005):
+        self._warm         = collections.OrderedDict()
+        self._responses    = collections.OrderedDict()
+        self._inflights    = {}
+        self._queue        = []
+        self.max_warm      = max_warm
+        self.max_responses = max_responses
+        self.batch_window  = batch_window
+        self.lock          = threading.RLock() ## guards `_warm` only
+        self._meta_lock    = threading.Lock()
+        self.stats         = collections.Counter()
+
+    @property
+    def warm_keys(self):
+        """ Signatures of the sub-computers currently kept warm."""
+        with self.lock:
+            return list(self._warm)
+
+    @staticmethod
+    def params_checker(params):
+        """ Returns a copy of `params` in which JSON-unfriendly values are
+        converted, e.g. the name of `dtype`.
+
+        Testing/Example
+        ---------------
+        >>> CBAService.params_checker({'dtype': 'float32'})
+        {'dtype': <class 'numpy.float32'>}
+        """
+        params = dict(params)
+        if params.get('dtype') is not None:
+            params['dtype'] = np.dtype(params['dtype']).type
+        return params
+
+    @staticmethod
+    def outputs_checker(outputs):
+        """ Ensures that all `outputs` can be evaluated."""
+        unknowns = [o for o in outputs if o not in evaluable_outputs]
+        if unknowns:
+            raise ValueError(
+                'Unknown or non-evaluable output(s): %s'%', '.join(unknowns)
+            )
+        return list(outputs)
+
+    def instance(self, **params):
+        """ Returns a `CBACalculator` instance fed with the warm
+        sub-computers that it can share."""
+        params.update(self._forced_params)
+        cba = cb.CBACalculator(**self.params_checker(params))
+        if not hasattr(cba, 'dashboard'):
+            raise ValueError(
+                '`GWP_horizon` must be set to 100 years when `GWP_static` is '
+                '`True`, and must exceed the project horizon otherwise.'
+            )
+        with self.lock:
+            for key in cba._caobjs_dependencies:
+                obj = self._warm.get(cba._caobjs_signature(key))
+                if obj is not None:
+                    cba._cache[key] = obj
+        return cba
+
+    def warmer(self, cba):
+        """ Keeps the sub-computers of `cba` warm for later use."""
+        with self.lock:
+            for key in cba._caobjs_dependencies:
+                if key not in cba._cache:
+                    continue
+                sign = cba._caobjs_signature(key)
+                self._warm[sign] = cba._cache[key]
+                while len(self._warm) > self.max_warm:
+                    self._warm.popitem(last=False)
+
+    def etag(self, params, outputs=None):
+        """ Entity tag of the response to the request made of `params` and
+        `outputs`, i.e. a hash of the (run-naming) parameters and outputs.
+        Since evaluations are deterministic, equal tags imply equal responses.
+
+        Testing/Example
+        ---------------
+        >>> s = CBAService()
+        >>> s.etag({'discount_rate': .03}) == s.etag({'discount_rate': .03})
+        True
+        >>> s.etag({'discount_rate': .03}) == s.etag({'discount_rate': .05})
+        False
+        >>> s.etag({}) == s.etag({}, DEFAULT_OUTPUTS[::-1])
+        True
+        """
+        return '"%s"'%request_hasher(
+            dict(params, **self._forced_params), outputs
+        )
+
+    def _evaluator(self, params, outputs):
+        """ Returns the JSON-serializable `outputs` of the `CBACalculator`
+        instance defined by `params`."""
+        cba    = self.instance(**params)
+        values = {o:getattr(cba, o) for o in outputs}
+        self.warmer(cba)
+        with self._meta_lock:
+            self.stats['evaluations'] += 1
+        return {
+            'run_name': cba.run_name,
+            'outputs' : jsoner(values),
+        }
+
+    def _transitions_key(self, params, outputs):
+        """ Key shared by the requests which can be evaluated at once with
+        that made of `params` and `outputs`, None if it cannot be."""
+        if not set(outputs) <= set(self.transitions_outputs):
+            return None
+        return json.dumps([
+            dict((k, v) for k, v in params.items() if k not in self.transitions_params),
+            sorted(outputs)
+        ], sort_keys=True, default=repr)
+
+    def _transitions_evaluator(self, batch):
+        """ Returns the responses to the requests of `batch`, which only
+        differ by their landuses and input flows scenarios, evaluated at once
+        through the `landuse_transitions_cube` of the first of them. Payback
+        periods are read from the cube, as `[]` if none (as done by
+        `CBACalculator`)."""
+        finals = collections.OrderedDict()
+        for _, params, _, _ in batch:
+            final    = str(params.get('final_landuse')).upper()
+            scenario = str(params.get('input_flows_scenario')).upper()
+            if finals.setdefault(final, scenario) != scenario:
+                raise ValueError('Conflicting input flows scenarios: %s'%final)
+        instances = [self.instance(**params) for _, params, _, _ in batch]
+        leader    = instances[0]
+        outputs   = batch[0][2]
+        cube      = leader.landuse_transitions_cube(
+            initial_landuses      = sorted(set(
+                cba.initial_landuse for cba in instances
+            )),
+            final_landuses        = list(finals),
+            input_flows_scenarios = finals,
+            annualizations        = tuple(o.split('_')[0] for o in outputs),
+        )
+        self.warmer(leader)
+        responses = []
+        for cba in instances:
+            values = {}
+            for o in outputs:
+                v = cube.sel(
+                    output          = o,
+                    initial_landuse = cba.initial_landuse,
+                    final_landuse   = cba.final_landuse,
+                )
+                values[o] = [] if np.isnan(v) else int(v)
+            responses.append({
+                'run_name': cba.run_name,
+                'outputs' : jsoner(values),
+            })
+        with self._meta_lock:
+            self.stats['evaluations'] += len(batch)
+            self.stats['vectorized']  += len(batch)
+        return responses
+
+    def _batch_runner(self):
+        """ Waits for `batch_window` seconds, then evaluates all the requests
+        queued meanwhile. Those which can be (see `_transitions_key`) are
+        evaluated at once, the others one by one, ordered such that those
+        which share sub-computers are evaluated consecutively. Only the
+        access to warm sub-computers is serialized, such that distinct
+        batches are evaluated concurrently."""
+        time.sleep(self.batch_window)
+        with self._meta_lock:
+            batch, self._queue = self._queue, []
+            self.stats['batches'] += 1
+        batch.sort(key=lambda b: json.dumps(
+            dict(b[1], discount_rate=None), sort_keys=True, default=repr
+        ))
+        groups = collections.OrderedDict()
+        for item in batch:
+            key = self._transitions_key(item[1], item[2])
+            groups.setdefault(item[0] if key is None else key, []).append(item)
+        for group in groups.values():
+            responses = None
+            if len(group) > 1:
+                try:
+                    responses = self._transitions_evaluator(group)
+                except Exception:
+                    responses = None ## falls back on one by one evaluations
+            for i, (key, params, outputs, inflight) in enumerate(group):
+                if responses is not None:
+                    inflight['response'] = responses[i]
+                else:
+                    try:
+                        inflight['response'] = self._evaluator(params, outputs)
+                    except Exception as e:
+                        inflight['error'] = e
+                with self._meta_lock:
+                    if 'response' in inflight:
+                        self._responses[key] = inflight['response']
+                        while len(self._responses) > self.max_responses:
+                            self._responses.popitem(last=False)
+                    self._inflights.pop(key, None)
+                inflight['event'].set()
+
+    def evaluate(self, params, outputs=None):
+        """ Returns the JSON-serializable `outputs` of the `CBACalculator`
+        instance defined by `params`. Responses are cached (LRU), identical
+        in-flight requests are coalesced, and requests received within
+        `batch_window` seconds are queued as a single batch (see
+        `_batch_runner`)."""
+        outputs = self.outputs_checker(outputs or DEFAULT_OUTPUTS)
+        key     = self.etag(params, outputs)
+        leader  = False
+        with self._meta_lock:
+            if key in self._responses:
+                self.stats['cache_hits'] += 1
+                self._responses[key] = self._responses.pop(key)
+                return copy.deepcopy(self._responses[key])
+            inflight = self._inflights.get(key)
+            if inflight is None:
+                inflight = self._inflights[key] = {'event': threading.Event()}
+                leader   = not self._queue
+                self._queue.append((key, params, outputs, inflight))
+            else:
+                self.stats['coalesced'] += 1
+        if leader:
+            self._batch_runner()
+        inflight['event'].wait()
+        if 'error' in inflight:
+            raise inflight['error']
+        return copy.deepcopy(inflight['response'])
+
+##******************************************
+##    ┌─┐┌─┐┬─┐┬  ┬┌─┐
+##    └─┐├┤ ├┬┘└┐┌┘├┤
+##    └─┘└─┘┴└─ └┘ └─┘
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """ Routes
+        GET  /health   -> {"status": "ok", "warm": <nb of warm sub-computers>}
+        GET  /outputs  -> list of evaluable outputs
+        POST /evaluate -> {"run_name": ..., "outputs": {...}}
+                          from {"params": {...}, "outputs": [...]}
+    Responses to POST /evaluate carry an ETag header. A request whose
+    If-None-Match header matches it is answered with 304 (Not Modified).
+    """
+    service = None
+    quiet   = True
+
+    def _json_responder(self, code, content, etag=None):
+        body = json.dumps(content).encode('utf8') if code != 304 else b''
+        self.send_response(code)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            return self._json_responder(
+                200, {'status': 'ok', 'warm': len(self.service.warm_keys)}
+            )
+        if self.path == '/outputs':
+            return self._json_responder(200, evaluable_outputs)
+        return self._json_responder(404, {'error': 'Unknown path %s'%self.path})
+
+    def do_POST(self):
+        if self.path != '/evaluate':
+            return self._json_responder(404, {'error': 'Unknown path %s'%self.path})
+        try:
+            length  = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf8') or '{}')
+            params  = request.get('params', {})
+            outputs = request.get('outputs')
+            etag    = self.service.etag(params, outputs)
+            if self.headers.get('If-None-Match') == etag:
+                return self._json_responder(304, None, etag)
+            content = self.service.evaluate(params, outputs)
+        except (ValueError, TypeError, KeyError) as e:
+            return self._json_responder(400, {'error': str(e)})
+        except Exception as e:
+            return self._json_responder(500, {'error': repr(e)})
+        return self._json_responder(200, content, etag)
+
+    def log_message(self, *args):
+        if not self.quiet:
+            BaseHTTPRequestHandler.log_message(self, *args)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None, quiet=True):
+    """ Returns a (not yet started) HTTP server exposing `service`.
+
+    Testing/Example
+    ---------------
+    >>> try:
+    ...     from urllib.request import urlopen, Request
+    ... except ImportError:
+    ...     from urllib2 import urlopen, Request
+    >>> server = serve(port=0)
+    >>> t = threading.Thread(target=server.serve_forever)
+    >>> t.start()
+    >>> url = 'http://%s:%s'%server.server_address
+    >>> json.loads(urlopen(url + '/health').read().decode('utf8'))
+    {'status': 'ok', 'warm': 0}
+    >>> body = json.dumps({
+    ...     'params' : dict(TESTING_PARAMS, project_horizon=3),
+    ...     'outputs': ['NPV_total_unif_co2_flows_traj'],
+    ... }).encode('utf8')
+    >>> r = urlopen(url + '/evaluate', body)
+    >>> json.loads(r.read().decode('utf8'))['outputs']
+    {'NPV_total_unif_co2_flows_traj': [[-168.95047115305744, -415.2944023061149, -661.6383334591724, -817.4683346122298]]}
+
+    Clients holding the entity tag of a response can revalidate it
+    >>> etag = r.headers['ETag']
+    >>> try:
+    ...     urlopen(Request(url + '/evaluate', body, {'If-None-Match': etag}))
+    ... except Exception as e:
+    ...     print(e.code)
+    304
+    >>> server.shutdown(); server.server_close()
+    """
+    handler = type('RequestHandler', (_RequestHandler, ), {
+        'service': service or CBAService(),
+        'quiet'  : quiet,
+    })
+    return _ThreadingHTTPServer((host, port), handler)
+
+def main(argv=None):
+    """ Entry point of `python -m PyLUCCBA.serve`."""
+    parser = argparse.ArgumentParser(
+        prog='python -m PyLUCCBA.serve',
+        description='Local HTTP/JSON service evaluating CBACalculator instances.'
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', default=DEFAULT_PORT, type=int)
+    parser.add_argument('--max-warm', default=256, type=int,
+        help='maximum number of sub-computers kept warm')
+    parser.add_argument('--max-responses', default=1024, type=int,
+        help='maximum number of responses kept in the LRU cache')
+    parser.add_argument('--batch-window', default=.005, type=float,
+        help='seconds during which requests are gathered into a batch')
+    parser.add_argument('--verbose', action='store_true',
+        help='log requests and solver messages')
+    args = parser.parse_args(argv)
+
+    cb.VERBOSE_SOLVER = args.verbose
+    server = serve(
+        host    = args.host,
+        port    = args.port,
+        service = CBAService(
+            max_warm      = args.max_warm,
+            max_responses = args.max_responses,
+            batch_window  = args.batch_window,
+        ),
+        quiet   = not args.verbose,
+    )
+    print('Serving CBACalculator on http://%s:%s'%server.server_address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,377 @@
+# -*- coding: utf8 -*-
+from __future__ import print_function, absolute_import
+
+__authors__ = [
+    "Marion Dupoux <marion.dupoux@gu.se>",
+    "Laurent Faucheux <laurent.faucheux@hotmail.fr>"
+]
+
+__all__ = [
+    'IncompleteSweepError',
+    'ShardedSweep',
+    'grid',
+    'main',
+]
+
+import itertools as it
+import threading
+import argparse
+import socket
+import json
+import time
+import uuid
+import sys
+import os
+
+if __package__:
+    from . import core as cb
+    from . import serve as sv
+else:
+    import core as cb
+    import serve as sv
+
+VERBOSE_DTESTS = False
+
+##******************************************
+##    ╦┌┐┌┌─┐┌─┐┌┬┐┌─┐┬  ┌─┐┌┬┐┌─┐╔═╗┬ ┬┌─┐┌─┐┌─┐╔═╗┬─┐┬─┐┌─┐┬─┐
+##    ║││││  │ ││││├─┘│  ├┤  │ ├┤ ╚═╗│││├┤ ├┤ ├─┘║╣ ├┬┘├┬┘│ │├┬┘
+##    ╩┘└┘└─┘└─┘┴ ┴┴  ┴─┘└─┘ ┴ └─┘╚═╝└┴┘└─┘└─┘┴  ╚═╝┴└─┴└─└─┘┴└─
+class IncompleteSweepError(Exception):
+    """ Raised when merging a sweep some shards of which are not done."""
+
+##******************************************
+##    ┌─┐┬─┐┬┌┬┐
+##    │ ┬├┬┘│ ││
+##    └─┘┴└─┴─┴┘
+def grid(base=None, **axes):
+    """ Returns the list of the dicts of parameters that result from the
+    cartesian product of `axes`, each completed with `base`. The order of
+    the grid only depends on the names and values of the axes.
+
+    Testing/Example
+    ---------------
+    >>> for p in grid({'T_so': 20}, discount_rate=[.01, .03], final_landuse=['wheat', 'miscanthus']):
+    ...     print(sorted(p.items()))
+    [('T_so', 20), ('discount_rate', 0.01), ('final_landuse', 'wheat')]
+    [('T_so', 20), ('discount_rate', 0.01), ('final_landuse', 'miscanthus')]
+    [('T_so', 20), ('discount_rate', 0.03), ('final_landuse', 'wheat')]
+    [('T_so', 20), ('discount_rate', 0.03), ('final_landuse', 'miscanthus')]
+    """
+    names = sorted(axes)
+    return [
+        dict(base or {}, **dict(zip(names, values)))
+        for values in it.product(*[axes[n] for n in names])
+    ]
+
+##******************************************
+##    ╔═╗┬ ┬┌─┐┬─┐┌┬┐┌─┐┌┬┐╔═╗┬ ┬┌─┐┌─┐┌─┐
+##    ╚═╗├─┤├─┤├┬┘ ││├┤  ││╚═╗│││├┤ ├┤ ├─┘
+##    ╚═╝┴ ┴┴ ┴┴└──┴┘└─┘─┴┘╚═╝└┴┘└─┘└─┘┴
+class ShardedSweep(object):
+    """ Sweep over a grid of parameters, split into shards that several
+    machines sharing `directory` (e.g. a network filesystem) can claim and
+    run, with no other coordination than atomic file creations:
+        manifest.json           the grid, outputs and shard size
+        shard-<i>.lock          created (O_EXCL) by the node which claims shard i
+        shard-<i>.lock.<token>  created (O_EXCL) by the node which takes over the
+                                stale lock of token <token>
+        shard-<i>.ndjson        records of shard i, renamed in place once complete
+        results.ndjson          all records, in grid order, written by `merge`
+    Locks hold a token unique to their claim, and are touched every
+    `heartbeat` seconds (`stale_after/10` by default) while their shard runs.
+    Locks older than `stale_after` seconds whose shard has no output are
+    considered left by a dead node, and can be claimed again, by one node
+    only.
+
+    Testing/Example
+    ---------------
+    >>> import tempfile
+    >>> d = tempfile.mkdtemp()
+    >>> base = sv.TESTING_PARAMS
+    >>> s = ShardedSweep.create(
+    ...     d, grid(base, discount_rate=[.0, .01, .02, .03, .04]),
+    ...     outputs=['unif_payback_period'], shard_size=2
+    ... )
+    >>> s.nb_shards
+    3
+
+    Two nodes work concurrently, the first one stopping after one shard
+    >>> node_a, node_b = ShardedSweep(d), ShardedSweep(d)
+    >>> node_a.work(max_shards=1), node_b.work()
+    ([0], [1, 2])
+    >>> node_a.claim(1)
+    False
+    >>> s.status()
+    {'done': 3, 'running': 0, 'todo': 0}
+    >>> records = s.merge()
+    >>> [r['index'] for r in records]
+    [0, 1, 2, 3, 4]
+    >>> records[3]['params']['discount_rate'], records[3]['outputs']
+    (0.03, {'unif_payback_period': []})
+    >>> os.path.exists(os.path.join(d, 'results.ndjson'))
+    True
+
+    A stale lock is taken over by a single node
+    >>> d = tempfile.mkdtemp()
+    >>> s = ShardedSweep.create(
+    ...     d, grid(base, discount_rate=[.0]), outputs=['unif_payback_period'],
+    ...     stale_after=60.
+    ... )
+    >>> s.claim(0)
+    True
+    >>> then = time.time() - 120.
+    >>> os.utime(os.path.join(d, 'shard-00000.lock'), (then, then))
+    >>> node_a, node_b = ShardedSweep(d, stale_after=60.), ShardedSweep(d, stale_after=60.)
+    >>> node_a.claim(0), node_b.claim(0)
+    (True, False)
+    >>> s.merge() # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    IncompleteSweepError: shard(s) not done yet: [0]
+    """
+
+    manifest_name = 'manifest.json'
+    results_name  = 'results.ndjson'
+
+    def __init__(self, directory, stale_after=24*3600., service=None,
+                 heartbeat=None):
+        self.directory   = directory
+        self.stale_after = stale_after
+        self.heartbeat   = heartbeat or stale_after/10.
+        self.service     = service
+        with open(self._path(self.manifest_name)) as f:
+            manifest = json.load(f)
+        self.params     = manifest['params']
+        self.outputs    = manifest['outputs']
+        self.shard_size = manifest['shard_size']
+        self.nb_shards  = -(-len(self.params)//self.shard_size)
+
+    @classmethod
+    def create(cls, directory, params, outputs=None, shard_size=10, **kwargs):
+        """ Writes the manifest of the sweep over `params` in `directory` and
+        returns the sweep. If a manifest already exists (e.g. written by
+        another node), it is kept as is, and the sweep it defines is returned."""
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                pass
+        outputs  = sv.CBAService.outputs_checker(outputs or sv.DEFAULT_OUTPUTS)
+        tmp_path = os.path.join(directory, '.manifest-%s-%s'%(
+            socket.gethostname(), os.getpid()
+        ))
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'params'    : list(params),
+                'outputs'   : outputs,
+                'shard_size': shard_size,
+            }, f)
+        try:
+            os.link(tmp_path, os.path.join(directory, cls.manifest_name))
+        except OSError:
+            pass
+        finally:
+            os.remove(tmp_path)
+        return cls(directory, **kwargs)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _shard_name(self, i, ext):
+        return 'shard-%05d.%s'%(i, ext)
+
+    @staticmethod
+    def _lock_reader(lock):
+        """ Returns the token and the age (in seconds) of `lock`, both read
+        from the same file, or `(None, None)` if it cannot be read."""
+        try:
+            with open(lock) as f:
+                age   = time.time() - os.fstat(f.fileno()).st_mtime
+                token = json.loads(f.read() or '{}').get('token')
+        except (IOError, OSError, ValueError):
+            return None, None
+        return token, age
+
+    def claim(self, i):
+        """ Atomically claims the shard `i`. Returns `False` if the shard is
+        done or claimed by another node (unless its lock is stale).
+
+        A stale lock is taken over by the node which first creates (O_EXCL)
+        the marker named after its token. The new lock then replaces it
+        atomically, and the claim only holds if the lock still carries the
+        token of the claim afterwards."""
+        if os.path.exists(self._path(self._shard_name(i, 'ndjson'))):
+            return False
+        lock    = self._path(self._shard_name(i, 'lock'))
+        token   = uuid.uuid4().hex
+        content = json.dumps({
+            'host' : socket.gethostname(),
+            'pid'  : os.getpid(),
+            'time' : time.time(),
+            'token': token,
+        }).encode('utf8')
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            stale_token, age = self._lock_reader(lock)
+            if age is None or age <= self.stale_after:
+                return False
+            try:
+                os.close(os.open(
+                    '%s.%s'%(lock, stale_token),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                ))
+            except OSError:
+                return False
+            tmp_path = self._path('.%s-%s'%(self._shard_name(i, 'lock'), token))
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.rename(tmp_path, lock)
+            return self._lock_reader(lock)[0] == token
+        os.write(fd, content)
+        os.close(fd)
+        return True
+
+    def _toucher(self, i, stopped):
+        """ Touches the lock of the shard `i` every `heartbeat` seconds until
+        `stopped` (an event) is set, so that it does not become stale."""
+        lock = self._path(self._shard_name(i, 'lock'))
+        while not stopped.wait(self.heartbeat):
+            try:
+                os.utime(lock, None)
+            except OSError:
+                pass
+
+    def run_shard(self, i):
+        """ Evaluates the shard `i` and writes its records. The output file
+        only appears once complete (it is renamed in place). The lock of the
+        shard is touched meanwhile (see `heartbeat`)."""
+        self.service = self.service or sv.CBAService(batch_window=0)
+        start    = i*self.shard_size
+        tmp_path = self._path('.%s-%s-%s'%(
+            self._shard_name(i, 'ndjson'), socket.gethostname(), os.getpid()
+        ))
+        stopped = threading.Event()
+        toucher = threading.Thread(target=self._toucher, args=(i, stopped))
+        toucher.daemon = True
+        toucher.start()
+        try:
+            with open(tmp_path, 'w') as f:
+                for index, params in enumerate(
+                    self.params[start:start + self.shard_size], start
+                ):
+                    record = {'index': index, 'params': params}
+                    try:
+                        record.update(self.service.evaluate(params, self.outputs))
+                    except Exception as e:
+                        record['error'] = repr(e)
+                    f.write(json.dumps(record) + '\n')
+            os.rename(tmp_path, self._path(self._shard_name(i, 'ndjson')))
+        finally:
+            stopped.set()
+            toucher.join()
+
+    def work(self, max_shards=None):
+        """ Claims and runs shards until none is left (or `max_shards` are
+        run), and returns the indexes of the shards run."""
+        done = []
+        for i in range(self.nb_shards):
+            if max_shards is not None and len(done) >= max_shards:
+                break
+            if self.claim(i):
+                self.run_shard(i)
+                done.append(i)
+        return done
+
+    def status(self):
+        """ Numbers of shards done, running (claimed) and left to do."""
+        done    = sum(
+            os.path.exists(self._path(self._shard_name(i, 'ndjson')))
+            for i in range(self.nb_shards)
+        )
+        running = sum(
+            os.path.exists(self._path(self._shard_name(i, 'lock')))
+            and not os.path.exists(self._path(self._shard_name(i, 'ndjson')))
+            for i in range(self.nb_shards)
+        )
+        return {
+            'done'   : done,
+            'running': running,
+            'todo'   : self.nb_shards - done - running,
+        }
+
+    def merge(self):
+        """ Merges the outputs of all shards into `results.ndjson` (in grid
+        order) and returns the records. Raises if some shards are not done."""
+        missing = [
+            i for i in range(self.nb_shards)
+            if not os.path.exists(self._path(self._shard_name(i, 'ndjson')))
+        ]
+        if missing:
+            raise IncompleteSweepError('shard(s) not done yet: %s'%missing)
+        records = []
+        for i in range(self.nb_shards):
+            with open(self._path(self._shard_name(i, 'ndjson'))) as f:
+                records.extend(json.loads(l) for l in f if l.strip())
+        tmp_path = self._path('.%s-%s-%s'%(
+            self.results_name, socket.gethostname(), os.getpid()
+        ))
+        with open(tmp_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        os.rename(tmp_path, self._path(self.results_name))
+        return records
+
+##******************************************
+##    ┌┬┐┌─┐┬┌┐┌
+##    │││├─┤││││
+##    ┴ ┴┴ ┴┴┘└┘
+def main(argv=None):
+    """ Entry point of `python -m PyLUCCBA.sweep`.
+        init  DIR SPEC.json  writes the manifest of the sweep defined in SPEC.json,
+                             i.e. {"base": {...}, "axes": {...}, "outputs": [...],
+                             "shard_size": n}
+        work  DIR            claims and runs shards (to be launched on each node)
+        status DIR           prints the numbers of shards done/running/todo
+        merge DIR            merges the shards' outputs into DIR/results.ndjson
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m PyLUCCBA.sweep',
+        description='Sweeps over grids of parameters, sharded over the nodes '
+                    'sharing a directory.'
+    )
+    parser.add_argument('command', choices=['init', 'work', 'status', 'merge'])
+    parser.add_argument('directory')
+    parser.add_argument('spec', nargs='?', help='JSON file (init only)')
+    parser.add_argument('--stale-after', default=24*3600., type=float,
+        help='seconds after which a lock without output is considered stale')
+    parser.add_argument('--verbose', action='store_true',
+        help='print solver messages')
+    args = parser.parse_args(argv)
+
+    cb.VERBOSE_SOLVER = args.verbose
+    if args.command == 'init':
+        if not args.spec:
+            parser.error('init requires a SPEC.json file')
+        with open(args.spec) as f:
+            spec = json.load(f)
+        sweep = ShardedSweep.create(
+            args.directory,
+            grid(spec.get('base', {}), **spec.get('axes', {})),
+            outputs     = spec.get('outputs'),
+            shard_size  = spec.get('shard_size', 10),
+            stale_after = args.stale_after,
+        )
+        print('%s run(s) in %s shard(s)'%(len(sweep.params), sweep.nb_shards))
+        return 0
+    sweep = ShardedSweep(args.directory, stale_after=args.stale_after)
+    if args.command == 'work':
+        print('shard(s) run: %s'%sweep.work())
+    elif args.command == 'status':
+        print(json.dumps(sweep.status()))
+    elif args.command == 'merge':
+        print('%s record(s) merged'%len(sweep.merge()))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,11 +10,14 @@ __all__ = [
     'Dashboard',
     'DataReader',
     'InMindWithCorrespondingUnit',
+    'NamedCube',
+    'YearSerie',
     'cast',
     'change_rate_extractor',
     'csv_dicter',
     'dict_time_serie_as_row_array',
     'get_file_as_list_of_lines',
+    'matrix_poler',
     'plt',
     'poler',
     'redim_row_array',
@@ -29,7 +32,10 @@ __all__ = [
 from matplotlib.font_manager import FontProperties
 from scipy.optimize import fsolve
 import matplotlib.pyplot as plt
+import collections as cl
 import functools as ft
+import threading as th
+import copy as cp
 import openpyxl as xl
 import shutil as sh
 import numpy as np
@@ -40,6 +46,7 @@ import re
 VERBOSE_DTESTS = False
 OS_SEP = os.sep
 __name__eq__main__ = __name__ == '__main__'
+_missing = object() ## sentinel of the cache lookups
 
 ##******************************************
 ##    ┌─┐┌─┐┌─┐┌┬┐
@@ -524,16 +531,422 @@ def poler(sparse_trajectory_as_dict, repeated_pattern_polation, **kwargs):
     return polated_values if len(polated_values)\
            else {year : 1 for year in year_polate}
 
+##******************************************
+##    ┌┬┐┌─┐┌┬┐┬─┐┬─┐ ┬    ┌─┐┌─┐┬  ┌─┐┬─┐
+##    │││├─┤ │ ├┬┘│┌┴┬┘    ├─┘│ ││  ├┤ ├┬┘
+##    ┴ ┴┴ ┴ ┴ ┴└─┴┴ └─────┴  └─┘┴─┘└─┘┴└─
+def matrix_poler(sparse_trajectories_as_dict, scenarios,
+                 repeated_pattern_polation, **kwargs):
+    """ Function which does what `poler` does, for all the `scenarios` of
+    `sparse_trajectories_as_dict` (i.e. `{year: {scenario: value}}`) at
+    once. Returns the (scenario x year) array of the polated values of the
+    years `y0+1`, ..., `yT-1`, rows being ordered as `scenarios`.
+
+    Example
+    -------
+    >>> sptrajs = {
+    ...     2010: {'a': 1  , 'b': '' },
+    ...     2012: {'a': 1.2, 'b': 2. },
+    ...     2014: {'a': 1.1, 'b': '' },
+    ... }
+    >>> m = matrix_poler(
+    ...     sparse_trajectories_as_dict = sptrajs,
+    ...     scenarios                   = ['a', 'b'],
+    ...     repeated_pattern_polation   = True,
+    ...     y0 = 2008, yT = 2016
+    ... )
+    >>> m
+    array([[0.91287093, 1.        , 1.09544512, 1.2       , 1.14891253,
+            1.1       , 1.20498963],
+           [2.        , 2.        , 2.        , 2.        , 2.        ,
+            2.        , 2.        ]])
+
+    Each row is what `poler` returns for the corresponding scenario (up to
+    rounding errors)
+    >>> a = poler(
+    ...     {y: d['a'] for y, d in sptrajs.items()}, True, y0=2008, yT=2016
+    ... )
+    >>> bool(np.allclose([a[y] for y in range(2009, 2016)], m[0]))
+    True
+    """
+    year_base0, final_year = kwargs.get('y0', 1950), kwargs.get('yT', 2400)
+    #------------------< sparse (scenario x year) matrix, nan if missing >
+    sparse = np.array([
+        [
+            float(v) if v else np.nan for v in [
+                (sparse_trajectories_as_dict.get(y) or {}).get(s)
+                for y in range(year_base0, final_year)
+            ]
+        ] for s in scenarios
+    ]).reshape((len(scenarios), final_year - year_base0))
+    known      = ~np.isnan(sparse)
+    nb_s, nb_y = sparse.shape
+    rows, pos  = np.arange(nb_s)[:, None], np.arange(nb_y)[None, :]
+    nxt_known  = np.minimum.accumulate(
+        np.where(known, pos, nb_y)[:, ::-1], axis=1
+    )[:, ::-1]
+    prv_known  = np.maximum.accumulate(np.where(known, pos, -1), axis=1)
+    nb_known   = known.sum(axis=1)[:, None]
+    k0         = nxt_known[:, :1]
+    k1         = np.where(
+        nb_known > 1, nxt_known[rows, np.minimum(k0 + 1, nb_y - 1)], k0
+    )
+    kT         = prv_known[:, -1:]
+    #------------------< left values: exponential variations >
+    left       = (nb_known > 1) & (pos <= kT)
+    ref        = np.where(nxt_known <= k0, k1, nxt_known)
+    ref        = np.where(left, ref, k0 + (nb_known > 1))
+    low        = prv_known[rows, np.maximum(ref - 1, 0)]
+    ref_values = sparse[rows, np.minimum(ref, nb_y - 1)]
+    with np.errstate(all='ignore'):
+        var    = 1. + (-1. + np.power(
+            1.*ref_values/sparse[rows, np.maximum(low, 0)],
+            1./(ref - low)
+        ))
+        polated = 1/np.power(var, (ref - pos).astype(float))*ref_values
+    #------------------< right values: (repeated) constant variations >
+    v      = sparse[rows[:, 0], np.maximum(kT[:, 0], 0)]
+    K_bnds = .75*v, 1.5*v
+    ## NB: as in `poler`, when the last known year is `yT-1`, right values
+    ## overwrite the last left ones, i.e. start after the last but one known
+    ## year (or after `y0` if it is the first one).
+    kT_1   = prv_known[rows[:, 0], np.maximum(kT[:, 0] - 1, 0)]
+    kT_1   = np.where(kT_1 == k0[:, 0], 0, kT_1)
+    start  = np.where(
+        nb_known[:, 0] > 1,
+        np.where(kT[:, 0] == nb_y - 1, kT_1, kT[:, 0]),
+        0
+    )
+    L      = np.maximum(kT[:, 0], 1)
+    for p in range(1, nb_y):
+        right = (nb_known[:, 0] > 0) & (p > start)
+        if repeated_pattern_polation:
+            v = np.where(right & (nb_known[:, 0] > 1), np.maximum(
+                K_bnds[0],
+                np.minimum(K_bnds[1], v*var[rows[:, 0], 1 + (p - start - 1)%L])
+            ), v)
+        polated[:, p] = np.where(right, v, polated[:, p])
+    polated[nb_known[:, 0] == 0] = 1.
+    return polated[:, 1:]
+
+##******************************************
+##    ╦ ╦┌─┐┌─┐┬─┐╔═╗┌─┐┬─┐┬┌─┐
+##    ╚╦╝├┤ ├─┤├┬┘╚═╗├┤ ├┬┘│├┤
+##     ╩ └─┘┴ ┴┴└─╚═╝└─┘┴└─┴└─┘
+class YearSerie(object):
+    """ Row-array of yearly values, indexed by the years `first_year`, ...,
+    `last_year`. Since years and positions only differ by `first_year`,
+    windows are views of `row`, shifts and paddings are done in place, and
+    series are aligned on their years when combined (with zeros for the
+    missing years of sums and differences, and on their common years for
+    products and ratios). Combined with scalars or arrays, `row` is used
+    as is.
+
+    Testing/Example
+    ---------------
+    >>> s = YearSerie.from_dict({2022: 3., 2020: 1., 2021: 2., 2030: 9.}, 2020, 2022)
+    >>> s
+    YearSerie(2020, array([[1., 2., 3.]]))
+    >>> s[2021], s.years
+    (2.0, array([2020, 2021, 2022]))
+
+    >>> w = s.window(2021, 2030)
+    >>> w, np.shares_memory(w.row, s.row)
+    (YearSerie(2021, array([[2., 3.]])), True)
+
+    >>> t = YearSerie(2021, [10., 10., 10.])
+    >>> s + t
+    YearSerie(2020, array([[ 1., 12., 13., 10.]]))
+    >>> s*t
+    YearSerie(2021, array([[20., 30.]]))
+    >>> 2*s - 1
+    YearSerie(2020, array([[1., 3., 5.]]))
+
+    >>> s.shift(2).pad(2026)
+    YearSerie(2022, array([[1., 2., 3., 0., 0.]]))
+    >>> s.reindexed(2020, 2023)
+    YearSerie(2020, array([[0., 0., 1., 2.]]))
+    >>> s.as_dict()[2024]
+    3.0
+    >>> s[2019]
+    Traceback (most recent call last):
+    ...
+    KeyError: 2019
+    """
+
+    def __init__(self, first_year, values):
+        self.first_year = int(first_year)
+        self.row        = np.asarray(values).reshape((1, -1))
+
+    @classmethod
+    def from_dict(cls, time_serie, first_year, last_year):
+        """ Serie of the values of `time_serie` (a dict) from `first_year`
+        to `last_year`. Unlike `dict_time_serie_as_row_array`, keys are not
+        sorted, only the wanted years are looked up."""
+        return cls(first_year, np.array([
+            time_serie[y] for y in range(int(first_year), int(last_year) + 1)
+        ]))
+
+    def __repr__(self):
+        return 'YearSerie(%s, %r)'%(self.first_year, self.row)
+
+    def __len__(self):
+        return self.row.shape[1]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.row if dtype is None else self.row.astype(dtype)
+
+    @property
+    def last_year(self):
+        return self.first_year + len(self) - 1
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.last_year + 1)
+
+    def __getitem__(self, year):
+        if not self.first_year <= year <= self.last_year:
+            raise KeyError(year)
+        return self.row[0, year - self.first_year]
+
+    def as_dict(self):
+        return dict(zip(self.years.tolist(), self.row[0].tolist()))
+
+    def window(self, first_year=None, last_year=None):
+        """ View of the values from `first_year` to `last_year`, both being
+        clipped to the years of the serie."""
+        y0 = self.first_year if first_year is None\
+             else max(self.first_year, int(first_year))
+        yT = self.last_year if last_year is None\
+             else min(self.last_year, int(last_year))
+        return YearSerie(
+            y0, self.row[:, y0 - self.first_year:max(yT - self.first_year + 1, 0)]
+        )
+
+    def reindexed(self, first_year, last_year):
+        """ Serie of the values from `first_year` to `last_year`, with zeros
+        for the years out of the serie. Only a view when no year is out of
+        the serie."""
+        first_year, last_year = int(first_year), int(last_year)
+        if self.first_year <= first_year and last_year <= self.last_year:
+            return self.window(first_year, last_year)
+        values = np.zeros((1, max(last_year - first_year + 1, 0)), self.row.dtype)
+        y0, yT = max(self.first_year, first_year), min(self.last_year, last_year)
+        if y0 <= yT:
+            values[:, y0 - first_year:yT - first_year + 1]\
+            = self.row[:, y0 - self.first_year:yT - self.first_year + 1]
+        return YearSerie(first_year, values)
+
+    def shift(self, years):
+        """ Shifts in place the serie by `years` years."""
+        self.first_year += int(years)
+        return self
+
+    def pad(self, last_year):
+        """ Pads in place the serie with zeros (or truncates it) up to
+        `last_year`."""
+        self.row = self.reindexed(self.first_year, last_year).row
+        return self
+
+    def _aligned(self, other, union):
+        if not isinstance(other, YearSerie):
+            return self.first_year, self.row, other
+        if union:
+            y0 = min(self.first_year, other.first_year)
+            yT = max(self.last_year, other.last_year)
+        else:
+            y0 = max(self.first_year, other.first_year)
+            yT = min(self.last_year, other.last_year)
+        return y0, self.reindexed(y0, yT).row, other.reindexed(y0, yT).row
+
+    def __add__(self, other):
+        y0, a, b = self._aligned(other, True)
+        return YearSerie(y0, a + b)
+
+    def __sub__(self, other):
+        y0, a, b = self._aligned(other, True)
+        return YearSerie(y0, a - b)
+
+    def __mul__(self, other):
+        y0, a, b = self._aligned(other, False)
+        return YearSerie(y0, a*b)
+
+    def __truediv__(self, other):
+        y0, a, b = self._aligned(other, False)
+        return YearSerie(y0, a/b)
+
+    def __pow__(self, other):
+        return YearSerie(self.first_year, pow(self.row, other))
+
+    def __neg__(self):
+        return YearSerie(self.first_year, -self.row)
+
+    def __rsub__(self, other):
+        return YearSerie(self.first_year, other - self.row)
+
+    def __rtruediv__(self, other):
+        return YearSerie(self.first_year, other/self.row)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+    __div__  = __truediv__
+    __rdiv__ = __rtruediv__
+
+##******************************************
+##    ╔╗╔┌─┐┌┬┐┌─┐┌┬┐╔═╗┬ ┬┌┐ ┌─┐
+##    ║║║├─┤│││├┤  ││║  │ │├┴┐├┤
+##    ╝╚╝┴ ┴┴ ┴└─┘─┴┘╚═╝└─┘└─┘└─┘
+class NamedCube(object):
+    """ Array whose axes are named and labelled, so that it can be sliced
+    by labels rather than by positions. `axes` is a sequence of
+    `(name, labels)` tuples, one per dimension of `values`.
+
+    Testing/Example
+    ---------------
+    >>> c = NamedCube(
+    ...     np.arange(12.).reshape((2, 3, 2)),
+    ...     [('component', ['so', 'vg']), ('metric', ['a', 'b', 'c']), ('year', [2020, 2021])]
+    ... )
+    >>> c.shape, c.names
+    ((2, 3, 2), ('component', 'metric', 'year'))
+    >>> c.sel(component='vg', metric='b')
+    array([8., 9.])
+    >>> c.sel(component='vg', metric='b').base is not None ## a view
+    True
+    >>> c.sel(metric=['c', 'a'], year=2021)
+    array([[ 5.,  1.],
+           [11.,  7.]])
+    >>> c.sel(scenario='O')
+    Traceback (most recent call last):
+    ...
+    KeyError: 'Unknown axis(es): scenario'
+    """
+
+    def __init__(self, values, axes):
+        self.values = values
+        self.axes   = tuple((name, tuple(labels)) for name, labels in axes)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def names(self):
+        return tuple(name for name, _ in self.axes)
+
+    def labels(self, name):
+        """ Labels of the axis `name`."""
+        return dict(self.axes)[name]
+
+    def sel(self, **labels):
+        """ Returns the sub-array defined by `labels`, i.e. by a label (the
+        axis is dropped) or a list of labels (the axis is kept) per axis.
+        Selecting single labels only returns a view."""
+        unknowns = sorted(set(labels) - set(self.names))
+        if unknowns:
+            raise KeyError('Unknown axis(es): %s'%', '.join(unknowns))
+        values, index = self.values, []
+        for i, (name, axis_labels) in enumerate(self.axes):
+            label = labels.get(name, slice(None))
+            if isinstance(label, (list, tuple)):
+                values = np.take(
+                    values, [axis_labels.index(l) for l in label], axis=i
+                )
+                label = slice(None)
+            elif not isinstance(label, slice):
+                label = axis_labels.index(label)
+            index.append(label)
+        return values[tuple(index)]
+
 ##******************************************
 ##    ╔═╗┌─┐┌─┐┬ ┬┌─┐
 ##    ║  ├─┤│  ├─┤├┤ 
 ##    ╚═╝┴ ┴└─┘┴ ┴└─┘
 class Cache(object):
 
+    #: Maximum number of values kept by the class-level cache of each class
+    #: (see `_shared_property`).
+    _shared_cache_size = 256
+    _shared_lock       = th.Lock()
+
     def __init__(self, *args, **kwargs):
         """ Homemade cache class which aims at being inherited """
-        self._cache  = {}
-        self.verbose = kwargs.get('verbose', False)
+        self._cache      = {}
+        self._shared_key = None
+        self.verbose     = kwargs.get('verbose', False)
+        self.dtype       = kwargs.get('dtype', None)
+
+    def _sharer(self, *args, **kwargs):
+        """ Sets the key under which the values of the properties decorated
+        with `_shared_property` are shared between all the instances of the
+        class built with the same (constructor) arguments `args` and `kwargs`.
+        Only `verbose` is ignored.
+
+        Testing/Example
+        ---------------
+        >>> o = Cache()
+        >>> o._sharer(2020, 20, scenario='O', verbose=True)
+        >>> o._shared_key
+        "((2020, 20), [('scenario', 'O')])"
+        """
+        kwargs.pop('verbose', None)
+        if kwargs.get('from_local_data'):
+            kwargs['local_folder'] = os.getcwd()
+        self._shared_key = repr((args, sorted(kwargs.items())))
+
+    @classmethod
+    def _shared_cache(cls):
+        """ Class-level LRU cache of the class (not inherited)."""
+        if '_shared_values' not in cls.__dict__:
+            cls._shared_values = cl.OrderedDict()
+        return cls._shared_values
+
+    @classmethod
+    def _shared_getter(cls, key, default=None):
+        """ Returns the value kept under `key` in the class-level LRU cache
+        (marking it as the most recently used), or `default` if none.
+
+        Testing/Example
+        ---------------
+        >>> class_ = type('class_', (Cache, ), {})
+        >>> class_._shared_setter(('key', ), 'value')
+        'value'
+        >>> class_._shared_getter(('key', )), class_._shared_getter(('yek', ))
+        ('value', None)
+        """
+        _cache = cls._shared_cache()
+        with cls._shared_lock:
+            if key not in _cache:
+                return default
+            value = _cache[key] = _cache.pop(key)
+        return value
+
+    @classmethod
+    def _shared_setter(cls, key, value):
+        """ Keeps `value` under `key` in the class-level LRU cache, whose
+        least recently used values are dropped beyond `_shared_cache_size`,
+        and returns it."""
+        _cache = cls._shared_cache()
+        with cls._shared_lock:
+            _cache[key] = value
+            while len(_cache) > cls._shared_cache_size:
+                _cache.popitem(last=False)
+        return value
+
+    @classmethod
+    def _clear_shared_cache(cls):
+        """
+        Testing
+        -------
+        >>> Cache._shared_cache()['key'] = 'value'
+        >>> Cache._clear_shared_cache()
+        (1, 0)
+        """
+        with cls._shared_lock:
+            _cache = cls._shared_cache()
+            l0 = len(_cache)
+            _cache.clear()
+        return (l0, len(_cache))
 
     def _clear_cache(self):
         """
@@ -623,6 +1036,31 @@ class Cache(object):
             else:                
                 print('value :', value)
 
+    def _dtyper(self, value):
+        """ Casts `value` to `self.dtype` if `value` is a (row-)array of
+        floats and if `self.dtype` is set. Other values are returned as is.
+        NB: it is by means of this method that trajectories can be stored
+        and computed in float32 (e.g. `dtype=np.float32`), so as to halve
+        the memory footprint of large batches of runs.
+
+        Testing/Example
+        ---------------
+        >>> o = Cache(dtype=np.float32)
+        >>> o._dtyper(np.ones((1, 3))).dtype
+        dtype('float32')
+        >>> o._dtyper(np.ones(1)).dtype
+        dtype('float64')
+        >>> o._dtyper(np.arange(3)[None, :]).dtype == np.arange(3).dtype
+        True
+        >>> Cache()._dtyper(np.ones((1, 3))).dtype
+        dtype('float64')
+        """
+        if self.dtype is None or not isinstance(value, np.ndarray):
+            return value
+        if value.ndim == 2 and np.issubdtype(value.dtype, np.floating):
+            return value.astype(self.dtype, copy=False)
+        return value
+
     @classmethod
     def _property(cls, meth):
         """ Memoizes outcomes of the so-decorated attribute. The name of the
@@ -650,11 +1088,66 @@ class Cache(object):
         def __property(cls, *args, **kwargs):
             meth_name = meth.__name__
             if meth_name not in cls._cache:
-                cls._cache[meth_name] = meth(cls, *args, **kwargs)
+                cls._cache[meth_name] = cls._dtyper(
+                    meth(cls, *args, **kwargs)
+                )
                 cls.verboser(cls._cache, meth_name)
             return cls._cache[meth_name]
         return __property
 
+    @classmethod
+    def _shared_property(cls, meth):
+        """ Like `_property`, with values also kept in the bounded LRU cache
+        of the class, under the key set by `_sharer`. Instances built with the
+        same arguments thus compute them once. Values are copied when read
+        from (and written to) the class-level cache, so that no instance can
+        alter the values of another one.
+
+        Testing/Example
+        ---------------
+        >>> calls = []
+        >>> class_ = type(
+        ...     'class_',
+        ...     (Cache, ),
+        ...     {
+        ...         'attr'  : Cache._shared_property(
+        ...             meth = lambda cls: calls.append(1) or np.zeros((1, 3)),
+        ...         )
+        ...     },
+        ... )
+        >>> o1, o2, o3 = class_(), class_(), class_()
+        >>> o1._sharer(2020, scenario='O')
+        >>> o2._sharer(2020, scenario='O', verbose=True)
+        >>> o3._sharer(2021, scenario='O')
+        >>> o1.attr[0, 0] = 1.
+        >>> o2.attr, o1.attr is o2.attr
+        (array([[0., 0., 0.]]), False)
+        >>> o3.attr, len(calls)
+        (array([[0., 0., 0.]]), 2)
+        """
+        @property
+        @ft.wraps(meth)
+        def __property(self, *args, **kwargs):
+            meth_name = meth.__name__
+            if meth_name not in self._cache:
+                if self._shared_key is None:
+                    self._cache[meth_name] = self._dtyper(
+                        meth(self, *args, **kwargs)
+                    )
+                    self.verboser(self._cache, meth_name)
+                    return self._cache[meth_name]
+                key   = (self._shared_key, meth_name)
+                value = self._shared_getter(key, _missing)
+                if value is _missing:
+                    value = self._dtyper(meth(self, *args, **kwargs))
+                    self._shared_setter(key, cp.deepcopy(value))
+                else:
+                    value = cp.deepcopy(value)
+                self._cache[meth_name] = value
+                self.verboser(self._cache, meth_name)
+            return self._cache[meth_name]
+        return __property
+
 ##******************************************
 ##    ╦┌┐┌╔╦╗┬┌┐┌┌┬┐╦ ╦┬┌┬┐┬ ┬╔═╗┌─┐┬─┐┬─┐┌─┐┌─┐┌─┐┌─┐┌┐┌┌┬┐┬┌┐┌┌─┐╦ ╦┌┐┌┬┌┬┐
 ##    ║│││║║║││││ ││║║║│ │ ├─┤║  │ │├┬┘├┬┘├┤ └─┐├─┘│ ││││ │││││││ ┬║ ║││││ │ 
@@ -50,4 +50,9 @@ setup(
         'environmental economics'
     ],
     install_requires = requires,
+    entry_points     = {
+        'console_scripts': [
+            'pyluccba = %s.cli:main'%package_name,
+        ]
+    },
 )